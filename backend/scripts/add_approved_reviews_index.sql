@@ -0,0 +1,34 @@
+-- Partial covering index over approved reviews per professor
+-- Professor rating aggregates and the professor detail page only read approved
+-- reviews (WHERE professor_id = ? AND status = 'approved') and only their
+-- rating columns. Indexing just the approved rows, with the ratings INCLUDEd,
+-- keeps the index small and lets those reads be index-only scans; pending and
+-- rejected reviews never enter it.
+--
+-- Run after convert_review_status_to_enum.sql; the predicate is stored as a
+-- text comparison otherwise, and the enum conversion would fail to rebuild it.
+-- Safe to run more than once.
+
+-- ============================================================================
+-- REVIEWS: approved reviews by professor, with ratings
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_reviews_professor_approved
+    ON reviews(professor_id)
+    INCLUDE (
+        overall_rating,
+        difficulty_rating,
+        clarity_rating,
+        helpfulness_rating,
+        would_take_again,
+        attendance_required
+    )
+    WHERE status = 'approved';
+
+ANALYZE reviews;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'reviews'
+ORDER BY indexname;
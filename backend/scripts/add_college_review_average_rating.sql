@@ -0,0 +1,29 @@
+-- Store each college review's average aspect rating
+-- average_rating is a generated column, so Postgres computes it on every
+-- insert/update (including writes made through Supabase) and backfills
+-- existing rows when the column is added. Lists can then sort and filter by it
+-- without recomputing the mean per row. Safe to run more than once.
+
+ALTER TABLE college_reviews
+    ADD COLUMN IF NOT EXISTS average_rating NUMERIC(2,1)
+    GENERATED ALWAYS AS (
+        ROUND(
+            (food_rating + internet_rating + clubs_rating
+             + opportunities_rating + facilities_rating + teaching_rating)::numeric / 6,
+            1
+        )
+    ) STORED;
+
+-- Backs "top rated reviews for a college" listings
+CREATE INDEX IF NOT EXISTS idx_college_reviews_college_average_rating
+    ON college_reviews(college_id, average_rating DESC);
+
+-- Verify
+SELECT
+    id,
+    food_rating, internet_rating, clubs_rating,
+    opportunities_rating, facilities_rating, teaching_rating,
+    average_rating
+FROM college_reviews
+ORDER BY created_at DESC
+LIMIT 10;
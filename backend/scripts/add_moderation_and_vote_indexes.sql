@@ -0,0 +1,48 @@
+-- Add composite indexes for hot moderation and voting queries
+-- Run in the Supabase SQL editor. All statements are idempotent.
+
+-- ============================================================================
+-- VOTES: lookup by (review_id, user_id)
+-- ============================================================================
+
+-- The UNIQUE(review_id, user_id) constraints created with the vote tables already
+-- provide these indexes; create them explicitly for databases where the tables
+-- were created without the constraint so the lookup (and ON CONFLICT upserts)
+-- stay index-backed.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_review_votes_review_user
+    ON review_votes(review_id, user_id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_college_review_votes_review_user
+    ON college_review_votes(college_review_id, user_id);
+
+-- ============================================================================
+-- COLLEGE REVIEW FLAGS: admin queue filtered by status, newest first
+-- ============================================================================
+
+-- Backs get_flagged_college_reviews: WHERE status = ? ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_college_review_flags_status_created_at
+    ON college_review_flags(status, created_at DESC);
+
+-- Backs the unfiltered queue and the duplicate-flag check per reporter
+CREATE INDEX IF NOT EXISTS idx_college_review_flags_created_at
+    ON college_review_flags(created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_college_review_flags_review_reporter
+    ON college_review_flags(college_review_id, reporter_id);
+
+-- ============================================================================
+-- COLLEGE REVIEWS: flagged review count for moderation stats
+-- ============================================================================
+
+-- Only flagged rows are indexed, so the index stays tiny
+CREATE INDEX IF NOT EXISTS idx_college_reviews_is_flagged
+    ON college_reviews(is_flagged) WHERE is_flagged = TRUE;
+
+-- Verify indexes
+SELECT
+    tablename,
+    indexname,
+    indexdef
+FROM pg_indexes
+WHERE tablename IN ('review_votes', 'college_review_votes', 'college_review_flags', 'college_reviews')
+ORDER BY tablename, indexname;
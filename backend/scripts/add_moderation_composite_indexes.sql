@@ -0,0 +1,56 @@
+-- Composite indexes matching the moderation dashboard query shapes
+-- Each index covers a filter plus its ORDER BY, so paginated admin lists read
+-- rows in order from one B-tree instead of combining single-column indexes
+-- and sorting. Run in the Supabase SQL editor. All statements are idempotent.
+-- (college_review_flags(status, created_at DESC) is created by
+-- add_moderation_and_vote_indexes.sql.)
+
+-- ============================================================================
+-- COLLEGE REVIEWS
+-- ============================================================================
+
+-- WHERE college_id = ? AND status = ? ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_college_reviews_college_status_created_at
+    ON college_reviews(college_id, status, created_at DESC);
+
+-- WHERE status = ? ORDER BY created_at DESC (pending queue)
+CREATE INDEX IF NOT EXISTS idx_college_reviews_status_created_at
+    ON college_reviews(status, created_at DESC);
+
+-- ============================================================================
+-- COLLEGE REVIEW FLAGS
+-- ============================================================================
+
+-- WHERE college_review_id = ? AND status = ?
+CREATE INDEX IF NOT EXISTS idx_college_review_flags_review_status
+    ON college_review_flags(college_review_id, status);
+
+-- ============================================================================
+-- MODERATION LOGS
+-- ============================================================================
+
+-- History of a single target: WHERE target_type = ? AND target_id = ?
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_target
+    ON moderation_logs(target_type, target_id);
+
+-- Actions by a moderator: WHERE moderator_id = ? ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_moderator_created_at
+    ON moderation_logs(moderator_id, created_at DESC);
+
+-- ============================================================================
+-- Drop single-column indexes now covered by a composite index's leading column
+-- ============================================================================
+
+DROP INDEX IF EXISTS idx_college_reviews_college_id;
+DROP INDEX IF EXISTS idx_college_reviews_status;
+DROP INDEX IF EXISTS idx_college_review_flags_status;
+DROP INDEX IF EXISTS idx_college_review_flags_college_review_id;
+
+-- Verify indexes
+SELECT
+    tablename,
+    indexname,
+    indexdef
+FROM pg_indexes
+WHERE tablename IN ('college_reviews', 'college_review_flags', 'moderation_logs')
+ORDER BY tablename, indexname;
@@ -0,0 +1,28 @@
+-- Partial index over pending review flags
+-- The moderation queue only reads flags WHERE status = 'pending', ordered by
+-- created_at. Pending is a short-lived state, so a full index on status is
+-- mostly reviewed and dismissed rows. Indexing just the pending flags keeps
+-- the index small enough to stay cached, and it replaces the status index.
+--
+-- Run after convert_review_flag_columns_to_enum.sql; the predicate is stored
+-- as a text comparison otherwise, and the enum conversion would fail to
+-- rebuild it.
+-- Safe to run more than once.
+
+-- ============================================================================
+-- REVIEW_FLAGS: pending queue by submission time
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_review_flags_pending
+    ON review_flags(created_at)
+    WHERE status = 'pending';
+
+DROP INDEX IF EXISTS idx_review_flags_status;
+
+ANALYZE review_flags;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'review_flags'
+ORDER BY indexname;
@@ -0,0 +1,26 @@
+-- Composite covering index for professor listings by college and department
+-- The similar-professors lookup filters on college_id and department and
+-- orders by average_rating DESC (a backward scan of this index), reading only
+-- id, name, department, average_rating, total_reviews and subjects. With those
+-- INCLUDEd it is an index-only scan. The index also serves every
+-- college_id-only filter, so idx_professors_college_id becomes redundant.
+-- Run in the Supabase SQL editor. All statements are idempotent.
+
+-- ============================================================================
+-- PROFESSORS: by college and department, ordered by rating
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_professors_college_department_rating
+    ON professors(college_id, department, average_rating)
+    INCLUDE (id, name, total_reviews, subjects);
+
+-- Covered by the leading column of the index above
+DROP INDEX IF EXISTS idx_professors_college_id;
+
+ANALYZE professors;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'professors'
+ORDER BY indexname;
@@ -0,0 +1,121 @@
+-- Store college review / flag status and flag type as PostgreSQL ENUMs
+-- Enum values take 4 bytes instead of a variable-length string, so the status
+-- indexes (idx_college_reviews_status_created_at, idx_college_review_flags_*)
+-- get smaller and more rows fit per page. The enum also replaces the CHECK
+-- constraints on these columns.
+--
+-- RLS policies that reference status are dropped and recreated around the type
+-- change, as Postgres cannot alter a column used in a policy. The
+-- college_rating_stats materialized view depends on college_reviews.status too;
+-- re-run create_college_rating_stats_view.sql after this script.
+-- Safe to run more than once.
+
+BEGIN;
+
+-- ============================================================================
+-- 1. Enum types
+-- ============================================================================
+
+DO $$
+BEGIN
+    CREATE TYPE college_review_status AS ENUM ('pending', 'approved', 'rejected', 'flagged');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$
+BEGIN
+    CREATE TYPE college_review_flag_status AS ENUM ('pending', 'reviewed', 'dismissed');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$
+BEGIN
+    CREATE TYPE college_review_flag_type AS ENUM (
+        'spam', 'inappropriate', 'fake', 'offensive',
+        'harassment', 'irrelevant', 'duplicate', 'other'
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- ============================================================================
+-- 2. Set aside objects that depend on the column types
+-- ============================================================================
+
+DROP MATERIALIZED VIEW IF EXISTS college_rating_stats;
+
+CREATE TEMP TABLE status_policies ON COMMIT DROP AS
+SELECT tablename, policyname, permissive, roles, cmd, qual, with_check
+FROM pg_policies
+WHERE schemaname = 'public'
+  AND tablename IN ('college_reviews', 'college_review_flags')
+  AND (qual LIKE '%status%' OR with_check LIKE '%status%');
+
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    FOR p IN SELECT * FROM status_policies LOOP
+        EXECUTE format('DROP POLICY %I ON %I', p.policyname, p.tablename);
+    END LOOP;
+END $$;
+
+-- ============================================================================
+-- 3. Convert the columns
+-- ============================================================================
+
+-- Same cleanup as setup_college_review_moderation.sql, so the cast cannot fail
+UPDATE college_reviews
+SET status = 'approved'
+WHERE status IS NULL OR status::text = '';
+
+ALTER TABLE college_reviews DROP CONSTRAINT IF EXISTS college_reviews_status_check;
+ALTER TABLE college_reviews ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE college_reviews
+    ALTER COLUMN status TYPE college_review_status USING status::text::college_review_status;
+ALTER TABLE college_reviews ALTER COLUMN status SET DEFAULT 'pending';
+
+ALTER TABLE college_review_flags DROP CONSTRAINT IF EXISTS college_review_flags_status_check;
+ALTER TABLE college_review_flags ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE college_review_flags
+    ALTER COLUMN status TYPE college_review_flag_status USING status::text::college_review_flag_status;
+ALTER TABLE college_review_flags ALTER COLUMN status SET DEFAULT 'pending';
+
+ALTER TABLE college_review_flags
+    ALTER COLUMN flag_type TYPE college_review_flag_type USING flag_type::text::college_review_flag_type;
+
+-- ============================================================================
+-- 4. Recreate the policies
+-- ============================================================================
+
+-- Stored policy expressions cast literals to text (status = 'approved'::text);
+-- drop the casts so the literals resolve to the new enum types.
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    FOR p IN SELECT * FROM status_policies LOOP
+        EXECUTE format(
+            'CREATE POLICY %I ON %I AS %s FOR %s TO %s%s%s',
+            p.policyname,
+            p.tablename,
+            p.permissive,
+            p.cmd,
+            array_to_string(p.roles, ', '),
+            COALESCE(' USING (' || replace(p.qual, '''::text', '''') || ')', ''),
+            COALESCE(' WITH CHECK (' || replace(p.with_check, '''::text', '''') || ')', '')
+        );
+    END LOOP;
+END $$;
+
+COMMIT;
+
+-- Verify
+SELECT
+    table_name,
+    column_name,
+    udt_name,
+    column_default
+FROM information_schema.columns
+WHERE (table_name = 'college_reviews' AND column_name = 'status')
+   OR (table_name = 'college_review_flags' AND column_name IN ('status', 'flag_type'))
+ORDER BY table_name, column_name;
@@ -0,0 +1,31 @@
+-- Store moderation_logs.extra_data as JSONB with a GIN index
+-- JSON columns are re-parsed on every read and cannot be indexed, so filtering
+-- logs by a key inside extra_data scanned the whole table. JSONB is stored
+-- pre-parsed and the jsonb_path_ops GIN index backs containment filters such
+-- as extra_data @> '{"category": "spam"}'. Safe to run more than once.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'moderation_logs'
+          AND column_name = 'extra_data'
+          AND data_type = 'json'
+    ) THEN
+        ALTER TABLE moderation_logs
+            ALTER COLUMN extra_data TYPE JSONB USING extra_data::jsonb;
+        RAISE NOTICE 'Converted moderation_logs.extra_data to JSONB';
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_extra_data
+    ON moderation_logs USING GIN (extra_data jsonb_path_ops);
+
+-- Verify
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'moderation_logs' AND column_name = 'extra_data';
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'moderation_logs' AND indexname = 'idx_moderation_logs_extra_data';
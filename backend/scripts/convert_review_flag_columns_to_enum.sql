@@ -0,0 +1,119 @@
+-- Store professor review flag status and flag type as PostgreSQL ENUMs
+-- Same change as convert_college_review_status_to_enum.sql, for review_flags:
+-- enum values take 4 bytes instead of a variable-length string, so the flag
+-- status and type indexes behind the moderation queue get smaller, and the
+-- enums replace the CHECK constraints. The API keeps reading and writing the
+-- same strings.
+--
+-- Older databases may already store status as the flag_status enum from
+-- add_voting_and_moderation_tables.sql; it is cast through text like a
+-- VARCHAR column. flag_type is only converted where the column exists
+-- (older schemas call it flag_reason and are left unchanged).
+--
+-- RLS policies that reference status are dropped and recreated around the type
+-- change, as Postgres cannot alter a column used in a policy.
+-- Safe to run more than once.
+
+BEGIN;
+
+-- ============================================================================
+-- 1. Enum types
+-- ============================================================================
+
+DO $$
+BEGIN
+    CREATE TYPE review_flag_status AS ENUM ('pending', 'reviewed', 'dismissed', 'action_taken');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$
+BEGIN
+    CREATE TYPE review_flag_type AS ENUM (
+        'spam', 'inappropriate', 'fake', 'offensive',
+        'harassment', 'misinformation', 'duplicate', 'other'
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- ============================================================================
+-- 2. Set aside policies that depend on the column types
+-- ============================================================================
+
+CREATE TEMP TABLE review_flag_policies ON COMMIT DROP AS
+SELECT tablename, policyname, permissive, roles, cmd, qual, with_check
+FROM pg_policies
+WHERE schemaname = 'public'
+  AND tablename = 'review_flags'
+  AND (qual LIKE '%status%' OR with_check LIKE '%status%'
+       OR qual LIKE '%flag_type%' OR with_check LIKE '%flag_type%');
+
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    FOR p IN SELECT * FROM review_flag_policies LOOP
+        EXECUTE format('DROP POLICY %I ON %I', p.policyname, p.tablename);
+    END LOOP;
+END $$;
+
+-- ============================================================================
+-- 3. Convert the columns
+-- ============================================================================
+
+UPDATE review_flags
+SET status = 'pending'
+WHERE status IS NULL OR status::text = '';
+
+ALTER TABLE review_flags DROP CONSTRAINT IF EXISTS review_flags_status_check;
+ALTER TABLE review_flags ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE review_flags
+    ALTER COLUMN status TYPE review_flag_status USING status::text::review_flag_status;
+ALTER TABLE review_flags ALTER COLUMN status SET DEFAULT 'pending';
+ALTER TABLE review_flags ALTER COLUMN status SET NOT NULL;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'review_flags' AND column_name = 'flag_type'
+    ) THEN
+        ALTER TABLE review_flags DROP CONSTRAINT IF EXISTS review_flags_flag_type_check;
+        ALTER TABLE review_flags
+            ALTER COLUMN flag_type TYPE review_flag_type USING flag_type::text::review_flag_type;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- 4. Recreate the policies
+-- ============================================================================
+
+-- Stored policy expressions cast literals to text (status = 'pending'::text);
+-- drop the casts so the literals resolve to the new enum types.
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    FOR p IN SELECT * FROM review_flag_policies LOOP
+        EXECUTE format(
+            'CREATE POLICY %I ON %I AS %s FOR %s TO %s%s%s',
+            p.policyname,
+            p.tablename,
+            p.permissive,
+            p.cmd,
+            array_to_string(p.roles, ', '),
+            COALESCE(' USING (' || replace(p.qual, '''::text', '''') || ')', ''),
+            COALESCE(' WITH CHECK (' || replace(p.with_check, '''::text', '''') || ')', '')
+        );
+    END LOOP;
+END $$;
+
+COMMIT;
+
+-- Verify
+SELECT
+    column_name,
+    udt_name,
+    column_default,
+    is_nullable
+FROM information_schema.columns
+WHERE table_name = 'review_flags' AND column_name IN ('status', 'flag_type');
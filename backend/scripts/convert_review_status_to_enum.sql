@@ -0,0 +1,95 @@
+-- Store professor review status as a PostgreSQL ENUM
+-- Same change as convert_college_review_status_to_enum.sql, for reviews: enum
+-- values take 4 bytes instead of a variable-length string, so idx_reviews_status
+-- and the approved-review lookups behind professor ratings get smaller indexes,
+-- and the enum replaces the CHECK constraint. The API keeps reading and writing
+-- the same status strings.
+--
+-- RLS policies that reference status are dropped and recreated around the type
+-- change, as Postgres cannot alter a column used in a policy. The ratings
+-- trigger from maintain_professor_ratings.sql keeps working unchanged.
+-- Safe to run more than once.
+
+BEGIN;
+
+-- ============================================================================
+-- 1. Enum type
+-- ============================================================================
+
+DO $$
+BEGIN
+    CREATE TYPE review_status AS ENUM ('pending', 'approved', 'rejected', 'flagged');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- ============================================================================
+-- 2. Set aside policies that depend on the column type
+-- ============================================================================
+
+CREATE TEMP TABLE review_status_policies ON COMMIT DROP AS
+SELECT tablename, policyname, permissive, roles, cmd, qual, with_check
+FROM pg_policies
+WHERE schemaname = 'public'
+  -- Includes policies on other tables that look up reviews.status
+  AND (tablename = 'reviews' OR qual LIKE '%reviews%' OR with_check LIKE '%reviews%')
+  AND (qual LIKE '%status%' OR with_check LIKE '%status%');
+
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    FOR p IN SELECT * FROM review_status_policies LOOP
+        EXECUTE format('DROP POLICY %I ON %I', p.policyname, p.tablename);
+    END LOOP;
+END $$;
+
+-- ============================================================================
+-- 3. Convert the column
+-- ============================================================================
+
+UPDATE reviews
+SET status = 'pending'
+WHERE status IS NULL OR status::text = '';
+
+ALTER TABLE reviews DROP CONSTRAINT IF EXISTS reviews_status_check;
+ALTER TABLE reviews ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE reviews
+    ALTER COLUMN status TYPE review_status USING status::text::review_status;
+ALTER TABLE reviews ALTER COLUMN status SET DEFAULT 'pending';
+ALTER TABLE reviews ALTER COLUMN status SET NOT NULL;
+
+-- ============================================================================
+-- 4. Recreate the policies
+-- ============================================================================
+
+-- Stored policy expressions cast literals to text (status = 'approved'::text);
+-- drop the casts so the literals resolve to the new enum type.
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    FOR p IN SELECT * FROM review_status_policies LOOP
+        EXECUTE format(
+            'CREATE POLICY %I ON %I AS %s FOR %s TO %s%s%s',
+            p.policyname,
+            p.tablename,
+            p.permissive,
+            p.cmd,
+            array_to_string(p.roles, ', '),
+            COALESCE(' USING (' || replace(p.qual, '''::text', '''') || ')', ''),
+            COALESCE(' WITH CHECK (' || replace(p.with_check, '''::text', '''') || ')', '')
+        );
+    END LOOP;
+END $$;
+
+COMMIT;
+
+-- Verify
+SELECT
+    table_name,
+    column_name,
+    udt_name,
+    column_default,
+    is_nullable
+FROM information_schema.columns
+WHERE table_name = 'reviews' AND column_name = 'status';
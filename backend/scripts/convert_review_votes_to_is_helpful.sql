@@ -0,0 +1,37 @@
+-- Store professor review votes as a boolean is_helpful column
+-- review_votes.vote_type only ever holds 'helpful' or 'not_helpful', kept as
+-- a VARCHAR(20) on every row. A boolean takes 1 byte, so the votes heap and
+-- the scans behind helpful/not helpful counts read fewer pages. The vote API
+-- keeps accepting and returning the same vote_type strings.
+-- Safe to run more than once (skipped once vote_type is gone).
+
+BEGIN;
+
+-- ============================================================================
+-- 1. Replace vote_type with is_helpful
+-- ============================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'review_votes' AND column_name = 'vote_type'
+    ) THEN
+        ALTER TABLE review_votes ADD COLUMN IF NOT EXISTS is_helpful BOOLEAN;
+
+        UPDATE review_votes
+        SET is_helpful = (vote_type = 'helpful');
+
+        ALTER TABLE review_votes ALTER COLUMN is_helpful SET NOT NULL;
+        ALTER TABLE review_votes DROP COLUMN vote_type;
+    END IF;
+END $$;
+
+COMMIT;
+
+-- Verify
+SELECT
+    is_helpful,
+    COUNT(*) AS votes
+FROM review_votes
+GROUP BY is_helpful;
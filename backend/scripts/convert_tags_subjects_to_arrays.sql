@@ -0,0 +1,61 @@
+-- Store review tags and professor subjects as TEXT[]
+-- Older databases kept both as comma-separated text, so every read split the
+-- string in Python and tag filters could only use LIKE. As native arrays they
+-- come back from PostgREST as JSON lists, and a GIN index answers
+-- containment queries (tags @> ARRAY['caring']) directly.
+-- Safe to run more than once (columns that are already arrays are skipped).
+
+-- ============================================================================
+-- 1. Convert comma-separated text to arrays
+-- ============================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'reviews'
+          AND column_name = 'tags'
+          AND data_type <> 'ARRAY'
+    ) THEN
+        ALTER TABLE reviews
+            ALTER COLUMN tags TYPE TEXT[]
+            USING CASE WHEN tags IS NULL OR btrim(tags) = '' THEN NULL ELSE
+                array_remove(
+                    ARRAY(SELECT btrim(t) FROM unnest(string_to_array(tags, ',')) AS t),
+                    ''
+                )
+            END;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'professors'
+          AND column_name = 'subjects'
+          AND data_type <> 'ARRAY'
+    ) THEN
+        ALTER TABLE professors
+            ALTER COLUMN subjects TYPE TEXT[]
+            USING CASE WHEN subjects IS NULL OR btrim(subjects) = '' THEN NULL ELSE
+                array_remove(
+                    ARRAY(SELECT btrim(s) FROM unnest(string_to_array(subjects, ',')) AS s),
+                    ''
+                )
+            END;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- 2. Index for tag containment filters
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_reviews_tags ON reviews USING GIN (tags);
+
+-- Verify
+SELECT
+    table_name,
+    column_name,
+    data_type,
+    udt_name
+FROM information_schema.columns
+WHERE (table_name = 'reviews' AND column_name = 'tags')
+   OR (table_name = 'professors' AND column_name = 'subjects');
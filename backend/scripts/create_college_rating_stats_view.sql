@@ -0,0 +1,51 @@
+-- Per-college rating rollup for approved college reviews
+-- The college detail page used to fetch every approved review and average the
+-- ratings in Python on each request. This materialized view precomputes those
+-- averages so the page reads a single row.
+--
+-- Refreshed CONCURRENTLY by refresh_college_rating_stats() a couple of seconds
+-- after writes that change the averages (college review create/edit/delete,
+-- moderation actions, account deletion); bursts of writes share one refresh.
+-- The optional pg_cron schedule (below) only catches up on a refresh that
+-- failed. Safe to run more than once.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS college_rating_stats AS
+SELECT
+    college_id,
+    COUNT(*) AS review_count,
+    COUNT(*) FILTER (WHERE status = 'approved') AS approved_count,
+    ROUND(AVG(food_rating) FILTER (WHERE status = 'approved'), 1) AS avg_food,
+    ROUND(AVG(internet_rating) FILTER (WHERE status = 'approved'), 1) AS avg_internet,
+    ROUND(AVG(clubs_rating) FILTER (WHERE status = 'approved'), 1) AS avg_clubs,
+    ROUND(AVG(opportunities_rating) FILTER (WHERE status = 'approved'), 1) AS avg_opportunities,
+    ROUND(AVG(facilities_rating) FILTER (WHERE status = 'approved'), 1) AS avg_facilities,
+    ROUND(AVG(teaching_rating) FILTER (WHERE status = 'approved'), 1) AS avg_teaching,
+    ROUND(AVG(overall_rating) FILTER (WHERE status = 'approved'), 1) AS avg_overall
+FROM college_reviews
+GROUP BY college_id;
+
+-- Required for REFRESH ... CONCURRENTLY (readers are never blocked)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_college_rating_stats_college_id
+    ON college_rating_stats(college_id);
+
+GRANT SELECT ON college_rating_stats TO anon, authenticated;
+
+CREATE OR REPLACE FUNCTION refresh_college_rating_stats()
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER -- materialized view owner privileges are needed to refresh
+SET search_path = public
+AS $$
+    REFRESH MATERIALIZED VIEW CONCURRENTLY college_rating_stats;
+$$;
+
+REVOKE ALL ON FUNCTION refresh_college_rating_stats() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_college_rating_stats() TO authenticated, service_role;
+
+COMMENT ON MATERIALIZED VIEW college_rating_stats IS 'Per-college averages of approved college review ratings';
+
+-- Optional periodic catch-up refresh (requires the pg_cron extension: Database → Extensions)
+-- SELECT cron.schedule('refresh-college-rating-stats', '*/5 * * * *', 'SELECT refresh_college_rating_stats()');
+
+-- Verify
+SELECT * FROM college_rating_stats ORDER BY approved_count DESC LIMIT 10;
@@ -0,0 +1,24 @@
+-- Drop indexes that duplicate a table's primary key
+-- The models used to declare their id columns with index=True on top of
+-- primary_key=True, so any table created from the models (create_all) got an
+-- ix_<table>_id index next to <table>_pkey. Both index the same column; the
+-- second one only doubles the index writes on every insert.
+-- Tables created by the SQL scripts never had these indexes.
+-- All statements are idempotent.
+
+DROP INDEX IF EXISTS ix_users_id;
+DROP INDEX IF EXISTS ix_colleges_id;
+DROP INDEX IF EXISTS ix_professors_id;
+DROP INDEX IF EXISTS ix_reviews_id;
+DROP INDEX IF EXISTS ix_review_flags_id;
+DROP INDEX IF EXISTS ix_review_votes_id;
+DROP INDEX IF EXISTS ix_college_reviews_id;
+DROP INDEX IF EXISTS ix_college_review_flags_id;
+DROP INDEX IF EXISTS ix_moderation_logs_id;
+DROP INDEX IF EXISTS ix_user_activities_id;
+
+-- Verify
+SELECT tablename, indexname
+FROM pg_indexes
+WHERE schemaname = 'public' AND indexname LIKE 'ix\_%\_id' ESCAPE '\'
+ORDER BY tablename;
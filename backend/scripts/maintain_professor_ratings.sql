@@ -0,0 +1,176 @@
+-- Maintain professor rating aggregates incrementally
+-- Every review create/delete/moderation used to re-select all of a professor's
+-- approved reviews and average them in Python. Instead, professors keeps
+-- running sums over its approved reviews, and a trigger on reviews applies
+-- each change as a single UPDATE with the review's delta. The averages are
+-- derived from the sums in that same UPDATE.
+-- Safe to run more than once (the backfill resynchronises the sums).
+
+-- ============================================================================
+-- 1. Running sums (and the averages the app model expects)
+-- ============================================================================
+
+ALTER TABLE professors
+    ADD COLUMN IF NOT EXISTS sum_overall_rating INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS sum_difficulty_rating INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS sum_clarity_rating INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS sum_helpfulness_rating INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS would_take_again_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS rating_difficulty NUMERIC(2,1) NOT NULL DEFAULT 0.0,
+    ADD COLUMN IF NOT EXISTS rating_clarity NUMERIC(2,1) NOT NULL DEFAULT 0.0,
+    ADD COLUMN IF NOT EXISTS rating_helpfulness NUMERIC(2,1) NOT NULL DEFAULT 0.0,
+    ADD COLUMN IF NOT EXISTS would_take_again_percent NUMERIC(4,1) NOT NULL DEFAULT 0.0;
+
+-- ============================================================================
+-- 2. Apply a delta to one professor
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION apply_professor_rating_delta(
+    p_professor_id UUID,
+    p_count INTEGER,
+    p_overall INTEGER,
+    p_difficulty INTEGER,
+    p_clarity INTEGER,
+    p_helpfulness INTEGER,
+    p_would_take_again INTEGER
+)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER -- Review authors cannot update professors directly under RLS
+SET search_path = public
+AS $$
+    UPDATE professors SET
+        total_reviews = total_reviews + p_count,
+        sum_overall_rating = sum_overall_rating + p_overall,
+        sum_difficulty_rating = sum_difficulty_rating + p_difficulty,
+        sum_clarity_rating = sum_clarity_rating + p_clarity,
+        sum_helpfulness_rating = sum_helpfulness_rating + p_helpfulness,
+        would_take_again_count = would_take_again_count + p_would_take_again,
+        -- SET expressions see the pre-update row, so derive from old value + delta
+        average_rating = CASE WHEN total_reviews + p_count > 0
+            THEN ROUND((sum_overall_rating + p_overall)::numeric / (total_reviews + p_count), 1)
+            ELSE 0.0 END,
+        rating_difficulty = CASE WHEN total_reviews + p_count > 0
+            THEN ROUND((sum_difficulty_rating + p_difficulty)::numeric / (total_reviews + p_count), 1)
+            ELSE 0.0 END,
+        rating_clarity = CASE WHEN total_reviews + p_count > 0
+            THEN ROUND((sum_clarity_rating + p_clarity)::numeric / (total_reviews + p_count), 1)
+            ELSE 0.0 END,
+        rating_helpfulness = CASE WHEN total_reviews + p_count > 0
+            THEN ROUND((sum_helpfulness_rating + p_helpfulness)::numeric / (total_reviews + p_count), 1)
+            ELSE 0.0 END,
+        would_take_again_percent = CASE WHEN total_reviews + p_count > 0
+            THEN ROUND((would_take_again_count + p_would_take_again) * 100.0 / (total_reviews + p_count), 1)
+            ELSE 0.0 END
+    WHERE id = p_professor_id;
+$$;
+
+-- ============================================================================
+-- 3. Trigger: remove the old approved review, add the new approved review
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION update_professor_ratings_on_review_change()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'approved' THEN
+        PERFORM apply_professor_rating_delta(
+            OLD.professor_id, -1,
+            -OLD.overall_rating, -OLD.difficulty_rating,
+            -OLD.clarity_rating, -OLD.helpfulness_rating,
+            -(COALESCE(OLD.would_take_again, FALSE))::int
+        );
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'approved' THEN
+        PERFORM apply_professor_rating_delta(
+            NEW.professor_id, 1,
+            NEW.overall_rating, NEW.difficulty_rating,
+            NEW.clarity_rating, NEW.helpfulness_rating,
+            (COALESCE(NEW.would_take_again, FALSE))::int
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_reviews_professor_ratings ON reviews;
+CREATE TRIGGER trg_reviews_professor_ratings
+    AFTER INSERT OR DELETE OR UPDATE OF
+        status, professor_id, overall_rating, difficulty_rating,
+        clarity_rating, helpfulness_rating, would_take_again
+    ON reviews
+    FOR EACH ROW
+    EXECUTE FUNCTION update_professor_ratings_on_review_change();
+
+-- ============================================================================
+-- 4. Installation check, called by the app at startup
+-- ============================================================================
+
+-- Without this script the app recomputes ratings in Python after each write
+-- (src/lib/professor_ratings.py)
+CREATE OR REPLACE FUNCTION professor_ratings_trigger_installed()
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+SECURITY DEFINER -- pg_trigger is not readable through PostgREST roles
+SET search_path = public
+AS $$
+    SELECT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgname = 'trg_reviews_professor_ratings'
+          AND tgrelid = 'public.reviews'::regclass
+          AND tgenabled <> 'D'
+    );
+$$;
+
+GRANT EXECUTE ON FUNCTION professor_ratings_trigger_installed() TO anon, authenticated, service_role;
+
+-- ============================================================================
+-- 5. Backfill the sums from the current approved reviews
+-- ============================================================================
+
+UPDATE professors p SET
+    total_reviews = COALESCE(agg.review_count, 0),
+    sum_overall_rating = COALESCE(agg.sum_overall, 0),
+    sum_difficulty_rating = COALESCE(agg.sum_difficulty, 0),
+    sum_clarity_rating = COALESCE(agg.sum_clarity, 0),
+    sum_helpfulness_rating = COALESCE(agg.sum_helpfulness, 0),
+    would_take_again_count = COALESCE(agg.would_take_again, 0),
+    average_rating = COALESCE(ROUND(agg.sum_overall::numeric / agg.review_count, 1), 0.0),
+    rating_difficulty = COALESCE(ROUND(agg.sum_difficulty::numeric / agg.review_count, 1), 0.0),
+    rating_clarity = COALESCE(ROUND(agg.sum_clarity::numeric / agg.review_count, 1), 0.0),
+    rating_helpfulness = COALESCE(ROUND(agg.sum_helpfulness::numeric / agg.review_count, 1), 0.0),
+    would_take_again_percent = COALESCE(ROUND(agg.would_take_again * 100.0 / agg.review_count, 1), 0.0)
+FROM professors p2
+LEFT JOIN (
+    SELECT
+        professor_id,
+        COUNT(*) AS review_count,
+        SUM(overall_rating) AS sum_overall,
+        SUM(difficulty_rating) AS sum_difficulty,
+        SUM(clarity_rating) AS sum_clarity,
+        SUM(helpfulness_rating) AS sum_helpfulness,
+        COUNT(*) FILTER (WHERE would_take_again) AS would_take_again
+    FROM reviews
+    WHERE status = 'approved'
+    GROUP BY professor_id
+) agg ON agg.professor_id = p2.id
+WHERE p.id = p2.id;
+
+-- Verify
+SELECT
+    name,
+    total_reviews,
+    sum_overall_rating,
+    average_rating,
+    rating_difficulty,
+    would_take_again_percent
+FROM professors
+WHERE total_reviews > 0
+ORDER BY total_reviews DESC
+LIMIT 20;
@@ -0,0 +1,171 @@
+-- Partition moderation_logs by month on created_at
+-- moderation_logs is an append-only audit table that admins almost always read
+-- by recent time window. With monthly range partitions the planner skips every
+-- month outside the window, and each partition's indexes stay small.
+--
+-- Run once in the Supabase SQL editor. The existing table is kept as
+-- moderation_logs_unpartitioned until you have checked the copy; drop it at
+-- the end. New months are created by ensure_moderation_logs_partitions(),
+-- scheduled with pg_cron below.
+--
+-- college_review_flags is deliberately not partitioned: a unique index on a
+-- partitioned table must include the partition key, which would break
+-- idx_college_review_flags_unique (one flag per reporter per review).
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'moderation_logs'::regclass) = 'p' THEN
+        RAISE EXCEPTION 'moderation_logs is already partitioned';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- 1. Partitioned parent with the same columns
+-- ============================================================================
+
+ALTER TABLE moderation_logs RENAME TO moderation_logs_unpartitioned;
+
+-- Free the index names (including the primary key's) for the new table
+DO $$
+DECLARE
+    v_index RECORD;
+BEGIN
+    FOR v_index IN
+        SELECT indexrelid::regclass::text AS name
+        FROM pg_index
+        WHERE indrelid = 'moderation_logs_unpartitioned'::regclass
+    LOOP
+        EXECUTE format('ALTER INDEX %I RENAME TO %I', v_index.name, left(v_index.name, 50) || '_unpartitioned');
+    END LOOP;
+END $$;
+
+CREATE TABLE moderation_logs (
+    LIKE moderation_logs_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS
+) PARTITION BY RANGE (created_at);
+
+-- The partition key must be part of the primary key
+ALTER TABLE moderation_logs ADD PRIMARY KEY (id, created_at);
+
+-- Catches rows outside the precreated months instead of failing the insert
+CREATE TABLE moderation_logs_default PARTITION OF moderation_logs DEFAULT;
+
+-- ============================================================================
+-- 2. Monthly partitions
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION create_moderation_logs_partition(p_month DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::date;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF moderation_logs FOR VALUES FROM (%L) TO (%L)',
+        'moderation_logs_' || to_char(v_start, 'YYYY_MM'),
+        v_start,
+        (v_start + INTERVAL '1 month')::date
+    );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION ensure_moderation_logs_partitions(p_months_ahead INTEGER DEFAULT 3)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    FOR i IN 0..p_months_ahead LOOP
+        PERFORM create_moderation_logs_partition((CURRENT_DATE + make_interval(months => i))::date);
+    END LOOP;
+END;
+$$;
+
+-- Every month that already has logs, then the next few months
+SELECT create_moderation_logs_partition(month::date)
+FROM generate_series(
+    date_trunc('month', COALESCE((SELECT MIN(created_at) FROM moderation_logs_unpartitioned), NOW())),
+    date_trunc('month', NOW()),
+    INTERVAL '1 month'
+) AS month;
+
+SELECT ensure_moderation_logs_partitions();
+
+-- ============================================================================
+-- 3. Indexes (created on every partition), copy rows, row level security
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_target
+    ON moderation_logs(target_type, target_id);
+
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_moderator_created_at
+    ON moderation_logs(moderator_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_action_type
+    ON moderation_logs(action_type);
+
+CREATE INDEX IF NOT EXISTS idx_moderation_logs_created_at
+    ON moderation_logs(created_at DESC);
+
+DO $$
+BEGIN
+    -- Only once extra_data is JSONB (convert_moderation_log_extra_data_to_jsonb.sql)
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'moderation_logs'
+          AND column_name = 'extra_data'
+          AND data_type = 'jsonb'
+    ) THEN
+        CREATE INDEX IF NOT EXISTS idx_moderation_logs_extra_data
+            ON moderation_logs USING GIN (extra_data jsonb_path_ops);
+    END IF;
+END $$;
+
+INSERT INTO moderation_logs SELECT * FROM moderation_logs_unpartitioned;
+
+-- Carry over RLS and its policies from the old table
+DO $$
+DECLARE
+    p RECORD;
+BEGIN
+    IF (SELECT relrowsecurity FROM pg_class WHERE oid = 'moderation_logs_unpartitioned'::regclass) THEN
+        ALTER TABLE moderation_logs ENABLE ROW LEVEL SECURITY;
+    END IF;
+
+    FOR p IN
+        SELECT * FROM pg_policies
+        WHERE schemaname = 'public' AND tablename = 'moderation_logs_unpartitioned'
+    LOOP
+        EXECUTE format(
+            'CREATE POLICY %I ON moderation_logs AS %s FOR %s TO %s%s%s',
+            p.policyname,
+            p.permissive,
+            p.cmd,
+            array_to_string(p.roles, ', '),
+            COALESCE(' USING (' || p.qual || ')', ''),
+            COALESCE(' WITH CHECK (' || p.with_check || ')', '')
+        );
+    END LOOP;
+END $$;
+
+COMMIT;
+
+-- Create upcoming partitions on the 1st of every month (requires pg_cron)
+-- SELECT cron.schedule('moderation-logs-partitions', '0 0 1 * *', 'SELECT ensure_moderation_logs_partitions()');
+
+-- After checking the row counts below match:
+-- DROP TABLE moderation_logs_unpartitioned;
+
+-- Verify
+SELECT
+    (SELECT COUNT(*) FROM moderation_logs_unpartitioned) AS old_rows,
+    (SELECT COUNT(*) FROM moderation_logs) AS new_rows;
+
+SELECT
+    inhrelid::regclass AS partition,
+    pg_get_expr(c.relpartbound, c.oid) AS bounds
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE inhparent = 'moderation_logs'::regclass
+ORDER BY inhrelid::regclass::text;
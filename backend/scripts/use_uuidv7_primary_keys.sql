@@ -0,0 +1,58 @@
+-- Generate time-ordered UUIDv7 primary keys for insert-heavy tables
+-- gen_random_uuid() (v4) ids are random, so every insert lands on a random
+-- page of the primary key index, splitting pages and dirtying the whole index.
+-- UUIDv7 ids start with a millisecond timestamp, so new rows go to the
+-- right-most pages. Columns stay native UUID; existing ids are unchanged.
+--
+-- users is not changed: its ids come from auth.users.
+-- Run in the Supabase SQL editor. All statements are idempotent.
+
+-- ============================================================================
+-- 1. UUIDv7 generator (built in from PostgreSQL 18 as uuidv7())
+-- ============================================================================
+
+-- Same layout as uuid7() in src/models/base.py: 48-bit Unix milliseconds,
+-- version 7, and the random bits and variant of a v4 UUID
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID
+LANGUAGE sql
+VOLATILE
+AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid;
+$$;
+
+-- ============================================================================
+-- 2. Column defaults
+-- ============================================================================
+
+ALTER TABLE review_flags ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE review_votes ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+
+DO $$
+BEGIN
+    IF to_regclass('public.user_activities') IS NOT NULL THEN
+        ALTER TABLE user_activities ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+    END IF;
+END $$;
+
+-- Verify
+SELECT uuid_generate_v7() AS sample_id;
+
+SELECT table_name, column_default
+FROM information_schema.columns
+WHERE column_name = 'id'
+  AND table_name IN ('review_flags', 'review_votes', 'user_activities')
+ORDER BY table_name;
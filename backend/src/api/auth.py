@@ -8,6 +8,7 @@ from supabase import Client
 
 from src.lib.database import get_supabase
 from src.lib.auth import get_current_user
+from src.lib.college_review_moderation import schedule_college_rating_stats_refresh
 
 router = APIRouter()
 
@@ -380,6 +381,10 @@ async def delete_account(
         except Exception as e:
             print(f"⚠️ Error processing college reviews: {str(e)}")
         
+        # Deleted approved reviews must drop out of the college averages
+        if deleted_counts["college_reviews"]:
+            schedule_college_rating_stats_refresh(admin_supabase)
+        
         # Step 3: Delete votes and activities (best effort)
         try:
             result = admin_supabase.table('review_votes').delete().eq('user_id', user_id).execute()
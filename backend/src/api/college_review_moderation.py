@@ -14,7 +14,9 @@ from src.lib.college_review_moderation import (
     get_flagged_college_reviews,
     review_college_review_flag,
     get_college_review_moderation_stats,
-    get_valid_college_review_flag_types
+    get_valid_college_review_flag_types,
+    schedule_college_rating_stats_refresh,
+    VALID_COLLEGE_REVIEW_FLAG_TYPES
 )
 
 router = APIRouter()
@@ -43,8 +45,8 @@ class CollegeReviewFlagCreate(BaseModel):
     
     @field_validator('flag_type')
     def validate_flag_type(cls, v):
-        valid_types = [t["type"] for t in get_valid_college_review_flag_types()]
-        if v not in valid_types:
+        if v not in VALID_COLLEGE_REVIEW_FLAG_TYPES:
+            valid_types = [t["type"] for t in get_valid_college_review_flag_types()]
             raise ValueError(f'Invalid flag type. Must be one of: {", ".join(valid_types)}')
         return v
 
@@ -476,6 +478,7 @@ async def moderate_college_review(
                 'moderation_reason': action_data.reason or 'Approved by moderator',
                 'is_flagged': False
             }).eq('id', review_id).execute()
+            schedule_college_rating_stats_refresh(admin_client)
             
             return {
                 "message": "Review approved successfully",
@@ -492,6 +495,7 @@ async def moderate_college_review(
                 'moderation_reason': action_data.reason or 'Rejected by moderator',
                 'is_flagged': True
             }).eq('id', review_id).execute()
+            schedule_college_rating_stats_refresh(admin_client)
             
             return {
                 "message": "Review rejected successfully",
@@ -535,6 +539,7 @@ async def moderate_college_review(
             
             # Delete review
             admin_client.table('college_reviews').delete().eq('id', review_id).execute()
+            schedule_college_rating_stats_refresh(admin_client)
             
             return {
                 "message": "Review deleted successfully",
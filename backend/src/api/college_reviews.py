@@ -9,6 +9,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, Background
 from pydantic import BaseModel, field_validator
 from supabase import Client
 
+from src.lib.college_cache import invalidate_college
+from src.lib.college_review_moderation import schedule_college_rating_stats_refresh
 from src.lib.database import get_supabase
 from src.lib.auth import get_current_user, get_authenticated_supabase
 from src.services.auto_flagging import AutoFlaggingSystem
@@ -728,7 +730,14 @@ async def _calculate_average_ratings(college_id: str, supabase: Client) -> Dict[
 
 
 async def _update_college_stats(college_id: str, supabase: Client):
-    """Update college statistics based on reviews."""
+    """Update college statistics based on reviews.
+    
+    Also schedules a refresh of the college_rating_stats view, which
+    GET /colleges/{id} reads its averages from, so edits and deletions show
+    up within seconds.
+    """
+    # Runs even if the college has no approved reviews left
+    schedule_college_rating_stats_refresh(supabase)
     try:
         # Get all approved reviews for this college
         reviews = supabase.table('college_reviews').select(
@@ -744,6 +753,7 @@ async def _update_college_stats(college_id: str, supabase: Client):
                 'total_reviews': total_reviews,
                 'average_rating': round(average_rating, 1)
             }).eq('id', college_id).execute()
+            invalidate_college(college_id)
     except Exception:
         # Silently fail - stats update is not critical
         pass
@@ -2,11 +2,12 @@
 
 Handles college search and information retrieval endpoints.
 """
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, field_validator
 from supabase import Client
 
+from src.lib.college_cache import get_college_row
 from src.lib.database import get_supabase
 
 router = APIRouter()
@@ -171,6 +172,61 @@ async def search_colleges(
         )
 
 
+# college_rating_stats column for each college_average_ratings key
+_RATING_STATS_COLUMNS = {
+    'food': 'avg_food',
+    'internet': 'avg_internet',
+    'clubs': 'avg_clubs',
+    'opportunities': 'avg_opportunities',
+    'facilities': 'avg_facilities',
+    'teaching': 'avg_teaching',
+    'overall': 'avg_overall',
+}
+
+
+def _get_college_review_averages(supabase: Client, college_id: str) -> Tuple[int, Dict[str, float]]:
+    """Get the approved college review count and average ratings for a college.
+    
+    Reads the precomputed college_rating_stats materialized view, falling back
+    to aggregating the approved reviews when the view isn't available or has
+    no row for the college yet (e.g. its first review since the last refresh).
+    
+    Args:
+        supabase: Supabase client
+        college_id: College ID
+        
+    Returns:
+        Tuple of (approved review count, average rating per aspect)
+    """
+    try:
+        stats_result = supabase.table('college_rating_stats').select(
+            'approved_count, ' + ', '.join(_RATING_STATS_COLUMNS.values())
+        ).eq('college_id', college_id).execute()
+    except Exception:
+        stats_result = None
+    
+    if stats_result is not None and stats_result.data:
+        stats = stats_result.data[0]
+        return stats['approved_count'], {
+            key: float(stats[column] or 0.0) for key, column in _RATING_STATS_COLUMNS.items()
+        }
+    
+    college_reviews_result = supabase.table('college_reviews').select('''
+        food_rating, internet_rating, clubs_rating, opportunities_rating,
+        facilities_rating, teaching_rating, overall_rating
+    ''').eq('college_id', college_id).eq('status', 'approved').execute()
+    
+    reviews = college_reviews_result.data or []
+    count = len(reviews)
+    if count == 0:
+        return 0, {}
+    
+    return count, {
+        key: round(sum(r[f'{key}_rating'] for r in reviews) / count, 1)
+        for key in _RATING_STATS_COLUMNS
+    }
+
+
 @router.get("/{college_id}", response_model=CollegeDetail)
 async def get_college(
     college_id: str,
@@ -181,16 +237,14 @@ async def get_college(
     Returns comprehensive details about the college including all available data.
     """
     try:
-        result = supabase.table('colleges').select('*').eq('id', college_id).execute()
+        college_data = get_college_row(supabase, college_id)
         
-        if not result.data:
+        if college_data is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="College not found"
             )
         
-        college_data = result.data[0]
-        
         # Calculate college rating based on professor ratings
         prof_query = supabase.table('professors').select(
             'average_rating, total_reviews'
@@ -222,33 +276,14 @@ async def get_college(
         
         # Get college review statistics
         try:
-            college_reviews_result = supabase.table('college_reviews').select('''
-                food_rating, internet_rating, clubs_rating, opportunities_rating,
-                facilities_rating, teaching_rating, overall_rating
-            ''').eq('college_id', college_id).eq('status', 'approved').execute()
+            count, averages = _get_college_review_averages(supabase, college_id)
+            college_data['college_reviews_count'] = count
             
-            college_data['college_reviews_count'] = len(college_reviews_result.data) if college_reviews_result.data else 0
-            
-            if college_reviews_result.data:
-                # Calculate average ratings for college reviews
-                totals = {
-                    'food': sum(r['food_rating'] for r in college_reviews_result.data),
-                    'internet': sum(r['internet_rating'] for r in college_reviews_result.data),
-                    'clubs': sum(r['clubs_rating'] for r in college_reviews_result.data),
-                    'opportunities': sum(r['opportunities_rating'] for r in college_reviews_result.data),
-                    'facilities': sum(r['facilities_rating'] for r in college_reviews_result.data),
-                    'teaching': sum(r['teaching_rating'] for r in college_reviews_result.data),
-                    'overall': sum(r['overall_rating'] for r in college_reviews_result.data)
-                }
-                
-                count = len(college_reviews_result.data)
-                college_data['college_average_ratings'] = {
-                    key: round(total / count, 1) for key, total in totals.items()
-                }
+            if count > 0:
+                college_data['college_average_ratings'] = averages
                 
                 # Update the main average_rating with college review overall rating
-                if count > 0:
-                    college_data['average_rating'] = college_data['college_average_ratings']['overall']
+                college_data['average_rating'] = averages['overall']
             else:
                 college_data['college_average_ratings'] = {
                     'food': 0.0,
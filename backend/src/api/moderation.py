@@ -13,6 +13,7 @@ from supabase import Client
 
 from src.lib.database import get_supabase, get_supabase_admin, get_supabase_service
 from src.lib.auth import get_current_user
+from src.lib.professor_ratings import sync_professor_ratings
 from src.services.auto_flagging import AutoFlaggingSystem
 from src.services.content_filter import content_filter, ContentAnalysis
 from src.services.user_communication import UserCommunicationSystem, NotificationType
@@ -565,25 +566,9 @@ async def moderate_review(
             'moderated_by': user_id
         }).eq('id', review_id).execute()
         
-        # Recalculate professor ratings after moderation action
-        professor_id = review_data['professor_id']
-        approved_reviews = supabase.table('reviews').select('overall_rating').eq(
-            'professor_id', professor_id
-        ).eq('status', 'approved').execute()
-        
-        if approved_reviews.data and len(approved_reviews.data) > 0:
-            total_reviews = len(approved_reviews.data)
-            average_rating = sum(r['overall_rating'] for r in approved_reviews.data) / total_reviews
-            supabase.table('professors').update({
-                'average_rating': round(average_rating, 1),
-                'total_reviews': total_reviews
-            }).eq('id', professor_id).execute()
-        else:
-            # No approved reviews, reset to 0
-            supabase.table('professors').update({
-                'average_rating': 0.0,
-                'total_reviews': 0
-            }).eq('id', professor_id).execute()
+        # Professor ratings follow the status change via the
+        # trg_reviews_professor_ratings trigger, or are recomputed here without it
+        await sync_professor_ratings(supabase, review_data['professor_id'])
         
         # Log moderation action (optional - don't fail if table doesn't exist)
         try:
@@ -693,8 +678,6 @@ async def delete_review(
                 detail="Review not found"
             )
         
-        professor_id = review_check.data['professor_id']
-        
         # Use admin client to bypass RLS
         admin_client = get_admin_supabase()
         if not admin_client:
@@ -713,24 +696,8 @@ async def delete_review(
         # Delete the review itself
         admin_client.table('reviews').delete().eq('id', review_id).execute()
         
-        # Recalculate professor ratings after deletion
-        approved_reviews = admin_client.table('reviews').select('overall_rating').eq(
-            'professor_id', professor_id
-        ).eq('status', 'approved').execute()
-        
-        if approved_reviews.data and len(approved_reviews.data) > 0:
-            total_reviews = len(approved_reviews.data)
-            average_rating = sum(r['overall_rating'] for r in approved_reviews.data) / total_reviews
-            admin_client.table('professors').update({
-                'average_rating': round(average_rating, 1),
-                'total_reviews': total_reviews
-            }).eq('id', professor_id).execute()
-        else:
-            # No approved reviews left, reset to 0
-            admin_client.table('professors').update({
-                'average_rating': 0.0,
-                'total_reviews': 0
-            }).eq('id', professor_id).execute()
+        # Update professor ratings (a no-op when the trigger maintains them)
+        await sync_professor_ratings(admin_client, review_check.data['professor_id'])
         
         return {"message": "Review permanently deleted"}
         
@@ -1420,7 +1387,7 @@ async def update_professor(
         if professor_update.designation is not None:
             update_data['designation'] = professor_update.designation
         if professor_update.subjects is not None:
-            update_data['subjects'] = ','.join(professor_update.subjects) if professor_update.subjects else None
+            update_data['subjects'] = professor_update.subjects or None  # TEXT[] column
         if professor_update.biography is not None:
             update_data['biography'] = professor_update.biography
         if professor_update.years_of_experience is not None:
@@ -1570,6 +1537,7 @@ class ContentFilterResponse(BaseModel):
 
 class BulkAnalysisRequest(BaseModel):
     limit: int = 100
+    since: Optional[datetime] = None  # Only reviews updated after this time
 
 @router.post("/content/analyze", response_model=ContentFilterResponse)
 async def analyze_content(
@@ -1668,7 +1636,8 @@ async def bulk_analyze_content(
         # Add bulk analysis task to background
         background_tasks.add_task(
             auto_flagging.bulk_analyze_existing_content,
-            request.limit
+            request.limit,
+            request.since
         )
         
         return {
@@ -1855,6 +1824,7 @@ async def bulk_moderate_reviews(
         success_count = 0
         failed_count = 0
         failed_items = []
+        log_rows = []
         
         for review_id in request.item_ids:
             try:
@@ -1901,21 +1871,16 @@ async def bulk_moderate_reviews(
                         'updated_at': datetime.utcnow().isoformat()
                     }).eq('id', review_id).execute()
                 
-                # Log the action
-                try:
-                    log_data = {
-                        'moderator_id': current_user['id'],
-                        'action': f'bulk_{request.action}',
-                        'target_type': 'review',
-                        'target_id': review_id,
-                        'reason': request.reason,
-                        'details': f"Bulk {request.action} on review {review_id}",
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    supabase.table('moderation_logs').insert(log_data).execute()
-                except:
-                    # Logging is optional
-                    pass
+                # Queue the log entry; entries are inserted in one request below
+                log_rows.append({
+                    'moderator_id': current_user['id'],
+                    'action': f'bulk_{request.action}',
+                    'target_type': 'review',
+                    'target_id': review_id,
+                    'reason': request.reason,
+                    'details': f"Bulk {request.action} on review {review_id}",
+                    'created_at': datetime.utcnow().isoformat()
+                })
                 
                 success_count += 1
                 
@@ -1932,6 +1897,14 @@ async def bulk_moderate_reviews(
                 })
                 failed_count += 1
         
+        # Log all actions with a single bulk insert
+        if log_rows:
+            try:
+                supabase.table('moderation_logs').insert(log_rows).execute()
+            except:
+                # Logging is optional
+                pass
+        
         return BulkOperationResponse(
             success_count=success_count,
             failed_count=failed_count,
@@ -1976,6 +1949,7 @@ async def bulk_moderate_college_reviews(
         success_count = 0
         failed_count = 0
         failed_items = []
+        log_rows = []
         
         for review_id in request.item_ids:
             try:
@@ -2022,21 +1996,16 @@ async def bulk_moderate_college_reviews(
                         'updated_at': datetime.utcnow().isoformat()
                     }).eq('id', review_id).execute()
                 
-                # Log the action
-                try:
-                    log_data = {
-                        'moderator_id': current_user['id'],
-                        'action': f'bulk_{request.action}',
-                        'target_type': 'college_review',
-                        'target_id': review_id,
-                        'reason': request.reason,
-                        'details': f"Bulk {request.action} on college review {review_id}",
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    supabase.table('moderation_logs').insert(log_data).execute()
-                except:
-                    # Logging is optional
-                    pass
+                # Queue the log entry; entries are inserted in one request below
+                log_rows.append({
+                    'moderator_id': current_user['id'],
+                    'action': f'bulk_{request.action}',
+                    'target_type': 'college_review',
+                    'target_id': review_id,
+                    'reason': request.reason,
+                    'details': f"Bulk {request.action} on college review {review_id}",
+                    'created_at': datetime.utcnow().isoformat()
+                })
                 
                 success_count += 1
                 
@@ -2053,6 +2022,14 @@ async def bulk_moderate_college_reviews(
                 })
                 failed_count += 1
         
+        # Log all actions with a single bulk insert
+        if log_rows:
+            try:
+                supabase.table('moderation_logs').insert(log_rows).execute()
+            except:
+                # Logging is optional
+                pass
+        
         return BulkOperationResponse(
             success_count=success_count,
             failed_count=failed_count,
@@ -2097,6 +2074,7 @@ async def bulk_user_action(
         success_count = 0
         failed_count = 0
         failed_items = []
+        log_rows = []
         
         for user_id in request.user_ids:
             try:
@@ -2142,22 +2120,17 @@ async def bulk_user_action(
                     supabase.table('college_review_flags').delete().eq('reporter_id', user_id).execute()
                     action_details = "User and all associated data deleted"
                 
-                # Log the action
-                try:
-                    log_data = {
-                        'moderator_id': current_user['id'],
-                        'action': f'bulk_{request.action}_user',
-                        'target_type': 'user',
-                        'target_id': user_id,
-                        'reason': request.reason,
-                        'details': action_details,
-                        'duration_days': request.duration_days,
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    supabase.table('moderation_logs').insert(log_data).execute()
-                except:
-                    # Logging is optional
-                    pass
+                # Queue the log entry; entries are inserted in one request below
+                log_rows.append({
+                    'moderator_id': current_user['id'],
+                    'action': f'bulk_{request.action}_user',
+                    'target_type': 'user',
+                    'target_id': user_id,
+                    'reason': request.reason,
+                    'details': action_details,
+                    'duration_days': request.duration_days,
+                    'created_at': datetime.utcnow().isoformat()
+                })
                 
                 success_count += 1
                 
@@ -2174,6 +2147,14 @@ async def bulk_user_action(
                 })
                 failed_count += 1
         
+        # Log all actions with a single bulk insert
+        if log_rows:
+            try:
+                supabase.table('moderation_logs').insert(log_rows).execute()
+            except:
+                # Logging is optional
+                pass
+        
         return BulkOperationResponse(
             success_count=success_count,
             failed_count=failed_count,
@@ -2218,6 +2199,7 @@ async def bulk_professor_action(
         success_count = 0
         failed_count = 0
         failed_items = []
+        log_rows = []
         
         for professor_id in request.item_ids:
             try:
@@ -2270,21 +2252,16 @@ async def bulk_professor_action(
                     failed_count += 1
                     continue
                 
-                # Log the action
-                try:
-                    log_data = {
-                        'moderator_id': current_user['id'],
-                        'action': f'bulk_{action_name}_professor',
-                        'target_type': 'professor',
-                        'target_id': professor_id,
-                        'reason': request.reason,
-                        'details': f"Bulk {action_name} professor: {professor['name']}",
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    supabase.table('moderation_logs').insert(log_data).execute()
-                except:
-                    # Logging is optional
-                    pass
+                # Queue the log entry; entries are inserted in one request below
+                log_rows.append({
+                    'moderator_id': current_user['id'],
+                    'action': f'bulk_{action_name}_professor',
+                    'target_type': 'professor',
+                    'target_id': professor_id,
+                    'reason': request.reason,
+                    'details': f"Bulk {action_name} professor: {professor['name']}",
+                    'created_at': datetime.utcnow().isoformat()
+                })
                 
                 success_count += 1
                 
@@ -2301,6 +2278,14 @@ async def bulk_professor_action(
                 })
                 failed_count += 1
         
+        # Log all actions with a single bulk insert
+        if log_rows:
+            try:
+                supabase.table('moderation_logs').insert(log_rows).execute()
+            except:
+                # Logging is optional
+                pass
+        
         return BulkOperationResponse(
             success_count=success_count,
             failed_count=failed_count,
@@ -3,6 +3,8 @@
 Handles professor search, profile retrieval, and professor management
 endpoints for the platform.
 """
+import logging
+from datetime import date
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
@@ -11,7 +13,9 @@ from supabase import Client
 
 from src.lib.database import get_supabase
 from src.lib.auth import get_current_user, get_authenticated_supabase
-from src.lib.rate_limiting_supabase import check_rate_limit, increment_action_count
+from src.lib.rate_limiting_supabase import call_rate_limited_rpc, invalidate_daily_count
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -322,8 +326,6 @@ async def create_professor(
     identify the user via auth.uid().
     """
     try:
-        # Check rate limit first (3 professors per day)
-        check_rate_limit(supabase, current_user['id'], 'professor_create', fastapi_request)
         # Verify college exists
         college_result = supabase.table('colleges').select('id, name').eq(
             'id', request.college_id
@@ -348,41 +350,38 @@ async def create_professor(
                 detail="Professor already exists at this college"
             )
         
-        # Create professor record (unverified by default - requires admin approval)
+        # Create the professor (unverified by default - requires admin approval)
+        # and count it against the daily limit (3 professors per day) in one
+        # transaction; over the limit, the database rolls the insert back and
+        # the call raises a 429
         prof_data = {
             'name': request.name,
             'email': request.email,
             'department': request.department,
             'designation': request.designation,
             'college_id': request.college_id,
-            'subjects': ','.join(request.subjects) if request.subjects else None,
+            'subjects': request.subjects or None,  # TEXT[] column
             'biography': request.biography,
             'years_of_experience': request.years_of_experience,
             'education': request.education,
             'research_interests': request.research_interests,
-            'average_rating': 0.0,
-            'total_reviews': 0,
-            'is_verified': False  # Requires admin verification before appearing in search
         }
         
-        result = supabase.table('professors').insert(prof_data).execute()
+        created = await call_rate_limited_rpc(supabase, 'create_professor_with_quota', {
+            'p_user_id': current_user['id'],
+            'p_professor': prof_data,
+            'p_action_date': date.today().isoformat(),  # Same day as the rate-limit reads
+            'p_ip_address': fastapi_request.state.client_ip,
+        })
+        invalidate_daily_count(current_user['id'], 'professor_create')
         
-        if not result.data:
+        if not created:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create professor"
             )
         
-        created_prof = result.data[0]
-        
-        # Increment the user's daily professor creation count
-        increment_action_count(
-            supabase, 
-            current_user['id'], 
-            'professor_create', 
-            created_prof['id'], 
-            fastapi_request
-        )
+        created_prof = created[0]
         
         return {
             "id": created_prof['id'],
@@ -393,8 +392,7 @@ async def create_professor(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to create professor: %s", e)
         # Check if it's an RLS policy error
         error_str = str(e)
         if '42501' in error_str or 'policy' in error_str.lower():
@@ -449,7 +447,7 @@ async def get_similar_professors(
                 'department': prof['department'],
                 'average_rating': prof['average_rating'] or 0.0,
                 'total_reviews': prof['total_reviews'] or 0,
-                'subjects': prof['subjects'].split(',') if prof.get('subjects') else []
+                'subjects': prof.get('subjects') or []
             })
         
         return {
@@ -505,7 +503,7 @@ async def get_more_professors(
                 'department': prof['department'],
                 'average_rating': prof['average_rating'] or 0.0,
                 'total_reviews': prof['total_reviews'] or 0,
-                'subjects': prof['subjects'].split(',') if prof.get('subjects') else []
+                'subjects': prof.get('subjects') or []
             })
         
         return {
@@ -654,7 +652,7 @@ async def compare_professors(
                 'college_name': college_name,
                 'average_rating': prof['average_rating'] or 0.0,
                 'total_reviews': prof['total_reviews'] or 0,
-                'subjects': prof['subjects'].split(',') if prof.get('subjects') else [],
+                'subjects': prof.get('subjects') or [],
                 'ratings_breakdown': avg_ratings,
                 'rating_distribution': rating_distribution,
                 'would_take_again_percentage': round(would_take_again_pct, 0),
@@ -4,16 +4,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, UUID4
-from supabase import Client, create_client
+from supabase import Client
 import uuid
-import os
 
-from src.lib.database import get_supabase
+from src.lib.database import get_supabase, get_supabase_with_token
 from src.lib.auth import get_current_user
 
 security = HTTPBearer()
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 
 router = APIRouter()
 
@@ -396,8 +393,7 @@ async def create_professor(
     try:
         # Create authenticated client for RLS
         access_token = credentials.credentials
-        auth_client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-        auth_client.postgrest.auth(access_token)
+        auth_client = get_supabase_with_token(access_token)
         
         print(f"Professor submission with authenticated token")
         
@@ -2,16 +2,16 @@
 
 Handles review creation, updates, and management endpoints for the platform.
 """
-import os
 from typing import Optional, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Security, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, field_validator
-from supabase import Client, create_client
+from supabase import Client
 
-from src.lib.database import get_supabase, get_supabase_service
+from src.lib.database import get_supabase, get_supabase_service, get_supabase_with_token
 from src.lib.auth import get_current_user, get_optional_current_user, get_authenticated_supabase
+from src.lib.professor_ratings import sync_professor_ratings
 from src.services.auto_flagging import AutoFlaggingSystem
 
 router = APIRouter()
@@ -257,21 +257,9 @@ async def create_review(
                 current_user['id'] if current_user else 'anonymous'
             )
         
-        # Update professor's average rating and total reviews count
-        # Get all APPROVED reviews for this professor to calculate new average
-        all_reviews = supabase.table('reviews').select('overall_rating').eq(
-            'professor_id', request.professor_id
-        ).eq('status', 'approved').execute()
-        
-        if all_reviews.data:
-            total_reviews = len(all_reviews.data)
-            average_rating = sum(review['overall_rating'] for review in all_reviews.data) / total_reviews
-            
-            # Update professor record
-            supabase.table('professors').update({
-                'average_rating': round(average_rating, 1),
-                'total_reviews': total_reviews
-            }).eq('id', request.professor_id).execute()
+        # Professor average_rating/total_reviews: applied by the
+        # trg_reviews_professor_ratings trigger, or recomputed here without it
+        await sync_professor_ratings(supabase, request.professor_id)
         
         print(f"✅ Review created successfully: {review_data['id']}")
         print(f"📊 Review data keys: {review_data.keys()}")
@@ -468,20 +456,9 @@ async def get_my_reviews(
         # Get the access token from the authorization header
         access_token = credentials.credentials
         
-        # Create a new Supabase client with the user's auth token
+        # Get a Supabase client bound to the user's auth token
         # This ensures RLS policies use auth.uid() correctly
-        SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-        SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY", "")
-        
-        if not SUPABASE_URL or not SUPABASE_ANON_KEY:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Supabase configuration missing"
-            )
-            
-        auth_client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-        # Set the auth header for this client
-        auth_client.postgrest.auth(access_token)
+        auth_client = get_supabase_with_token(access_token)
         
         print(f"🔍 Fetching reviews for user: {current_user['id']}")
         
@@ -589,7 +566,7 @@ async def delete_my_review(
             )
         
         # Get review info before deleting (for professor update)
-        review = supabase.table('reviews').select('professor_id, overall_rating').eq(
+        review = supabase.table('reviews').select('professor_id').eq(
             'id', review_id
         ).single().execute()
         
@@ -599,8 +576,6 @@ async def delete_my_review(
                 detail="Review not found"
             )
         
-        professor_id = review.data['professor_id']
-        
         # Delete the mapping first (foreign key will cascade delete if configured, but let's be explicit)
         # RLS policy: Users can delete their own mappings via auth.uid()
         supabase.table('review_author_mappings').delete().eq(
@@ -612,25 +587,8 @@ async def delete_my_review(
         
         print(f"✅ DELETED REVIEW: {review_id}")
         
-        # Update professor's stats - only count APPROVED reviews
-        all_reviews = supabase.table('reviews').select('overall_rating').eq(
-            'professor_id', professor_id
-        ).eq('status', 'approved').execute()
-        
-        if all_reviews.data and len(all_reviews.data) > 0:
-            total_reviews = len(all_reviews.data)
-            average_rating = sum(r['overall_rating'] for r in all_reviews.data) / total_reviews
-            
-            supabase.table('professors').update({
-                'average_rating': round(average_rating, 1),
-                'total_reviews': total_reviews
-            }).eq('id', professor_id).execute()
-        else:
-            # No approved reviews left, set to 0
-            supabase.table('professors').update({
-                'average_rating': 0.0,
-                'total_reviews': 0
-            }).eq('id', professor_id).execute()
+        # Update professor's stats (a no-op when the trigger maintains them)
+        await sync_professor_ratings(supabase, review.data['professor_id'])
         
         return {
             "message": "Review deleted successfully",
@@ -749,11 +707,15 @@ async def vote_on_review(
         user_id = current_user['id']
         
         # Check existing vote (use admin client)
-        existing_result = supabase_admin.table('review_votes').select('vote_type').eq(
+        existing_result = supabase_admin.table('review_votes').select('is_helpful').eq(
             'review_id', review_id
         ).eq('user_id', user_id).execute()
         
-        old_vote = existing_result.data[0]['vote_type'] if existing_result.data else None
+        # Votes are stored as a boolean; the API keeps the vote_type strings
+        old_vote = None
+        if existing_result.data:
+            old_vote = 'helpful' if existing_result.data[0]['is_helpful'] else 'not_helpful'
+        is_helpful = request.vote_type == 'helpful'
         
         # Determine the action and prepare count updates
         helpful_delta = 0
@@ -779,7 +741,7 @@ async def vote_on_review(
         elif old_vote and old_vote != request.vote_type:
             # Change vote
             supabase_admin.table('review_votes').update({
-                'vote_type': request.vote_type
+                'is_helpful': is_helpful
             }).eq('review_id', review_id).eq('user_id', user_id).execute()
             
             # Swap counts
@@ -798,11 +760,11 @@ async def vote_on_review(
             supabase_admin.table('review_votes').insert({
                 'review_id': review_id,
                 'user_id': user_id,
-                'vote_type': request.vote_type
+                'is_helpful': is_helpful
             }).execute()
             
             # Increment the appropriate count
-            if request.vote_type == 'helpful':
+            if is_helpful:
                 helpful_delta = 1
             else:
                 not_helpful_delta = 1
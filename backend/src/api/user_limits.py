@@ -21,7 +21,7 @@ async def get_user_rate_limits(
     
     Returns current usage and remaining actions for all rate-limited activities.
     """
-    return get_all_user_limits(supabase, current_user['id'])
+    return await get_all_user_limits(supabase, current_user['id'])
 
 
 @router.get("/limits/{action_type}")
@@ -35,4 +35,4 @@ async def get_specific_rate_limit(
     Args:
         action_type: Type of action (professor_create, review_create, etc.)
     """
-    return get_remaining_actions(supabase, current_user['id'], action_type)
\ No newline at end of file
+    return await get_remaining_actions(supabase, current_user['id'], action_type)
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""Client IP resolution middleware for RateMyProf backend.
+
+Resolves the client IP once per request into request.state.client_ip, which
+the per-IP rate limits and user_activities.ip_address read. Written as a
+plain ASGI middleware rather than @app.middleware("http"), which wraps every
+request in BaseHTTPMiddleware's extra task and response stream.
+"""
+import ipaddress
+from typing import Iterable, Optional, Tuple, Union
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(value: Optional[str]) -> Tuple[IPNetwork, ...]:
+    """Parse a comma-separated list of proxy IPs/CIDR ranges (TRUSTED_PROXIES).
+
+    Args:
+        value: e.g. "10.0.0.0/8, 127.0.0.1"; empty or None trusts no proxy
+
+    Returns:
+        Tuple of networks whose forwarded headers are honoured
+    """
+    return tuple(
+        ipaddress.ip_network(entry.strip(), strict=False)
+        for entry in (value or "").split(",")
+        if entry.strip()
+    )
+
+
+def valid_ip(value: Optional[str]) -> Optional[str]:
+    """Return value normalized if it is a valid IPv4/IPv6 address, else None."""
+    if not value:
+        return None
+    try:
+        return str(ipaddress.ip_address(value.strip()))
+    except ValueError:
+        return None
+
+
+class ClientIPMiddleware:
+    """Set scope["state"]["client_ip"] for every HTTP request.
+
+    The socket peer address is used unless the peer is one of the trusted
+    proxies. Only then are x-forwarded-for (walked from the right, skipping
+    trusted hops, so client-supplied entries on the left can't spoof it) and
+    x-real-ip honoured. Values that are not a valid IP address become None,
+    as user_activities.ip_address is an INET column.
+    """
+
+    def __init__(self, app: ASGIApp, trusted_proxies: Iterable[IPNetwork] = ()) -> None:
+        self.app = app
+        self.trusted_proxies = tuple(trusted_proxies)
+
+    def _is_trusted(self, ip: Optional[str]) -> bool:
+        if ip is None or not self.trusted_proxies:
+            return False
+        address = ipaddress.ip_address(ip)
+        return any(address in network for network in self.trusted_proxies)
+
+    def resolve(self, scope: Scope) -> Optional[str]:
+        """Resolve the client IP for a request scope."""
+        client = scope.get("client")
+        peer = valid_ip(client[0] if client else None)
+        if not self._is_trusted(peer):
+            return peer
+
+        headers = Headers(scope=scope)
+        forwarded_for = headers.get("x-forwarded-for")
+        if forwarded_for:
+            hop = peer
+            for entry in reversed(forwarded_for.split(",")):
+                hop = valid_ip(entry)
+                if hop is None or not self._is_trusted(hop):
+                    return hop
+            # Every hop is a trusted proxy: the left-most one is the origin
+            return hop
+        return valid_ip(headers.get("x-real-ip")) or peer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["client_ip"] = self.resolve(scope)
+        await self.app(scope, receive, send)
+
@@ -0,0 +1,56 @@
+"""In-process cache of college rows for RateMyProf backend.
+
+Colleges are reference data that change rarely, yet every college page reads
+the same row from Supabase. Rows are cached per process by college id for a
+few minutes; writers call invalidate_college() after updating a college.
+"""
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+COLLEGE_CACHE_TTL_SECONDS = 300.0
+COLLEGE_CACHE_MAX_SIZE = 1024
+_college_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def get_college_row(supabase: Client, college_id: str) -> Optional[Dict[str, Any]]:
+    """Get a college row by id, reading through the in-process cache.
+    
+    Args:
+        supabase: Supabase client
+        college_id: College ID
+    
+    Returns:
+        Optional[Dict[str, Any]]: A copy of the college row (safe to modify),
+        or None if no college has that id
+    """
+    cached = _college_cache.get(college_id)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < COLLEGE_CACHE_TTL_SECONDS:
+        return dict(cached[1])
+
+    result = supabase.table('colleges').select('*').eq('id', college_id).execute()
+    if not result.data:
+        # Not cached, so a newly added college shows up immediately
+        return None
+
+    row = result.data[0]
+    if len(_college_cache) >= COLLEGE_CACHE_MAX_SIZE:
+        _college_cache.clear()
+    _college_cache[college_id] = (now, row)
+
+    return dict(row)
+
+
+def invalidate_college(college_id: str) -> None:
+    """Drop a college from the cache after it has been updated.
+    
+    Args:
+        college_id: College ID
+    """
+    if _college_cache.pop(college_id, None) is not None:
+        logger.debug("Invalidated cached college %s", college_id)
@@ -2,10 +2,33 @@
 
 Provides functions for flagging and moderating college reviews.
 """
+import asyncio
+import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from supabase import Client
 
+logger = logging.getLogger(__name__)
+
+
+# Flag types are static, so build them once at import time
+_COLLEGE_REVIEW_FLAG_TYPES: Tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType({"type": flag_type, "description": description})
+    for flag_type, description in (
+        ("spam", "Spam, promotional content, or advertisements"),
+        ("inappropriate", "Inappropriate or unsuitable content"),
+        ("fake", "Fake, fraudulent, or misleading review"),
+        ("offensive", "Offensive language or inappropriate content"),
+        ("harassment", "Harassment, bullying, or personal attacks"),
+        ("irrelevant", "Content not relevant to the college"),
+        ("duplicate", "Duplicate or repeated review content"),
+        ("other", "Other violation (please specify in reason)"),
+    )
+)
+
+VALID_COLLEGE_REVIEW_FLAG_TYPES = frozenset(t["type"] for t in _COLLEGE_REVIEW_FLAG_TYPES)
+
 
 def flag_college_review(
     supabase: Client,
@@ -108,7 +131,7 @@ def get_flagged_college_reviews(
                 flag['college_review'] = None
                 flag['college'] = None
         except Exception as e:
-            print(f"Error fetching details for flag {flag['id']}: {e}")
+            logger.warning("Error fetching details for flag %s: %s", flag['id'], e)
             flag['college_review'] = None
             flag['college'] = None
     
@@ -140,17 +163,20 @@ def review_college_review_flag(
     try:
         now = datetime.utcnow().isoformat()
         
-        print(f"[FLAG REVIEW] Starting review for flag_id={flag_id}, action={action}")
+        logger.debug("[FLAG REVIEW] Starting review for flag_id=%s, action=%s", flag_id, action)
         
         # Get flag details
         flag_result = supabase.table('college_review_flags').select('*').eq('id', flag_id).single().execute()
-        print(f"[FLAG REVIEW] Flag query result: {flag_result}")
+        logger.debug("[FLAG REVIEW] Flag query result: %s", flag_result)
         
         if not flag_result.data:
             raise Exception("Flag not found")
         
         flag = flag_result.data
-        print(f"[FLAG REVIEW] Flag data: status={flag.get('status')}, college_review_id={flag.get('college_review_id')}")
+        logger.debug(
+            "[FLAG REVIEW] Flag data: status=%s, college_review_id=%s",
+            flag.get('status'), flag.get('college_review_id')
+        )
         
         if flag.get('status') != 'pending':
             raise Exception(f"Flag has already been reviewed (current status: {flag.get('status')})")
@@ -164,20 +190,21 @@ def review_college_review_flag(
             'updated_at': now
         }
         
-        print(f"[FLAG REVIEW] Updating flag with data: {update_data}")
+        logger.debug("[FLAG REVIEW] Updating flag with data: %s", update_data)
         updated_flag = supabase.table('college_review_flags').update(update_data).eq('id', flag_id).execute()
-        print(f"[FLAG REVIEW] Flag updated: {updated_flag}")
+        logger.debug("[FLAG REVIEW] Flag updated: %s", updated_flag)
         
         # If flag is approved, take action on the review
         if action == 'approve_flag':
-            print(f"[FLAG REVIEW] Approving flag - marking review as flagged")
+            logger.debug("[FLAG REVIEW] Approving flag - marking review as flagged")
             # Mark college review as flagged/hidden
             review_update = supabase.table('college_reviews').update({
                 'is_flagged': True,
                 'status': 'flagged',
                 'updated_at': now
             }).eq('id', flag['college_review_id']).execute()
-            print(f"[FLAG REVIEW] Review updated: {review_update}")
+            logger.debug("[FLAG REVIEW] Review updated: %s", review_update)
+            schedule_college_rating_stats_refresh(supabase)
             
             # Try to log moderation action (optional - don't fail if it errors)
             try:
@@ -192,16 +219,14 @@ def review_college_review_flag(
                 )
             except Exception as log_error:
                 # Log error but don't fail the whole operation
-                print(f"[FLAG REVIEW] Warning: Failed to log moderation action: {log_error}")
+                logger.warning("[FLAG REVIEW] Failed to log moderation action: %s", log_error)
         
         result = updated_flag.data[0] if updated_flag.data else flag
-        print(f"[FLAG REVIEW] Completed successfully, returning: {result}")
+        logger.debug("[FLAG REVIEW] Completed successfully, returning: %s", result)
         return result
         
     except Exception as e:
-        print(f"[FLAG REVIEW] ERROR: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[FLAG REVIEW] ERROR: %s", e)
         raise
 
 
@@ -283,19 +308,63 @@ def log_moderation_action(
     return result.data[0] if result.data else log_data
 
 
-def get_valid_college_review_flag_types() -> List[Dict[str, str]]:
+def refresh_college_rating_stats(supabase: Client) -> None:
+    """Refresh the college_rating_stats materialized view (blocking).
+    
+    Runs REFRESH MATERIALIZED VIEW CONCURRENTLY, so readers are never
+    blocked. Request handlers should call schedule_college_rating_stats_refresh
+    instead, which debounces writes and keeps this off the event loop.
+    Failures are logged and ignored; the next refresh catches up, and
+    colleges missing from the view are aggregated live.
+    
+    Args:
+        supabase: Supabase client (authenticated or service_role, both may refresh)
+    """
+    try:
+        supabase.rpc('refresh_college_rating_stats', {}).execute()
+    except Exception as e:
+        logger.warning("Failed to refresh college_rating_stats: %s", e)
+
+
+# Writes within this window share one refresh of the view
+RATING_STATS_REFRESH_DELAY_SECONDS = 2.0
+_rating_stats_stale = False
+_rating_stats_refresh: Optional["asyncio.Task[None]"] = None
+
+
+async def _run_college_rating_stats_refresh(supabase: Client) -> None:
+    """Refresh the view until no write arrived during the last refresh."""
+    global _rating_stats_stale
+    while _rating_stats_stale:
+        await asyncio.sleep(RATING_STATS_REFRESH_DELAY_SECONDS)
+        _rating_stats_stale = False
+        await asyncio.to_thread(refresh_college_rating_stats, supabase)
+
+
+def schedule_college_rating_stats_refresh(supabase: Client) -> None:
+    """Schedule a debounced refresh of the college_rating_stats view.
+    
+    Called after every write that changes which reviews are approved or their
+    ratings (create, edit, delete, moderation, account deletion). A burst of
+    writes triggers a single refresh RATING_STATS_REFRESH_DELAY_SECONDS later,
+    run in a worker thread; a write that lands during a refresh triggers one
+    more. Must be called from the event loop thread.
+    
+    Args:
+        supabase: Supabase client used for the refresh RPC
+    """
+    global _rating_stats_stale, _rating_stats_refresh
+    _rating_stats_stale = True
+    if _rating_stats_refresh is None or _rating_stats_refresh.done():
+        _rating_stats_refresh = asyncio.get_running_loop().create_task(
+            _run_college_rating_stats_refresh(supabase)
+        )
+
+
+def get_valid_college_review_flag_types() -> Tuple[Mapping[str, str], ...]:
     """Get list of valid flag types for college reviews.
     
     Returns:
-        List of flag types with descriptions
+        Immutable sequence of flag types with descriptions
     """
-    return [
-        {"type": "spam", "description": "Spam, promotional content, or advertisements"},
-        {"type": "inappropriate", "description": "Inappropriate or unsuitable content"},
-        {"type": "fake", "description": "Fake, fraudulent, or misleading review"},
-        {"type": "offensive", "description": "Offensive language or inappropriate content"},
-        {"type": "harassment", "description": "Harassment, bullying, or personal attacks"},
-        {"type": "irrelevant", "description": "Content not relevant to the college"},
-        {"type": "duplicate", "description": "Duplicate or repeated review content"},
-        {"type": "other", "description": "Other violation (please specify in reason)"}
-    ]
\ No newline at end of file
+    return _COLLEGE_REVIEW_FLAG_TYPES
@@ -0,0 +1,42 @@
+"""orjson-backed JSON response for RateMyProf backend.
+
+orjson serializes several times faster than the stdlib json module used by
+Starlette's JSONResponse, and handles datetime and UUID values natively so
+model to_dict() methods can return them as-is. Defined here rather than using
+FastAPI's ORJSONResponse, which newer FastAPI releases deprecate.
+"""
+from typing import Any, Iterable, Iterator
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders its content with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def iter_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items as a JSON array one element at a time.
+
+    For StreamingResponse bodies over large result sets (e.g.
+    src.models.base.iter_as_dicts), so the full list is never held in memory.
+    Elements are encoded exactly as ORJSONResponse would encode them.
+
+    Args:
+        items: Values to encode as the array elements
+
+    Yields:
+        bytes: Chunks of the JSON array
+    """
+    separator = b"["
+    for item in items:
+        yield separator + orjson.dumps(item, option=_ORJSON_OPTIONS)
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
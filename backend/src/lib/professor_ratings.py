@@ -0,0 +1,81 @@
+"""Professor rating aggregates for RateMyProf backend.
+
+Professor average_rating/total_reviews are maintained in Postgres by the
+trg_reviews_professor_ratings trigger (scripts/maintain_professor_ratings.sql).
+The app checks for the trigger at startup; on a database where the script
+has not been applied yet, review writers fall back to recomputing the
+aggregates in Python so ratings never silently stop updating.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+# Set by detect_professor_ratings_trigger() at startup; None until checked,
+# which is treated like a missing trigger
+_trigger_installed: Optional[bool] = None
+
+
+async def detect_professor_ratings_trigger(supabase: Client) -> bool:
+    """Check whether trg_reviews_professor_ratings is installed.
+
+    Calls the professor_ratings_trigger_installed() function that ships with
+    the trigger script, so a database without the script reports False.
+
+    Args:
+        supabase: Supabase client
+
+    Returns:
+        bool: True if the trigger maintains professor ratings
+    """
+    global _trigger_installed
+    try:
+        result = await asyncio.to_thread(
+            supabase.rpc('professor_ratings_trigger_installed', {}).execute
+        )
+        _trigger_installed = result.data is True
+    except Exception as e:
+        logger.debug("professor_ratings_trigger_installed() failed: %s", e)
+        _trigger_installed = False
+
+    if not _trigger_installed:
+        logger.warning(
+            "trg_reviews_professor_ratings is not installed; recomputing professor "
+            "ratings in Python. Run backend/scripts/maintain_professor_ratings.sql."
+        )
+    return _trigger_installed
+
+
+def _recompute_professor_ratings(supabase: Client, professor_id: str) -> None:
+    """Recompute a professor's average rating and review count from approved reviews."""
+    approved_reviews = supabase.table('reviews').select('overall_rating').eq(
+        'professor_id', professor_id
+    ).eq('status', 'approved').execute()
+
+    reviews = approved_reviews.data or []
+    total_reviews = len(reviews)
+    average_rating = sum(r['overall_rating'] for r in reviews) / total_reviews if reviews else 0.0
+
+    supabase.table('professors').update({
+        'average_rating': round(average_rating, 1),
+        'total_reviews': total_reviews
+    }).eq('id', professor_id).execute()
+
+
+async def sync_professor_ratings(supabase: Client, professor_id: str) -> None:
+    """Bring a professor's rating aggregates up to date after a review write.
+
+    A no-op when the trigger is installed, since it already applied the change
+    in the same transaction as the write. Otherwise the aggregates are
+    recomputed in a worker thread.
+
+    Args:
+        supabase: Supabase client allowed to update the professor
+        professor_id: Professor whose reviews changed
+    """
+    if _trigger_installed:
+        return
+    await asyncio.to_thread(_recompute_professor_ratings, supabase, professor_id)
@@ -48,30 +48,22 @@ def increment_action_count(
     user_id: str,
     action_type: str,
     target_id: Optional[str] = None,
-    request: Optional[Request] = None
+    ip_address: Optional[str] = None
 ) -> UserActivity:
     """Increment the action count for a user.
     
+    Does not commit; commit the session together with the action it records.
+    
     Args:
         session: Database session
         user_id: User UUID
         action_type: Type of action performed
         target_id: Optional ID of target object (professor_id, etc.)
-        request: Optional FastAPI request object for IP tracking
+        ip_address: Optional client IP address (request.state.client_ip)
         
     Returns:
         UserActivity record
     """
-    # Get IP address from request if available
-    ip_address = None
-    if request:
-        # Try to get real IP from headers (in case of proxy/load balancer)
-        ip_address = (
-            request.headers.get("x-forwarded-for") or
-            request.headers.get("x-real-ip") or
-            getattr(request.client, "host", None) if hasattr(request, "client") else None
-        )
-    
     return UserActivity.increment_daily_count(
         session, user_id, action_type, target_id, ip_address
     )
@@ -115,13 +107,23 @@ def get_all_user_limits(session: Session, user_id: str) -> dict:
     Returns:
         Dict with all action limits and current counts
     """
-    result = {}
+    today = date.today()
+    today_iso = today.isoformat()
+    counts = UserActivity.get_daily_counts(session, user_id, today)
     
-    for action_type in DAILY_LIMITS.keys():
-        result[action_type] = get_remaining_actions(session, user_id, action_type)
+    result = {}
+    for action_type, limit in DAILY_LIMITS.items():
+        current_count = counts.get(action_type, 0)
+        result[action_type] = {
+            "action_type": action_type,
+            "current_count": current_count,
+            "daily_limit": limit,
+            "remaining": max(0, limit - current_count),
+            "date": today_iso
+        }
     
     return {
         "user_id": user_id,
-        "date": date.today().isoformat(),
+        "date": today_iso,
         "limits": result
     }
\ No newline at end of file
@@ -2,22 +2,91 @@
 
 Provides functions to check and enforce rate limits for user actions using Supabase.
 """
-from datetime import date, datetime
-from typing import Optional
+import time
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from fastapi import HTTPException, status, Request
+from postgrest.exceptions import APIError
 from supabase import Client
 
+from src.lib.database import get_async_session_factory, get_rest_client
+from src.lib.rate_limits import DAILY_LIMITS
 
-# Rate limiting constants
-DAILY_LIMITS = {
-    'professor_create': 3,
-    'review_create': 10,  # Future use
-    'college_review_create': 5,  # Future use
-    'flag_create': 20,  # Future use
-}
+if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import TextClause
 
+# SQLSTATE raised by the daily limit trigger
+# (see scripts/create_daily_limits_trigger.sql)
+RATE_LIMIT_ERROR_CODE = 'P0001'
 
-def check_rate_limit(
+# Short-lived cache of daily counts keyed by (user_id, action_type, ISO date),
+# absorbing repeated reads within one request flow. The daily limit trigger
+# stays the source of truth, so a briefly stale count can't bypass the limit.
+COUNT_CACHE_TTL_SECONDS = 1.0
+COUNT_CACHE_MAX_SIZE = 10_000
+_count_cache: Dict[Tuple[str, str, str], Tuple[float, int]] = {}
+
+_DAILY_COUNT_QUERY = (
+    "SELECT action_count FROM user_activities "
+    "WHERE user_id = :user_id AND action_type = :action_type AND action_date = :action_date"
+)
+
+_DAILY_COUNTS_QUERY = (
+    "SELECT action_type, action_count FROM user_activities "
+    "WHERE user_id = :user_id AND action_date = :action_date"
+)
+
+
+@lru_cache(maxsize=None)
+def _sql(query: str) -> "TextClause":
+    """Get the text() construct for one of the queries above, built once.
+    
+    Reusing the same construct skips re-parsing its bind parameters on every
+    call and keeps SQLAlchemy's compiled statement cache hitting. SQLAlchemy
+    is imported on first use, so deployments without the pooler never load it.
+    
+    Args:
+        query: SQL string with :name bind parameters
+        
+    Returns:
+        TextClause: Reusable text() construct
+    """
+    from sqlalchemy import text
+    return text(query)
+
+
+def _rest_headers(supabase: Client) -> Dict[str, str]:
+    """Get the auth headers of a Supabase client for use with the async REST client.
+    
+    Args:
+        supabase: Supabase client (anon, service role or user-authenticated)
+        
+    Returns:
+        Dict with the client's apikey and Authorization headers
+    """
+    headers = supabase.postgrest.headers
+    return {'apikey': headers['apikey'], 'Authorization': headers['Authorization']}
+
+
+# (date, ISO string) for the current day, refreshed by _today() on rollover
+_today_cache: Tuple[date, str] = (date.min, "")
+
+
+def _today() -> Tuple[date, str]:
+    """Get today's date along with its ISO string, formatting it once per day.
+    
+    Returns:
+        Tuple of today's date and its ISO 8601 representation
+    """
+    global _today_cache
+    today = date.today()
+    if _today_cache[0] != today:
+        _today_cache = (today, today.isoformat())
+    return _today_cache
+
+
+async def check_rate_limit(
     supabase: Client, 
     user_id: str, 
     action_type: str, 
@@ -41,7 +110,7 @@ def check_rate_limit(
         return
     
     # Check current daily count
-    current_count = get_daily_count(supabase, user_id, action_type)
+    current_count = await get_daily_count(supabase, user_id, action_type)
     
     if current_count >= limit:
         raise HTTPException(
@@ -50,9 +119,12 @@ def check_rate_limit(
         )
 
 
-def get_daily_count(supabase: Client, user_id: str, action_type: str, target_date: Optional[date] = None) -> int:
+async def get_daily_count(supabase: Client, user_id: str, action_type: str, target_date: Optional[date] = None) -> int:
     """Get count of actions performed by user on specific date.
     
+    Queries Postgres directly through the connection pooler when it is
+    configured, falling back to an async PostgREST request otherwise.
+    
     Args:
         supabase: Supabase client
         user_id: User UUID
@@ -63,99 +135,189 @@ def get_daily_count(supabase: Client, user_id: str, action_type: str, target_dat
         Number of actions performed on the date
     """
     if target_date is None:
-        target_date = date.today()
+        target_date, target_iso = _today()
+    else:
+        target_iso = target_date.isoformat()
+    
+    cache_key = (user_id, action_type, target_iso)
+    cached = _count_cache.get(cache_key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < COUNT_CACHE_TTL_SECONDS:
+        return cached[1]
     
     try:
-        result = supabase.table('user_activities').select('action_count').eq(
-            'user_id', user_id
-        ).eq(
-            'action_type', action_type
-        ).eq(
-            'action_date', target_date.isoformat()
-        ).single().execute()
-        
-        return result.data['action_count'] if result.data else 0
+        session_factory = get_async_session_factory()
+        if session_factory is not None:
+            async with session_factory() as session:
+                count = await session.scalar(_sql(_DAILY_COUNT_QUERY), {
+                    'user_id': user_id,
+                    'action_type': action_type,
+                    'action_date': target_date,
+                }) or 0
+        else:
+            response = await get_rest_client().get('/user_activities', params={
+                'select': 'action_count',
+                'user_id': f'eq.{user_id}',
+                'action_type': f'eq.{action_type}',
+                'action_date': f'eq.{target_iso}',
+            }, headers=_rest_headers(supabase))
+            response.raise_for_status()
+            rows = response.json()
+            count = rows[0]['action_count'] if rows else 0
     except Exception:
         # No record found or error - assume 0 count
         return 0
+    
+    if len(_count_cache) >= COUNT_CACHE_MAX_SIZE:
+        _count_cache.clear()
+    _count_cache[cache_key] = (now, count)
+    
+    return count
+
+
+async def get_daily_counts(supabase: Client, user_id: str, target_date: Optional[date] = None) -> Dict[str, int]:
+    """Get counts for every action type performed by user on specific date.
+    
+    Fetches all of the user's activity rows for the date in one query,
+    instead of one query per action type.
+    
+    Args:
+        supabase: Supabase client
+        user_id: User UUID
+        target_date: Date to check (defaults to today)
+        
+    Returns:
+        Dict mapping action type to number of actions performed on the date
+    """
+    if target_date is None:
+        target_date, target_iso = _today()
+    else:
+        target_iso = target_date.isoformat()
+    
+    try:
+        session_factory = get_async_session_factory()
+        if session_factory is not None:
+            async with session_factory() as session:
+                rows = (await session.execute(_sql(_DAILY_COUNTS_QUERY), {
+                    'user_id': user_id,
+                    'action_date': target_date,
+                })).all()
+            return {row.action_type: row.action_count for row in rows}
+        
+        response = await get_rest_client().get('/user_activities', params={
+            'select': 'action_type,action_count',
+            'user_id': f'eq.{user_id}',
+            'action_date': f'eq.{target_iso}',
+        }, headers=_rest_headers(supabase))
+        response.raise_for_status()
+        
+        return {row['action_type']: row['action_count'] for row in response.json()}
+    except Exception:
+        # No records found or error - assume 0 counts
+        return {}
 
 
-def increment_action_count(
+def invalidate_daily_count(user_id: str, action_type: str) -> None:
+    """Drop today's cached count so the next read sees a new increment.
+    
+    Args:
+        user_id: User UUID
+        action_type: Type of action that was counted
+    """
+    _count_cache.pop((user_id, action_type, _today()[1]), None)
+
+
+async def call_rate_limited_rpc(supabase: Client, function: str, params: Dict[str, Any]) -> Any:
+    """Call a Postgres function that may hit the daily limit trigger.
+    
+    Posts to PostgREST through the shared async REST client, with the auth
+    headers of the given Supabase client so RLS applies as usual.
+    
+    Args:
+        supabase: Supabase client whose auth headers are used
+        function: Name of the Postgres function
+        params: Function arguments
+        
+    Returns:
+        The decoded JSON response body
+        
+    Raises:
+        HTTPException: If the daily limit trigger rejected the call
+        APIError: If PostgREST rejects the call for any other reason
+    """
+    response = await get_rest_client().post(
+        f'/rpc/{function}', json=params, headers=_rest_headers(supabase)
+    )
+    
+    if response.is_error:
+        try:
+            error = APIError(response.json())
+        except ValueError:
+            # Non-JSON error body, e.g. from a proxy in front of PostgREST
+            error = APIError({'message': response.text})
+        if error.code == RATE_LIMIT_ERROR_CODE:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"{error.message} Please try again tomorrow."
+            )
+        raise error
+    
+    return response.json()
+
+
+async def increment_action_count(
     supabase: Client,
     user_id: str,
     action_type: str,
     target_id: Optional[str] = None,
-    request: Optional[Request] = None
+    ip_address: Optional[str] = None
 ) -> dict:
     """Increment the action count for a user.
     
+    The database enforces the daily limit on this write, so a single
+    roundtrip both checks and consumes one unit of the user's quota.
+    
     Args:
         supabase: Supabase client
         user_id: User UUID
         action_type: Type of action performed
         target_id: Optional ID of target object (professor_id, etc.)
-        request: Optional FastAPI request object for IP tracking
+        ip_address: Optional client IP address (request.state.client_ip)
         
     Returns:
-        UserActivity record
+        Dict describing the updated UserActivity record
+        
+    Raises:
+        HTTPException: If the daily limit for the action is exceeded
+        APIError: If PostgREST rejects the call for any other reason
     """
-    today = date.today()
-    now = datetime.utcnow()
-    
-    # Get IP address from request if available
-    ip_address = None
-    if request:
-        # Try to get real IP from headers (in case of proxy/load balancer)
-        ip_address = (
-            request.headers.get("x-forwarded-for") or
-            request.headers.get("x-real-ip") or
-            getattr(request.client, "host", None) if hasattr(request, "client") else None
-        )
+    _, today_iso = _today()
     
-    try:
-        # Try to get existing record for today
-        existing = supabase.table('user_activities').select('*').eq(
-            'user_id', user_id
-        ).eq(
-            'action_type', action_type
-        ).eq(
-            'action_date', today.isoformat()
-        ).single().execute()
-        
-        if existing.data:
-            # Update existing record
-            updated = supabase.table('user_activities').update({
-                'action_count': existing.data['action_count'] + 1,
-                'last_action_at': now.isoformat(),
-                'target_id': target_id,
-                'ip_address': ip_address,
-                'updated_at': now.isoformat()
-            }).eq('id', existing.data['id']).execute()
-            
-            return updated.data[0] if updated.data else existing.data
-            
-    except Exception:
-        # No existing record found, create new one
-        pass
+    # Single atomic roundtrip: INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+    # (see scripts/create_increment_user_activity_function.sql). The daily
+    # limit trigger rejects the write once the limit would be exceeded.
+    action_count = await call_rate_limited_rpc(supabase, 'increment_user_activity', {
+        'p_user_id': user_id,
+        'p_action_type': action_type,
+        'p_action_date': today_iso,
+        'p_target_id': target_id,
+        'p_ip_address': ip_address,
+    })
     
-    # Create new record
-    new_activity = {
+    # Next read must see the new count
+    invalidate_daily_count(user_id, action_type)
+    
+    return {
         'user_id': user_id,
         'action_type': action_type,
-        'action_date': today.isoformat(),
-        'action_count': 1,
-        'last_action_at': now.isoformat(),
+        'action_date': today_iso,
+        'action_count': action_count if isinstance(action_count, int) else 1,
         'target_id': target_id,
         'ip_address': ip_address,
-        'created_at': now.isoformat(),
-        'updated_at': now.isoformat()
     }
-    
-    result = supabase.table('user_activities').insert(new_activity).execute()
-    return result.data[0] if result.data else new_activity
 
 
-def get_remaining_actions(
+async def get_remaining_actions(
     supabase: Client,
     user_id: str,
     action_type: str
@@ -170,8 +332,9 @@ def get_remaining_actions(
     Returns:
         Dict with current count, limit, and remaining actions
     """
+    _, today_iso = _today()
     limit = DAILY_LIMITS.get(action_type, 0)
-    current_count = get_daily_count(supabase, user_id, action_type)
+    current_count = await get_daily_count(supabase, user_id, action_type)
     remaining = max(0, limit - current_count)
     
     return {
@@ -179,11 +342,11 @@ def get_remaining_actions(
         "current_count": current_count,
         "daily_limit": limit,
         "remaining": remaining,
-        "date": date.today().isoformat()
+        "date": today_iso
     }
 
 
-def get_all_user_limits(supabase: Client, user_id: str) -> dict:
+async def get_all_user_limits(supabase: Client, user_id: str) -> dict:
     """Get all rate limit information for a user.
     
     Args:
@@ -193,13 +356,22 @@ def get_all_user_limits(supabase: Client, user_id: str) -> dict:
     Returns:
         Dict with all action limits and current counts
     """
-    result = {}
+    _, today_iso = _today()
+    counts = await get_daily_counts(supabase, user_id)
     
-    for action_type in DAILY_LIMITS.keys():
-        result[action_type] = get_remaining_actions(supabase, user_id, action_type)
+    result = {}
+    for action_type, limit in DAILY_LIMITS.items():
+        current_count = counts.get(action_type, 0)
+        result[action_type] = {
+            "action_type": action_type,
+            "current_count": current_count,
+            "daily_limit": limit,
+            "remaining": max(0, limit - current_count),
+            "date": today_iso
+        }
     
     return {
         "user_id": user_id,
-        "date": date.today().isoformat(),
+        "date": today_iso,
         "limits": result
     }
\ No newline at end of file
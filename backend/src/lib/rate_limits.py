@@ -0,0 +1,14 @@
+"""Daily rate limits for RateMyProf user actions.
+
+Shared by the Supabase and SQLAlchemy rate limiting helpers and mirrored in
+the daily_limits table (scripts/create_daily_limits_trigger.sql).
+"""
+from types import MappingProxyType
+
+# Rate limiting constants (read-only, so no request can change them at runtime)
+DAILY_LIMITS = MappingProxyType({
+    'professor_create': 3,
+    'review_create': 10,  # Future use
+    'college_review_create': 5,  # Future use
+    'flag_create': 20,  # Future use
+})
@@ -0,0 +1,88 @@
+"""Trusted host middleware for RateMyProf backend.
+
+Drop-in replacement for Starlette's TrustedHostMiddleware that splits the
+allowed hosts into an exact-match set and a tuple of wildcard suffixes once at
+startup, instead of scanning the whole pattern list on every request.
+"""
+from typing import Optional, Sequence
+
+from starlette.datastructures import URL, Headers
+from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.responses import PlainTextResponse, RedirectResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def parse_host(host_header: Optional[str]) -> Optional[str]:
+    """Get the host part of a Host header, without the port.
+
+    Parsed here rather than with Starlette's private parse_host_header.
+    Bracketed IPv6 literals keep their brackets ("[::1]:8000" -> "[::1]").
+
+    Args:
+        host_header: Host header value, or None if it was not sent
+
+    Returns:
+        Lower-cased host, or None if the header is missing or malformed
+    """
+    if not host_header:
+        return None
+    if host_header.startswith("["):
+        end = host_header.find("]")
+        if end == -1:
+            return None
+        host, port = host_header[:end + 1], host_header[end + 1:]
+        if port and not port.startswith(":"):
+            return None
+        port = port[1:]
+    else:
+        host, _, port = host_header.partition(":")
+    if not host or (port and not port.isdigit()) or host_header.endswith(":"):
+        return None
+    return host.lower()
+
+
+class FastTrustedHostMiddleware(TrustedHostMiddleware):
+    """TrustedHostMiddleware with O(1) exact-host checks.
+
+    Exact hosts are looked up in a frozenset and '*.example.com' patterns are
+    matched with a single str.endswith call over all suffixes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allowed_hosts: Optional[Sequence[str]] = None,
+        www_redirect: bool = True,
+    ) -> None:
+        super().__init__(app, allowed_hosts=allowed_hosts, www_redirect=www_redirect)
+        self.exact_hosts = frozenset(
+            pattern for pattern in self.allowed_hosts if not pattern.startswith("*")
+        )
+        # "*.railway.app" -> ".railway.app"
+        self.wildcard_suffixes = tuple(
+            pattern[1:] for pattern in self.allowed_hosts if pattern.startswith("*.")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.allow_any or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        host = parse_host(headers.get("host"))
+        if host is None:
+            await PlainTextResponse("Invalid host header", status_code=400)(scope, receive, send)
+            return
+
+        if host in self.exact_hosts or host.endswith(self.wildcard_suffixes):
+            await self.app(scope, receive, send)
+            return
+
+        response: Response
+        if self.www_redirect and "www." + host in self.exact_hosts:
+            url = URL(scope=scope)
+            redirect_url = url.replace(netloc="www." + url.netloc)
+            response = RedirectResponse(url=str(redirect_url))
+        else:
+            response = PlainTextResponse("Invalid host header", status_code=400)
+        await response(scope, receive, send)
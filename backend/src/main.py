@@ -3,19 +3,22 @@
 This module sets up the FastAPI application with all routes, middleware,
 and database configuration for the RateMyProf India platform.
 """
+import logging
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Dict
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 import uvicorn
 
-from src.lib.database import init_db, close_db
+from src.lib.client_ip import ClientIPMiddleware, parse_trusted_proxies
+from src.lib.database import init_db, close_db, get_supabase
+from src.lib.professor_ratings import detect_professor_ratings_trigger
+from src.lib.orjson_response import ORJSONResponse
+from src.lib.trusted_host import FastTrustedHostMiddleware
 from src.api.professors_simple import router as professors_router  # Using simplified version
 from src.api.reviews import router as reviews_router
 from src.api.auth import router as auth_router
@@ -25,6 +28,28 @@ from src.api.moderation import router as moderation_router
 from src.api.user_limits import router as user_limits_router
 from src.api.college_review_moderation import router as college_review_moderation_router
 
+logger = logging.getLogger(__name__)
+
+# Environment settings are read once at import time
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+PORT = int(os.getenv("PORT", 8000))
+# Proxies/load balancers (IPs or CIDR ranges, comma-separated) whose
+# x-forwarded-for / x-real-ip headers are trusted
+TRUSTED_PROXIES = parse_trusted_proxies(os.getenv("TRUSTED_PROXIES"))
+
+# CORS origins, deduplicated (FRONTEND_URL often repeats a hardcoded entry)
+ALLOWED_ORIGINS = tuple(dict.fromkeys([
+    "http://localhost:3000",  # Next.js development (default)
+    "http://localhost:3001",  # Next.js development (alternative port)
+    "http://localhost:3002",  # Next.js development (backup port)
+    "https://ratemyprof-india.vercel.app",  # Production frontend
+    "https://ratemyprof.me",  # Production custom domain
+    "http://ratemyprof.me",  # Production custom domain (http)
+    FRONTEND_URL,  # Configurable frontend URL
+]))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -34,16 +59,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Initializes Supabase connection and performs cleanup.
     """
     # Startup
-    print("🚀 Starting RateMyProf API server...")
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    logger.info("Starting RateMyProf API server...")
     await init_db()
-    print("✅ Supabase connection initialized")
+    logger.info("Supabase connection initialized")
+    await detect_professor_ratings_trigger(get_supabase())
     
     yield
     
     # Shutdown
-    print("🛑 Shutting down RateMyProf API server...")
+    logger.info("Shutting down RateMyProf API server...")
     await close_db()
-    print("✅ Application shutdown complete")
+    logger.info("Application shutdown complete")
 
 
 # Create FastAPI application
@@ -51,32 +81,28 @@ app = FastAPI(
     title="RateMyProf India API",
     description="Backend API for the RateMyProf India platform - helping students find and review professors across Indian colleges and universities.",
     version="1.0.0",
-    docs_url="/docs" if os.getenv("ENVIRONMENT") != "production" else None,
-    redoc_url="/redoc" if os.getenv("ENVIRONMENT") != "production" else None,
+    docs_url="/docs" if ENVIRONMENT != "production" else None,
+    redoc_url="/redoc" if ENVIRONMENT != "production" else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # Next.js development (default)
-        "http://localhost:3001",  # Next.js development (alternative port)
-        "http://localhost:3002",  # Next.js development (backup port)
-        "https://ratemyprof-india.vercel.app",  # Production frontend
-        "https://ratemyprof.me",  # Production custom domain
-        "http://ratemyprof.me",  # Production custom domain (http)
-        os.getenv("FRONTEND_URL", "http://localhost:3000"),  # Configurable frontend URL
-    ],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["*"],
 )
 
+# Resolve request.state.client_ip; forwarded headers only count from TRUSTED_PROXIES
+app.add_middleware(ClientIPMiddleware, trusted_proxies=TRUSTED_PROXIES)
+
 # Trusted host middleware for production
-if os.getenv("ENVIRONMENT") == "production":
+if ENVIRONMENT == "production":
     app.add_middleware(
-        TrustedHostMiddleware,
+        FastTrustedHostMiddleware,
         allowed_hosts=[
             "api.ratemyprof-india.com",
             "*.railway.app",  # Railway deployment
@@ -85,6 +111,20 @@ if os.getenv("ENVIRONMENT") == "production":
     )
 
 
+def _password_validation_message(message: str) -> str:
+    """Reword the minimum-length password error; pass others through."""
+    if 'at least 8 characters' in message:
+        return "Password must be at least 8 characters long"
+    return message
+
+
+# Field-specific rewording of validation errors; other fields use the raw message
+_VALIDATION_MESSAGES: Dict[str, Callable[[str], str]] = {
+    'email': lambda message: "Invalid email format",
+    'password': _password_validation_message,
+}
+
+
 # Global exception handler
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -94,21 +134,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         field = error.get('loc', ['unknown'])[-1]
         message = error.get('msg', 'Validation error')
         
-        if field == 'email':
-            error_details.append("Invalid email format")
-        elif field == 'password':
-            if 'at least 8 characters' in message:
-                error_details.append("Password must be at least 8 characters long")
-            else:
-                error_details.append(message)
-        elif field == 'name':
-            error_details.append(message)
-        elif field == 'college_id':
-            error_details.append(message)
-        else:
-            error_details.append(message)
+        format_message = _VALIDATION_MESSAGES.get(field)
+        error_details.append(format_message(message) if format_message else message)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "validation_error",
@@ -120,7 +149,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with consistent error format."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,  # Make error message the content
@@ -134,9 +163,9 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
     # Log the error in production
-    print(f"Unexpected error: {exc}")
+    logger.exception("Unexpected error: %s", exc)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": True,
@@ -155,7 +184,7 @@ async def health_check():
         "status": "healthy",
         "service": "RateMyProf India API",
         "version": "1.0.0",
-        "environment": os.getenv("ENVIRONMENT", "development"),
+        "environment": ENVIRONMENT,
     }
 
 
@@ -276,7 +305,7 @@ if __name__ == "__main__":
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
-        port=int(os.getenv("PORT", 8000)),
+        port=PORT,
         reload=True if os.getenv("ENVIRONMENT") == "development" else False,
         log_level="info",
     )
@@ -8,7 +8,7 @@ This package contains all SQLAlchemy ORM models for the platform:
 - ReviewFlag: Content moderation flags
 - ModerationLog: Audit trail for moderation actions
 
-All models inherit from the Base class defined in src.lib.database
+All models inherit from the Base class defined in src.models.base
 and follow consistent patterns for:
 - UUID primary keys
 - Timestamp tracking (created_at, updated_at)
@@ -26,6 +26,7 @@ from src.models.review_flag import ReviewFlag
 from src.models.moderation_log import ModerationLog
 from src.models.user_activity import UserActivity
 from src.models.college_review_flag import CollegeReviewFlag
+from src.models.college_rating_stats import CollegeRatingStats
 
 # Make models available at package level
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     "ModerationLog",
     "UserActivity",
     "CollegeReviewFlag",
+    "CollegeRatingStats",
 ]
@@ -0,0 +1,127 @@
+"""Declarative base for RateMyProf SQLAlchemy models.
+
+Kept separate from src.lib.database so API code that only talks to Supabase
+doesn't import the SQLAlchemy ORM.
+"""
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.orm import declarative_base
+
+# Base class for models (keeping for now, might migrate to Supabase tables later)
+Base = declarative_base()
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land on the right-most B-tree pages instead of random ones, which
+    avoids page splits on insert-heavy tables. The remaining 74 bits are
+    random. Matches uuid_generate_v7() in scripts/use_uuidv7_primary_keys.sql.
+    
+    Returns:
+        uuid.UUID: New UUIDv7
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def column_values(instance: Any) -> Dict[str, Any]:
+    """Get an instance's column values straight from its __dict__.
+    
+    Reading from __dict__ skips the InstrumentedAttribute descriptor on every
+    column, which adds up in to_dict() for list responses. Any expired or
+    not-yet-loaded columns are loaded first; columns never set on an unsaved
+    instance are simply absent, so read values with .get().
+    
+    Args:
+        instance: Mapped model instance
+        
+    Returns:
+        Dict[str, Any]: The instance __dict__ (do not mutate)
+    """
+    state = inspect(instance)
+    for key in state.unloaded.intersection(state.mapper.column_attrs.keys()):
+        getattr(instance, key)
+    return instance.__dict__
+
+
+def _row_dict_select(model: Any, criteria: Tuple[Any, ...], order_by: Any) -> Select:
+    """Build the column SELECT shared by list_as_dicts and iter_as_dicts."""
+    excluded = getattr(model, "_row_dict_excluded_columns", frozenset())
+    if order_by is None:
+        order_by = model.created_at.desc()
+    return (
+        select(*(column for column in model.__table__.columns if column.name not in excluded))
+        .where(*criteria)
+        .order_by(order_by)
+    )
+
+
+def list_as_dicts(
+    session,
+    model: Any,
+    *criteria,
+    order_by: Any = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """List a model's rows as plain dicts.
+    
+    Selects the table columns directly instead of loading ORM instances,
+    so list endpoints skip per-row object hydration and to_dict() calls.
+    Columns named in the model's _row_dict_excluded_columns are not
+    selected (e.g. CollegeReview.student_id, which keeps reviews anonymous).
+    
+    Args:
+        session: Database session
+        model: Mapped model class, e.g. CollegeReview
+        *criteria: Optional filter expressions, e.g. CollegeReview.status == "pending"
+        order_by: Sort order (default: newest first by created_at)
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip
+        
+    Returns:
+        List[Dict[str, Any]]: One dict per row, keyed by column name
+    """
+    result = session.execute(
+        _row_dict_select(model, criteria, order_by).limit(limit).offset(offset)
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+def iter_as_dicts(
+    session,
+    model: Any,
+    *criteria,
+    order_by: Any = None,
+    batch_size: int = 256,
+) -> Iterator[Dict[str, Any]]:
+    """Stream a model's rows as plain dicts.
+    
+    Like list_as_dicts, but rows are fetched from a server-side cursor
+    batch_size at a time, so responses covering thousands of rows (e.g. all
+    approved reviews of a professor) can be encoded with iter_json_array and
+    sent as they are read instead of being built as one list.
+    
+    Args:
+        session: Database session
+        model: Mapped model class, e.g. Review
+        *criteria: Optional filter expressions, e.g. Review.professor_id == professor_id
+        order_by: Sort order (default: newest first by created_at)
+        batch_size: Number of rows fetched per round trip
+        
+    Yields:
+        Dict[str, Any]: One dict per row, keyed by column name
+    """
+    result = session.execute(
+        _row_dict_select(model, criteria, order_by).execution_options(yield_per=batch_size)
+    )
+    for row in result.mappings():
+        yield dict(row)
@@ -3,21 +3,30 @@
 Represents educational institutions in India where professors teach and students study.
 Includes location data, verification status, and relationships to professors and users.
 """
-from datetime import datetime
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from typing import Optional, List, Tuple, TYPE_CHECKING
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, select
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.sql import func
-import uuid
 
-from src.lib.database import Base
+from src.models.base import Base
 
 if TYPE_CHECKING:
     from src.models.user import User
     from src.models.professor import Professor
 
 
+def _format_display_name(name: str, short_name: Optional[str]) -> str:
+    """Format a college name with its short name if available."""
+    if short_name:
+        return f"{name} ({short_name})"
+    return name
+
+
+def _format_location(city: str, state: str, country: str) -> str:
+    """Format a college location string."""
+    return f"{city}, {state}, {country}"
+
+
 class College(Base):
     """College model representing educational institutions.
     
@@ -45,12 +54,13 @@ class College(Base):
     Relationships:
         professors: Professors who teach at this college
         users: Students who belong to this college
+        rating_stats: Precomputed review rating rollup (college_rating_stats view)
     """
     
     __tablename__ = "colleges"
     
     # Primary key
-    id = Column(String(50), primary_key=True, index=True)  # College code like VU-PUNE-001
+    id = Column(String(50), primary_key=True)  # College code like VU-PUNE-001
     
     # Basic information
     name = Column(String(255), nullable=False, index=True)
@@ -85,6 +95,12 @@ class College(Base):
     professors = relationship("Professor", back_populates="college", cascade="all, delete-orphan")
     users = relationship("User", backref="college")
     college_reviews = relationship("CollegeReview", back_populates="college", cascade="all, delete-orphan")
+    rating_stats = relationship(
+        "CollegeRatingStats",
+        primaryjoin="College.id == foreign(CollegeRatingStats.college_id)",
+        uselist=False,
+        viewonly=True,
+    )
     
     def __repr__(self) -> str:
         """String representation of College."""
@@ -93,58 +109,107 @@ class College(Base):
     @property
     def display_name(self) -> str:
         """Get display name with short name if available."""
-        if self.short_name:
-            return f"{self.name} ({self.short_name})"
-        return self.name
+        return _format_display_name(self.name, self.short_name)
     
     @property
     def location(self) -> str:
         """Get formatted location string."""
-        return f"{self.city}, {self.state}, {self.country}"
+        return _format_location(self.city, self.state, self.country)
     
     def get_stats(self) -> dict:
         """Get college statistics.
         
+        Professors and users are counted with SELECT COUNT(*) queries rather
+        than by loading the full collections just to take their length.
+        
         Returns:
             dict: Statistics about professors and reviews
         """
+        from src.models.professor import Professor
+        from src.models.user import User
+        
+        session = object_session(self)
+        if session is None:
+            # Detached instance - fall back to whatever collections are loaded
+            professors_count = len(self.professors) if self.professors else 0
+            users_count = len(self.users) if self.users else 0
+        else:
+            professors_count = session.scalar(
+                select(func.count(Professor.id)).where(Professor.college_id == self.id)
+            )
+            users_count = session.scalar(
+                select(func.count(User.id)).where(User.college_id == self.id)
+            )
+        
         return {
             "total_professors": self.total_professors,
             "total_students": self.total_students,
-            "professors_count": len(self.professors) if self.professors else 0,
-            "users_count": len(self.users) if self.users else 0,
+            "professors_count": professors_count,
+            "users_count": users_count,
         }
     
+    @classmethod
+    def with_stats(cls, session) -> List[Tuple["College", int]]:
+        """List colleges together with their professor counts in one query.
+        
+        Args:
+            session: Database session
+            
+        Returns:
+            List[Tuple[College, int]]: (college, professors_count) pairs ordered by name
+        """
+        from src.models.professor import Professor
+        
+        result = session.execute(
+            select(cls, func.count(Professor.id))
+            .outerjoin(Professor, Professor.college_id == cls.id)
+            .group_by(cls.id)
+            .order_by(cls.name)
+        )
+        return [(college, professors_count) for college, professors_count in result]
+    
     def to_dict(self, include_stats: bool = False) -> dict:
         """Convert college to dictionary representation.
         
+        Timestamps are returned as datetime objects; ORJSONResponse
+        serializes them to ISO 8601. Name and location columns are read once
+        and reused for display_name/location instead of going through the
+        properties a second time.
+        
         Args:
             include_stats: Whether to include statistics
             
         Returns:
             dict: College data
         """
+        name = self.name
+        short_name = self.short_name
+        city = self.city
+        state = self.state
+        country = self.country
+        
         data = {
-            "id": str(self.id),
-            "name": self.name,
-            "short_name": self.short_name,
-            "display_name": self.display_name,
+            "id": self.id,
+            "name": name,
+            "short_name": short_name,
+            "display_name": _format_display_name(name, short_name),
             "description": self.description,
-            "city": self.city,
-            "state": self.state,
-            "country": self.country,
-            "location": self.location,
+            "city": city,
+            "state": state,
+            "country": country,
+            "location": _format_location(city, state, country),
             "website_url": self.website_url,
             "established_year": self.established_year,
             "college_type": self.college_type,
             "is_verified": self.is_verified,
             "total_students": self.total_students,
             "total_professors": self.total_professors,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
         
         if include_stats:
             data["stats"] = self.get_stats()
+            data["rating_stats"] = self.rating_stats.to_dict() if self.rating_stats else None
             
         return data
@@ -0,0 +1,67 @@
+"""CollegeRatingStats model for RateMyProf platform.
+
+Read-only mapping of the college_rating_stats materialized view, which holds
+per-college averages of approved college review ratings.
+"""
+from typing import Any, Dict
+from sqlalchemy import Column, Integer, Numeric, String
+
+from src.models.base import Base
+
+
+class CollegeRatingStats(Base):
+    """Precomputed rating rollup for a college.
+    
+    Backed by a materialized view (scripts/create_college_rating_stats_view.sql)
+    refreshed periodically and after moderation, so reads never aggregate
+    college_reviews on the fly. The view is never written through the ORM.
+    
+    Attributes:
+        college_id: College the stats belong to
+        review_count: Number of college reviews in any status
+        approved_count: Number of approved college reviews
+        avg_food: Average food rating of approved reviews
+        avg_internet: Average internet rating of approved reviews
+        avg_clubs: Average clubs rating of approved reviews
+        avg_opportunities: Average opportunities rating of approved reviews
+        avg_facilities: Average facilities rating of approved reviews
+        avg_teaching: Average teaching rating of approved reviews
+        avg_overall: Average overall rating of approved reviews
+    """
+    
+    __tablename__ = "college_rating_stats"
+    
+    college_id = Column(String(50), primary_key=True)
+    review_count = Column(Integer, nullable=False)
+    approved_count = Column(Integer, nullable=False)
+    avg_food = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    avg_internet = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    avg_clubs = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    avg_opportunities = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    avg_facilities = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    avg_teaching = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    avg_overall = Column(Numeric(2, 1, asdecimal=False), nullable=True)
+    
+    def __repr__(self) -> str:
+        """String representation of CollegeRatingStats."""
+        return f"<CollegeRatingStats(college_id={self.college_id}, approved_count={self.approved_count})>"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary representation.
+        
+        Returns:
+            dict: Review counts and average ratings (0.0 when there are no approved reviews)
+        """
+        return {
+            "review_count": self.review_count,
+            "approved_count": self.approved_count,
+            "average_ratings": {
+                "food": self.avg_food or 0.0,
+                "internet": self.avg_internet or 0.0,
+                "clubs": self.avg_clubs or 0.0,
+                "opportunities": self.avg_opportunities or 0.0,
+                "facilities": self.avg_facilities or 0.0,
+                "teaching": self.avg_teaching or 0.0,
+                "overall": self.avg_overall or 0.0,
+            },
+        }
@@ -3,19 +3,27 @@
 Represents student reviews of colleges including ratings for various aspects like
 food, internet, clubs, opportunities, facilities, teaching quality, etc.
 """
-from datetime import datetime
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from typing import Optional, List, Tuple, TYPE_CHECKING
+from sqlalchemy import Column, Computed, String, DateTime, Boolean, Text, Integer, ForeignKey, Index, Numeric, select, update
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.sql import func
 import uuid
 
-from src.lib.database import Base
+from src.models.base import Base, column_values
 
 if TYPE_CHECKING:
     from src.models.user import User
     from src.models.college import College
+    from src.models.college_review_flag import CollegeReviewFlag
+
+
+# Moderation statuses, in the order status_flags reports them
+_STATUSES: Tuple[str, ...] = ("pending", "approved", "rejected", "flagged")
+
+# Native enum type (see scripts/convert_college_review_status_to_enum.sql)
+_REVIEW_STATUS = ENUM(*_STATUSES, name="college_review_status", create_type=False)
 
 
 class CollegeReview(Base):
@@ -50,16 +58,27 @@ class CollegeReview(Base):
     Relationships:
         student: User who submitted this review
         college: College being reviewed
+        flags: User reports filed against this review
     """
     
     __tablename__ = "college_reviews"
+    __table_args__ = (
+        # Moderation/listing filters with newest-first ordering
+        # (see scripts/add_moderation_composite_indexes.sql)
+        Index("idx_college_reviews_college_status_created_at", "college_id", "status", "created_at"),
+        Index("idx_college_reviews_status_created_at", "status", "created_at"),
+    )
+    
+    # Left out of list_as_dicts/iter_as_dicts results, keeping reviews
+    # anonymous as in to_dict()
+    _row_dict_excluded_columns = frozenset({"student_id"})
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Foreign keys
     student_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    college_id = Column(String, ForeignKey("colleges.id"), nullable=False, index=True)
+    college_id = Column(String, ForeignKey("colleges.id"), nullable=False)
     
     # Rating fields (1-5 scale)
     food_rating = Column(Integer, nullable=False)
@@ -70,6 +89,18 @@ class CollegeReview(Base):
     teaching_rating = Column(Integer, nullable=False)
     overall_rating = Column(Integer, nullable=False)
     
+    # Mean of the six aspect ratings, computed by Postgres on every write
+    # (see scripts/add_college_review_average_rating.sql)
+    stored_average_rating = Column(
+        "average_rating",
+        Numeric(2, 1, asdecimal=False),
+        Computed(
+            "ROUND((food_rating + internet_rating + clubs_rating + opportunities_rating"
+            " + facilities_rating + teaching_rating)::numeric / 6, 1)",
+            persisted=True,
+        ),
+    )
+    
     # Student information
     course_name = Column(String(200), nullable=False)
     year_of_study = Column(String(20), nullable=False)  # 1st Year, 2nd Year, etc.
@@ -82,7 +113,7 @@ class CollegeReview(Base):
     anonymous = Column(Boolean, default=True, nullable=False)  # Always True
     
     # Moderation
-    status = Column(String(20), default="pending", nullable=False, index=True)  # pending, approved, rejected, flagged
+    status = Column(_REVIEW_STATUS, default="pending", nullable=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -98,8 +129,13 @@ class CollegeReview(Base):
     not_helpful_count = Column(Integer, default=0, nullable=False)
     
     # Relationships
-    student = relationship("User", back_populates="college_reviews")
-    college = relationship("College", back_populates="college_reviews")
+    # College reviews are anonymous, so the author is never needed when listing;
+    # raise instead of silently issuing one SELECT per review (use selectinload)
+    student = relationship("User", back_populates="college_reviews", lazy="raise")
+    # Batch-loaded with one SELECT ... WHERE id IN (...) per list query
+    college = relationship("College", back_populates="college_reviews", lazy="selectin")
+    # Flags are removed by ON DELETE CASCADE in the database
+    flags = relationship("CollegeReviewFlag", back_populates="review", passive_deletes=True)
     
     def __repr__(self) -> str:
         """String representation of CollegeReview."""
@@ -118,9 +154,16 @@ class CollegeReview(Base):
             "overall": self.overall_rating,
         }
     
-    @property
+    @hybrid_property
     def average_rating(self) -> float:
-        """Calculate average rating across all dimensions."""
+        """Average rating across all dimensions.
+        
+        Uses the database-computed column once the review has been loaded or
+        flushed, and only calculates it in Python for unsaved reviews. In SQL
+        it maps to the stored column, so queries can filter and order by it.
+        """
+        if self.stored_average_rating is not None:
+            return self.stored_average_rating
         ratings = [
             self.food_rating,
             self.internet_rating,
@@ -131,25 +174,19 @@ class CollegeReview(Base):
         ]
         return round(sum(ratings) / len(ratings), 1)
     
-    @property
-    def is_pending(self) -> bool:
-        """Check if review is pending moderation."""
-        return self.status == "pending"
-    
-    @property
-    def is_approved(self) -> bool:
-        """Check if review is approved."""
-        return self.status == "approved"
+    @average_rating.expression
+    def average_rating(cls):
+        return cls.stored_average_rating
     
     @property
-    def is_rejected(self) -> bool:
-        """Check if review is rejected."""
-        return self.status == "rejected"
-    
-    @property
-    def is_flagged(self) -> bool:
-        """Check if review is flagged."""
-        return self.status == "flagged"
+    def status_flags(self) -> Tuple[bool, ...]:
+        """Get (pending, approved, rejected, flagged) booleans for the status.
+        
+        Reads the status once; to filter by status, compare
+        CollegeReview.status in the query instead.
+        """
+        status = self.status
+        return (status == "pending", status == "approved", status == "rejected", status == "flagged")
     
     def approve(self, moderator_id: uuid.UUID, reason: Optional[str] = None) -> None:
         """Approve the review.
@@ -160,7 +197,7 @@ class CollegeReview(Base):
         """
         self.status = "approved"
         self.moderated_by = moderator_id
-        self.moderated_at = datetime.utcnow()
+        self.moderated_at = func.now()  # Stamped by the database on flush
         self.moderation_reason = reason
     
     def reject(self, moderator_id: uuid.UUID, reason: str) -> None:
@@ -172,7 +209,7 @@ class CollegeReview(Base):
         """
         self.status = "rejected"
         self.moderated_by = moderator_id
-        self.moderated_at = datetime.utcnow()
+        self.moderated_at = func.now()  # Stamped by the database on flush
         self.moderation_reason = reason
     
     def flag(self, moderator_id: uuid.UUID, reason: str) -> None:
@@ -184,9 +221,48 @@ class CollegeReview(Base):
         """
         self.status = "flagged"
         self.moderated_by = moderator_id
-        self.moderated_at = datetime.utcnow()
+        self.moderated_at = func.now()  # Stamped by the database on flush
         self.moderation_reason = reason
     
+    @classmethod
+    def bulk_moderate(
+        cls,
+        session,
+        review_ids: List[uuid.UUID],
+        status: str,
+        moderator_id: uuid.UUID,
+        reason: Optional[str] = None,
+    ) -> int:
+        """Set the moderation status of many reviews in one UPDATE.
+        
+        Equivalent to calling approve()/reject()/flag() on each review, but
+        without loading the reviews or flushing them one by one.
+        
+        Args:
+            session: Database session
+            review_ids: IDs of the reviews to moderate
+            status: New status (approved, rejected, flagged)
+            moderator_id: ID of moderator taking the action
+            reason: Optional moderation reason
+            
+        Returns:
+            int: Number of reviews updated
+        """
+        if not review_ids:
+            return 0
+        result = session.execute(
+            update(cls)
+            .where(cls.id.in_(review_ids))
+            .values(
+                status=status,
+                moderated_by=moderator_id,
+                moderated_at=func.now(),
+                moderation_reason=reason,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
     def validate_ratings(self) -> bool:
         """Validate that all ratings are within valid range (1-5).
         
@@ -204,31 +280,76 @@ class CollegeReview(Base):
         ]
         return all(1 <= rating <= 5 for rating in ratings)
     
+    @classmethod
+    def list_with_college(
+        cls,
+        session,
+        *criteria,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List["CollegeReview"]:
+        """List college reviews with their college eagerly loaded, newest first.
+        
+        The colleges are fetched with one extra SELECT ... WHERE id IN (...)
+        instead of one lazy load per review.
+        
+        Args:
+            session: Database session
+            *criteria: Optional filter expressions, e.g. CollegeReview.status == "approved"
+            limit: Maximum number of reviews to return
+            offset: Number of reviews to skip
+            
+        Returns:
+            List[CollegeReview]: Reviews with .college already loaded
+        """
+        result = session.execute(
+            select(cls)
+            .options(selectinload(cls.college))
+            .where(*criteria)
+            .order_by(cls.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result.scalars())
+    
     def to_dict(self, include_student: bool = False) -> dict:
         """Convert review to dictionary representation.
         
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively. Column values are read from the instance __dict__
+        rather than through the attribute descriptors.
+        
         Args:
             include_student: Whether to include student information (always anonymous for college reviews)
             
         Returns:
             dict: Review data
         """
+        d = column_values(self)
         data = {
-            "id": str(self.id),
-            "college_id": str(self.college_id),
-            "ratings": self.rating_summary,
-            "course_name": self.course_name,
-            "year_of_study": self.year_of_study,
-            "graduation_year": self.graduation_year,
-            "review_text": self.review_text,
+            "id": d.get("id"),
+            "college_id": d.get("college_id"),
+            "ratings": {
+                "food": d.get("food_rating"),
+                "internet": d.get("internet_rating"),
+                "clubs": d.get("clubs_rating"),
+                "opportunities": d.get("opportunities_rating"),
+                "facilities": d.get("facilities_rating"),
+                "teaching": d.get("teaching_rating"),
+                "overall": d.get("overall_rating"),
+            },
+            "course_name": d.get("course_name"),
+            "year_of_study": d.get("year_of_study"),
+            "graduation_year": d.get("graduation_year"),
+            "review_text": d.get("review_text"),
             "anonymous": True,  # Always anonymous for college reviews
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "moderated_at": self.moderated_at.isoformat() if self.moderated_at else None,
-            "moderation_reason": self.moderation_reason,
-            "helpful_count": self.helpful_count,
-            "not_helpful_count": self.not_helpful_count,
+            "status": d.get("status"),
+            "created_at": d.get("created_at"),
+            "updated_at": d.get("updated_at"),
+            "moderated_at": d.get("moderated_at"),
+            "moderation_reason": d.get("moderation_reason"),
+            "helpful_count": d.get("helpful_count"),
+            "not_helpful_count": d.get("not_helpful_count"),
         }
         
         # Always show as anonymous for college reviews
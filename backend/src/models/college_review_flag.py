@@ -3,16 +3,37 @@
 Allows users to flag inappropriate college reviews for moderation.
 """
 from datetime import datetime
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple, TYPE_CHECKING
+from sqlalchemy import Column, DateTime, Text, ForeignKey, Index, select, tuple_
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 
-from src.lib.database import Base
+from src.models.base import Base
 
 if TYPE_CHECKING:
-    pass  # Avoiding circular imports
+    from src.models.college_review import CollegeReview
+
+
+# Flag types are static, so build them once at import time
+_FLAG_TYPE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "spam": "Spam, promotional content, or advertisements",
+    "inappropriate": "Inappropriate or unsuitable content",
+    "fake": "Fake, fraudulent, or misleading review",
+    "offensive": "Offensive language or inappropriate content",
+    "harassment": "Harassment, bullying, or personal attacks",
+    "irrelevant": "Content not relevant to the college",
+    "duplicate": "Duplicate or repeated review content",
+    "other": "Other violation (please specify in reason)",
+})
+_FLAG_TYPES: Tuple[str, ...] = tuple(_FLAG_TYPE_DESCRIPTIONS)
+_VALID_FLAG_TYPES = frozenset(_FLAG_TYPES)
+
+# Native enum types (see scripts/convert_college_review_status_to_enum.sql)
+_FLAG_TYPE = ENUM(*_FLAG_TYPES, name="college_review_flag_type", create_type=False)
+_FLAG_STATUS = ENUM("pending", "reviewed", "dismissed", name="college_review_flag_status", create_type=False)
 
 
 class CollegeReviewFlag(Base):
@@ -34,6 +55,9 @@ class CollegeReviewFlag(Base):
         created_at: When flag was created
         updated_at: When flag was last updated
         
+    Relationships:
+        review: College review being flagged
+        
     Flag Types:
         - spam: Spam or promotional content
         - inappropriate: Inappropriate or offensive content
@@ -46,76 +70,103 @@ class CollegeReviewFlag(Base):
     """
     
     __tablename__ = "college_review_flags"
+    __table_args__ = (
+        # Admin queue by status, newest first, and per-review flag lookups
+        Index("idx_college_review_flags_status_created_at", "status", "created_at"),
+        Index("idx_college_review_flags_review_status", "college_review_id", "status"),
+    )
+    # Fetch the database-stamped timestamps with RETURNING on the INSERT or
+    # UPDATE itself, rather than a SELECT on the next attribute access
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Review and reporter information
-    college_review_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    reporter_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    college_review_id = Column(
+        UUID(as_uuid=True), ForeignKey("college_reviews.id", ondelete="CASCADE"), nullable=False
+    )
+    reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Flag details
-    flag_type = Column(String(50), nullable=False, index=True)  # spam, inappropriate, fake, offensive, etc.
+    flag_type = Column(_FLAG_TYPE, nullable=False, index=True)
     reason = Column(Text, nullable=True)  # Optional detailed reason
     
     # Moderation status
-    status = Column(String(20), nullable=False, default="pending", index=True)  # pending, reviewed, dismissed
+    status = Column(_FLAG_STATUS, nullable=False, default="pending")
     reviewed_by = Column(UUID(as_uuid=True), nullable=True, index=True)  # Admin who reviewed
     admin_notes = Column(Text, nullable=True)  # Admin's notes on the flag
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), index=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    
+    # Relationships
+    review = relationship("CollegeReview", back_populates="flags")
     
     def __repr__(self):
         return f"<CollegeReviewFlag(id={self.id}, review_id={self.college_review_id}, type={self.flag_type}, status={self.status})>"
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert flag to dictionary format."""
+        """Convert flag to dictionary format.
+        
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively.
+        """
         return {
-            "id": str(self.id),
-            "college_review_id": str(self.college_review_id),
-            "reporter_id": str(self.reporter_id),
+            "id": self.id,
+            "college_review_id": self.college_review_id,
+            "reporter_id": self.reporter_id,
             "flag_type": self.flag_type,
             "reason": self.reason,
             "status": self.status,
-            "reviewed_by": str(self.reviewed_by) if self.reviewed_by is not None else None,
+            "reviewed_by": self.reviewed_by,
             "admin_notes": self.admin_notes,
-            "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at is not None else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "reviewed_at": self.reviewed_at,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
     
     @classmethod
-    def get_valid_flag_types(cls) -> List[str]:
-        """Get list of valid flag types."""
-        return [
-            "spam",
-            "inappropriate", 
-            "fake",
-            "offensive",
-            "harassment",
-            "irrelevant",
-            "duplicate",
-            "other"
-        ]
+    def list_after(
+        cls,
+        session,
+        cursor_created_at: Optional[datetime] = None,
+        cursor_id: Optional[uuid.UUID] = None,
+        limit: int = 50,
+    ) -> List["CollegeReviewFlag"]:
+        """List flags newest first using keyset pagination.
+        
+        Seeks past the (created_at, id) cursor of the last row on the previous
+        page instead of using OFFSET, so deep pages cost the same as the first.
+        
+        Args:
+            session: Database session
+            cursor_created_at: created_at of the last flag on the previous page
+            cursor_id: id of the last flag on the previous page
+            limit: Maximum number of flags to return
+            
+        Returns:
+            List[CollegeReviewFlag]: Next page of flags
+        """
+        query = select(cls)
+        if cursor_created_at is not None and cursor_id is not None:
+            query = query.where(tuple_(cls.created_at, cls.id) < (cursor_created_at, cursor_id))
+        query = query.order_by(cls.created_at.desc(), cls.id.desc()).limit(limit)
+        return list(session.scalars(query))
+    
+    @classmethod
+    def get_valid_flag_types(cls) -> Tuple[str, ...]:
+        """Get valid flag types."""
+        return _FLAG_TYPES
     
     @classmethod
     def is_valid_flag_type(cls, flag_type: str) -> bool:
         """Check if flag type is valid."""
-        return flag_type in cls.get_valid_flag_types()
+        return flag_type in _VALID_FLAG_TYPES
     
     @classmethod
-    def get_flag_type_descriptions(cls) -> Dict[str, str]:
-        """Get descriptions for each flag type."""
-        return {
-            "spam": "Spam, promotional content, or advertisements",
-            "inappropriate": "Inappropriate or unsuitable content",
-            "fake": "Fake, fraudulent, or misleading review",
-            "offensive": "Offensive language or inappropriate content",
-            "harassment": "Harassment, bullying, or personal attacks", 
-            "irrelevant": "Content not relevant to the college",
-            "duplicate": "Duplicate or repeated review content",
-            "other": "Other violation (please specify in reason)"
-        }
\ No newline at end of file
+    def get_flag_type_descriptions(cls) -> Mapping[str, str]:
+        """Get descriptions for each flag type (read-only)."""
+        return _FLAG_TYPE_DESCRIPTIONS
\ No newline at end of file
@@ -3,17 +3,42 @@
 Tracks all moderation actions taken by administrators for audit and transparency.
 Maintains comprehensive history of content moderation decisions.
 """
-from datetime import datetime
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Text, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy import Column, String, DateTime, Text, Index, insert
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 import uuid
 
-from src.lib.database import Base
+from src.models.base import Base, column_values
 
-if TYPE_CHECKING:
-    pass  # No direct relationships, but references other models by ID
+
+# Action and target types are static, so build them once at import time
+_ACTION_TYPES: Tuple[str, ...] = (
+    "approve_review",
+    "reject_review",
+    "flag_review",
+    "unflag_review",
+    "approve_flag",
+    "dismiss_flag",
+    "suspend_user",
+    "unsuspend_user",
+    "verify_professor",
+    "unverify_professor",
+    "delete_review",
+    "edit_review",
+    "bulk_approve",
+    "bulk_reject",
+)
+_VALID_ACTION_TYPES = frozenset(_ACTION_TYPES)
+
+_TARGET_TYPES: Tuple[str, ...] = (
+    "review",
+    "review_flag",
+    "user",
+    "professor",
+    "college",
+)
+_VALID_TARGET_TYPES = frozenset(_TARGET_TYPES)
 
 
 class ModerationLog(Base):
@@ -42,25 +67,39 @@ class ModerationLog(Base):
     """
     
     __tablename__ = "moderation_logs"
+    __table_args__ = (
+        # Per-target history and per-moderator activity, newest first
+        Index("idx_moderation_logs_target", "target_type", "target_id"),
+        Index("idx_moderation_logs_moderator_created_at", "moderator_id", "created_at"),
+        # Containment filters on extra_data (see scripts/convert_moderation_log_extra_data_to_jsonb.sql)
+        Index(
+            "idx_moderation_logs_extra_data",
+            "extra_data",
+            postgresql_using="gin",
+            postgresql_ops={"extra_data": "jsonb_path_ops"},
+        ),
+        # Monthly range partitions (see scripts/partition_moderation_logs.sql)
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
-    # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # Primary key (includes created_at, the partition key)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Moderator information
-    moderator_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    moderator_id = Column(UUID(as_uuid=True), nullable=False)
     
     # Action details
     action_type = Column(String(50), nullable=False, index=True)  # approve, reject, flag, unflag, etc.
-    target_type = Column(String(50), nullable=False, index=True)  # review, flag, user, professor
+    target_type = Column(String(50), nullable=False)  # review, flag, user, professor
     target_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     
     # Action context
     reason = Column(Text, nullable=True)
     details = Column(Text, nullable=True)
-    extra_data = Column(JSON, nullable=True)  # Flexible data storage (renamed from metadata)
+    extra_data = Column(JSONB, nullable=True)  # Flexible data storage (renamed from metadata)
     
     # Audit information
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False)
     ip_address = Column(String(45), nullable=True)  # IPv6 can be up to 45 chars
     user_agent = Column(Text, nullable=True)
     
@@ -69,43 +108,22 @@ class ModerationLog(Base):
         return f"<ModerationLog(id={self.id}, action={self.action_type}, target={self.target_type})>"
     
     @classmethod
-    def get_action_types(cls) -> List[str]:
-        """Get list of valid action types.
+    def get_action_types(cls) -> Tuple[str, ...]:
+        """Get valid action types.
         
         Returns:
-            List[str]: Valid moderation action types
+            Tuple[str, ...]: Valid moderation action types
         """
-        return [
-            "approve_review",
-            "reject_review",
-            "flag_review",
-            "unflag_review",
-            "approve_flag",
-            "dismiss_flag",
-            "suspend_user",
-            "unsuspend_user",
-            "verify_professor",
-            "unverify_professor",
-            "delete_review",
-            "edit_review",
-            "bulk_approve",
-            "bulk_reject",
-        ]
+        return _ACTION_TYPES
     
     @classmethod
-    def get_target_types(cls) -> List[str]:
-        """Get list of valid target types.
+    def get_target_types(cls) -> Tuple[str, ...]:
+        """Get valid target types.
         
         Returns:
-            List[str]: Valid moderation target types
+            Tuple[str, ...]: Valid moderation target types
         """
-        return [
-            "review",
-            "review_flag",
-            "user",
-            "professor",
-            "college",
-        ]
+        return _TARGET_TYPES
     
     def validate_action_type(self) -> bool:
         """Validate that action type is allowed.
@@ -113,7 +131,7 @@ class ModerationLog(Base):
         Returns:
             bool: True if action type is valid
         """
-        return self.action_type in self.get_action_types()
+        return self.action_type in _VALID_ACTION_TYPES
     
     def validate_target_type(self) -> bool:
         """Validate that target type is allowed.
@@ -121,7 +139,7 @@ class ModerationLog(Base):
         Returns:
             bool: True if target type is valid
         """
-        return self.target_type in self.get_target_types()
+        return self.target_type in _VALID_TARGET_TYPES
     
     @classmethod
     def log_action(
@@ -164,22 +182,43 @@ class ModerationLog(Base):
             user_agent=user_agent,
         )
     
+    @classmethod
+    def log_actions_bulk(cls, session, rows: List[Dict[str, Any]]) -> None:
+        """Insert many moderation log entries in a single statement.
+        
+        Used by bulk moderation actions instead of calling log_action() per
+        item; rows are plain dicts, so no ModerationLog instances are built.
+        id and created_at are filled in by their column defaults.
+        
+        Args:
+            session: Database session
+            rows: Column values per entry (moderator_id, action_type,
+                target_type, target_id and any optional fields)
+        """
+        if rows:
+            session.execute(insert(cls), rows)
+    
     def to_dict(self) -> dict:
         """Convert log entry to dictionary representation.
         
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively. Column values are read from the instance __dict__
+        rather than through the attribute descriptors.
+        
         Returns:
             dict: Log entry data
         """
+        d = column_values(self)
         return {
-            "id": str(self.id),
-            "moderator_id": str(self.moderator_id),
-            "action_type": self.action_type,
-            "target_type": self.target_type,
-            "target_id": str(self.target_id),
-            "reason": self.reason,
-            "details": self.details,
-            "extra_data": self.extra_data,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "ip_address": self.ip_address,
-            "user_agent": self.user_agent,
+            "id": d.get("id"),
+            "moderator_id": d.get("moderator_id"),
+            "action_type": d.get("action_type"),
+            "target_type": d.get("target_type"),
+            "target_id": d.get("target_id"),
+            "reason": d.get("reason"),
+            "details": d.get("details"),
+            "extra_data": d.get("extra_data"),
+            "created_at": d.get("created_at"),
+            "ip_address": d.get("ip_address"),
+            "user_agent": d.get("user_agent"),
         }
@@ -5,19 +5,56 @@ Includes profile information, teaching details, and rating calculations.
 """
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, Float, ForeignKey, Index, Numeric, and_, cast, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import aliased, column_property, deferred, relationship, selectinload, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import func
 import uuid
 
-from src.lib.database import Base
+from src.models.base import Base
 
 if TYPE_CHECKING:
     from src.models.college import College
     from src.models.review import Review
 
 
+def _rounded(column):
+    """SQL ROUND(column, 1) for a float column, returned as a Python float."""
+    return func.round(cast(column, Numeric), 1, type_=Float)
+
+
+# Rounded rating attribute -> stored rating column it is derived from
+_ROUNDED_RATINGS = {
+    "average_rating_rounded": "average_rating",
+    "rating_difficulty_rounded": "rating_difficulty",
+    "rating_clarity_rounded": "rating_clarity",
+    "rating_helpfulness_rounded": "rating_helpfulness",
+    "would_take_again_percent_rounded": "would_take_again_percent",
+}
+
+# Bookkeeping columns maintained by the reviews trigger, not part of the API
+_RATING_SUM_COLUMNS = frozenset({
+    "sum_overall_rating",
+    "sum_difficulty_rating",
+    "sum_clarity_rating",
+    "sum_helpfulness_rating",
+    "would_take_again_count",
+})
+
+# Every attribute bulk_refresh_ratings writes or that derives from them
+_RATING_ATTRIBUTES = [
+    "total_reviews",
+    "average_rating",
+    "rating_difficulty",
+    "rating_clarity",
+    "rating_helpfulness",
+    "would_take_again_percent",
+    *sorted(_RATING_SUM_COLUMNS),
+    *_ROUNDED_RATINGS,
+]
+
+
 class Professor(Base):
     """Professor model representing faculty members.
     
@@ -31,7 +68,7 @@ class Professor(Base):
         department: Academic department
         designation: Job title (Professor, Associate Professor, etc.)
         college_id: Reference to college where professor teaches
-        subjects: JSON array of subjects taught (stored as text)
+        subjects: Subjects taught (TEXT[])
         specializations: Areas of specialization
         biography: Professor's background and expertise
         years_of_experience: Teaching experience in years
@@ -45,18 +82,39 @@ class Professor(Base):
         rating_clarity: Average clarity rating
         rating_helpfulness: Average helpfulness rating
         would_take_again_percent: Percentage who would take again
+        sum_overall_rating: Running sum of overall ratings of approved reviews
+        sum_difficulty_rating: Running sum of difficulty ratings of approved reviews
+        sum_clarity_rating: Running sum of clarity ratings of approved reviews
+        sum_helpfulness_rating: Running sum of helpfulness ratings of approved reviews
+        would_take_again_count: Number of approved reviews that would take again
         created_at: Profile creation timestamp
         updated_at: Last profile update timestamp
         
     Relationships:
         college: College where professor teaches
         reviews: Reviews submitted for this professor
+        approved_reviews: Approved reviews only, newest first (read-only)
     """
     
     __tablename__ = "professors"
+    __table_args__ = (
+        # Same-department listing ordered by rating (similar professors);
+        # INCLUDE makes it an index-only scan
+        # (see scripts/add_professor_listing_index.sql)
+        Index(
+            "idx_professors_college_department_rating",
+            "college_id",
+            "department",
+            "average_rating",
+            postgresql_include=["id", "name", "total_reviews", "subjects"],
+        ),
+    )
+    
+    # Internal running sums, left out of list_as_dicts/iter_as_dicts results
+    _row_dict_excluded_columns = _RATING_SUM_COLUMNS
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Basic information
     name = Column(String(200), nullable=False)  # Combined name field to match database
@@ -67,15 +125,18 @@ class Professor(Base):
     designation = Column(String(100), nullable=False)  # Professor, Associate Professor, etc.
     
     # College association
-    college_id = Column(String(50), ForeignKey("colleges.id"), nullable=False, index=True)
+    college_id = Column(String(50), ForeignKey("colleges.id"), nullable=False)
     
     # Teaching information  
-    subjects = Column(Text, nullable=True)  # JSON array stored as text to match database
-    specializations = Column(Text, nullable=True)  # Added to match database
-    biography = Column(Text, nullable=True)
+    subjects = Column(ARRAY(Text), nullable=True)
     years_of_experience = Column(Integer, nullable=True)
-    education = Column(Text, nullable=True)
-    research_interests = Column(Text, nullable=True)
+    
+    # Long profile text, left out of the default SELECT; the detail query
+    # (get_with_reviews) loads it with undefer_group("bio")
+    specializations = deferred(Column(Text, nullable=True), group="bio")  # Added to match database
+    biography = deferred(Column(Text, nullable=True), group="bio")
+    education = deferred(Column(Text, nullable=True), group="bio")
+    research_interests = deferred(Column(Text, nullable=True), group="bio")
     
     # Status
     is_verified = Column(Boolean, default=False, nullable=False)
@@ -89,13 +150,45 @@ class Professor(Base):
     rating_helpfulness = Column(Float, default=0.0, nullable=False)
     would_take_again_percent = Column(Float, default=0.0, nullable=False)
     
+    # Running sums over approved reviews, maintained by the reviews trigger
+    # (see scripts/maintain_professor_ratings.sql); total_reviews is the count
+    sum_overall_rating = Column(Integer, default=0, nullable=False)
+    sum_difficulty_rating = Column(Integer, default=0, nullable=False)
+    sum_clarity_rating = Column(Integer, default=0, nullable=False)
+    sum_helpfulness_rating = Column(Integer, default=0, nullable=False)
+    would_take_again_count = Column(Integer, default=0, nullable=False)
+    
+    # Ratings rounded to one decimal by the database in the main SELECT
+    average_rating_rounded = column_property(_rounded(average_rating))
+    rating_difficulty_rounded = column_property(_rounded(rating_difficulty))
+    rating_clarity_rounded = column_property(_rounded(rating_clarity))
+    rating_helpfulness_rounded = column_property(_rounded(rating_helpfulness))
+    would_take_again_percent_rounded = column_property(_rounded(would_take_again_percent))
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     college = relationship("College", back_populates="professors")
-    reviews = relationship("Review", back_populates="professor", cascade="all, delete-orphan")
+    # lazy="raise": load reviews explicitly with selectinload() rather than
+    # issuing one SELECT per professor; deletes rely on ON DELETE CASCADE
+    reviews = relationship(
+        "Review",
+        back_populates="professor",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    # Approved reviews filtered in SQL rather than in Python (served by
+    # idx_reviews_professor_approved); load via get_with_reviews
+    approved_reviews = relationship(
+        "Review",
+        primaryjoin="and_(Professor.id == Review.professor_id, Review.status == 'approved')",
+        order_by="Review.created_at.desc()",
+        viewonly=True,
+        lazy="raise",
+    )
     
     def __repr__(self) -> str:
         """String representation of Professor."""
@@ -109,20 +202,30 @@ class Professor(Base):
     @property
     def subjects_list(self) -> List[str]:
         """Get list of subjects taught."""
-        if not self.subjects:
-            return []
-        return [subject.strip() for subject in self.subjects.split(",") if subject.strip()]
+        return self.subjects or []
+    
+    def _rounded_rating(self, key: str) -> float:
+        """Get a rounded rating, rounding in Python only if it wasn't selected."""
+        value = self.__dict__.get(key)
+        if value is None:
+            value = round(getattr(self, _ROUNDED_RATINGS[key]), 1)
+        return value
     
     @property
     def rating_summary(self) -> dict:
-        """Get rating summary dictionary."""
+        """Get rating summary dictionary.
+        
+        Uses the *_rounded column properties loaded with the row; values are
+        only rounded in Python for unsaved professors or after
+        update_ratings_from_reviews() changed them in this session.
+        """
         return {
-            "average_rating": round(self.average_rating, 1),
+            "average_rating": self._rounded_rating("average_rating_rounded"),
             "total_reviews": self.total_reviews,
-            "difficulty": round(self.rating_difficulty, 1),
-            "clarity": round(self.rating_clarity, 1),
-            "helpfulness": round(self.rating_helpfulness, 1),
-            "would_take_again_percent": round(self.would_take_again_percent, 1),
+            "difficulty": self._rounded_rating("rating_difficulty_rounded"),
+            "clarity": self._rounded_rating("rating_clarity_rounded"),
+            "helpfulness": self._rounded_rating("rating_helpfulness_rounded"),
+            "would_take_again_percent": self._rounded_rating("would_take_again_percent_rounded"),
         }
     
     def has_sufficient_reviews(self, min_reviews: int = 3) -> bool:
@@ -136,76 +239,176 @@ class Professor(Base):
         """
         return self.total_reviews >= min_reviews
     
-    def update_ratings_from_reviews(self) -> None:
-        """Update calculated ratings based on associated reviews.
+    def update_ratings_from_reviews(self, session=None) -> None:
+        """Update calculated ratings from the stored running sums.
         
-        This method should be called whenever reviews are added, updated, or deleted.
-        It recalculates all rating metrics from the current set of approved reviews.
+        The sums and total_reviews are kept current by the reviews trigger in
+        scripts/maintain_professor_ratings.sql, so this is O(1) arithmetic and
+        never loads the reviews relationship. Pass a session to instead resync
+        everything from the approved reviews with a single UPDATE (see
+        bulk_refresh_ratings); the rating attributes are then expired and
+        reloaded on next access.
+        
+        Args:
+            session: Optional database session used to resync the sums
         """
-        if not self.reviews:
-            self.average_rating = 0.0
-            self.total_reviews = 0
-            self.rating_difficulty = 0.0
-            self.rating_clarity = 0.0
-            self.rating_helpfulness = 0.0
-            self.would_take_again_percent = 0.0
+        if session is not None:
+            self.bulk_refresh_ratings(session, [self.id])
+            session.expire(self, _RATING_ATTRIBUTES)
             return
         
-        # Filter approved reviews only
-        approved_reviews = [r for r in self.reviews if r.status == "approved"]
+        # The loaded rounded values no longer match; rating_summary rounds in
+        # Python until the row is reloaded
+        for key in _ROUNDED_RATINGS:
+            set_committed_value(self, key, None)
         
-        if not approved_reviews:
+        total = self.total_reviews
+        if not total:
             self.average_rating = 0.0
-            self.total_reviews = 0
             self.rating_difficulty = 0.0
             self.rating_clarity = 0.0
             self.rating_helpfulness = 0.0
             self.would_take_again_percent = 0.0
             return
         
-        # Calculate averages
-        total = len(approved_reviews)
-        self.total_reviews = total
+        self.average_rating = self.sum_overall_rating / total
+        self.rating_difficulty = self.sum_difficulty_rating / total
+        self.rating_clarity = self.sum_clarity_rating / total
+        self.rating_helpfulness = self.sum_helpfulness_rating / total
+        self.would_take_again_percent = (self.would_take_again_count / total) * 100
+    
+    @classmethod
+    def get_with_reviews(cls, session, professor_id: uuid.UUID) -> Optional["Professor"]:
+        """Get a professor with its approved reviews and profile text loaded.
         
-        self.average_rating = sum(r.overall_rating for r in approved_reviews) / total
-        self.rating_difficulty = sum(r.difficulty_rating for r in approved_reviews) / total
-        self.rating_clarity = sum(r.clarity_rating for r in approved_reviews) / total
-        self.rating_helpfulness = sum(r.helpfulness_rating for r in approved_reviews) / total
+        The deferred profile text columns are loaded in the same SELECT, for
+        to_dict(include_reviews=True, include_profile=True).
         
-        # Calculate would take again percentage
-        would_take_again_count = sum(1 for r in approved_reviews if r.would_take_again)
-        self.would_take_again_percent = (would_take_again_count / total) * 100
+        Args:
+            session: Database session
+            professor_id: Professor ID
+            
+        Returns:
+            Optional[Professor]: Professor with .approved_reviews loaded, or None
+        """
+        return session.scalars(
+            select(cls)
+            .options(undefer_group("bio"), selectinload(cls.approved_reviews))
+            .where(cls.id == professor_id)
+        ).first()
     
-    def to_dict(self, include_reviews: bool = False) -> dict:
+    @classmethod
+    def bulk_refresh_ratings(cls, session, professor_ids: List[uuid.UUID]) -> int:
+        """Recompute the rating sums and averages of many professors in one UPDATE.
+        
+        Same result as the backfill in scripts/maintain_professor_ratings.sql,
+        restricted to professor_ids: one UPDATE ... FROM over an aggregate of
+        their approved reviews, with no professors or reviews loaded. Use it to
+        repair professors after bulk changes that bypassed the reviews trigger.
+        
+        Args:
+            session: Database session
+            professor_ids: IDs of the professors to refresh
+        
+        Returns:
+            int: Number of professors updated
+        """
+        from src.models.review import Review
+        
+        if not professor_ids:
+            return 0
+        
+        # Outer join so professors without approved reviews are reset to zero
+        p = aliased(cls)
+        agg = (
+            select(
+                p.id.label("professor_id"),
+                func.count(Review.id).label("review_count"),
+                func.coalesce(func.sum(Review.overall_rating), 0).label("sum_overall"),
+                func.coalesce(func.sum(Review.difficulty_rating), 0).label("sum_difficulty"),
+                func.coalesce(func.sum(Review.clarity_rating), 0).label("sum_clarity"),
+                func.coalesce(func.sum(Review.helpfulness_rating), 0).label("sum_helpfulness"),
+                func.count(Review.id).filter(Review.would_take_again.is_(True)).label("would_take_again"),
+            )
+            .select_from(p)
+            .outerjoin(Review, and_(Review.professor_id == p.id, Review.status == "approved"))
+            .where(p.id.in_(professor_ids))
+            .group_by(p.id)
+            .subquery()
+        )
+        
+        def average(total, scale=1):
+            return func.coalesce(
+                func.round(cast(total, Numeric) * scale / func.nullif(agg.c.review_count, 0), 1),
+                0.0,
+            )
+        
+        result = session.execute(
+            update(cls)
+            .where(cls.id == agg.c.professor_id)
+            .values(
+                total_reviews=agg.c.review_count,
+                sum_overall_rating=agg.c.sum_overall,
+                sum_difficulty_rating=agg.c.sum_difficulty,
+                sum_clarity_rating=agg.c.sum_clarity,
+                sum_helpfulness_rating=agg.c.sum_helpfulness,
+                would_take_again_count=agg.c.would_take_again,
+                average_rating=average(agg.c.sum_overall),
+                rating_difficulty=average(agg.c.sum_difficulty),
+                rating_clarity=average(agg.c.sum_clarity),
+                rating_helpfulness=average(agg.c.sum_helpfulness),
+                would_take_again_percent=average(agg.c.would_take_again, 100),
+                # A ratings refresh is not a profile update
+                updated_at=cls.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    def to_dict(self, include_reviews: bool = False, include_profile: bool = False) -> dict:
         """Convert professor to dictionary representation.
         
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively. For professors with many reviews, leave
+        include_reviews off and stream the reviews separately with
+        iter_as_dicts(session, Review, ...) and iter_json_array. The
+        deferred profile text (biography, education, research_interests) is
+        left out unless include_profile is set, so serializing a list of
+        professors never lazy-loads it row by row.
+        
         Args:
-            include_reviews: Whether to include review data
+            include_reviews: Whether to include approved reviews (they must be
+                eagerly loaded, e.g. via get_with_reviews)
+            include_profile: Whether to include the deferred profile text
+                (load it with .options(undefer_group("bio")), as
+                get_with_reviews does)
             
         Returns:
             dict: Professor data
         """
         data = {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
             "full_name": self.full_name,
             "email": self.email,
             "department": self.department,
             "designation": self.designation,
-            "college_id": str(self.college_id),
+            "college_id": self.college_id,
             "subjects": self.subjects_list,
-            "biography": self.biography,
             "years_of_experience": self.years_of_experience,
-            "education": self.education,
-            "research_interests": self.research_interests,
             "is_verified": self.is_verified,
             "is_active": self.is_active,
             "ratings": self.rating_summary,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
         
-        if include_reviews and self.reviews:
-            data["reviews"] = [r.to_dict() for r in self.reviews if r.status == "approved"]
+        if include_profile:
+            data["biography"] = self.biography
+            data["education"] = self.education
+            data["research_interests"] = self.research_interests
+        
+        if include_reviews and self.approved_reviews:
+            data["reviews"] = [r.to_dict() for r in self.approved_reviews]
             
         return data
@@ -3,15 +3,14 @@
 Represents student reviews of professors including ratings, comments, and moderation status.
 Includes comprehensive rating system and content moderation capabilities.
 """
-from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, Float, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import ARRAY, ENUM, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 
-from src.lib.database import Base
+from src.models.base import Base
 
 if TYPE_CHECKING:
     from src.models.user import User
@@ -19,6 +18,10 @@ if TYPE_CHECKING:
     from src.models.review_flag import ReviewFlag
 
 
+# Native enum type (see scripts/convert_review_status_to_enum.sql)
+_REVIEW_STATUS = ENUM("pending", "approved", "rejected", "flagged", name="review_status", create_type=False)
+
+
 class Review(Base):
     """Review model representing student feedback for professors.
     
@@ -39,7 +42,7 @@ class Review(Base):
         grade_received: Grade received in course (optional)
         attendance_required: Whether attendance was required
         review_text: Written review comments
-        tags: Comma-separated tags (funny, tough, caring, etc.)
+        tags: Tags such as funny, tough, caring (TEXT[])
         verified_student: Whether review is from verified student (always True)
         status: Moderation status (pending, approved, rejected, flagged)
         created_at: Review submission timestamp
@@ -55,12 +58,33 @@ class Review(Base):
     """
     
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Tag containment filters, e.g. tags @> ARRAY['caring']
+        Index("idx_reviews_tags", "tags", postgresql_using="gin"),
+        # Approved reviews per professor with their ratings, so the rating
+        # aggregates (Professor.bulk_refresh_ratings) and
+        # the professor detail rating fetch are index-only scans that never
+        # touch pending or rejected rows
+        Index(
+            "idx_reviews_professor_approved",
+            "professor_id",
+            postgresql_where=text("status = 'approved'"),
+            postgresql_include=[
+                "overall_rating",
+                "difficulty_rating",
+                "clarity_rating",
+                "helpfulness_rating",
+                "would_take_again",
+                "attendance_required",
+            ],
+        ),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Foreign keys
-    professor_id = Column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=False, index=True)
+    professor_id = Column(UUID(as_uuid=True), ForeignKey("professors.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Rating fields (1-5 scale)
     overall_rating = Column(Integer, nullable=False)
@@ -80,11 +104,11 @@ class Review(Base):
     
     # Review content
     review_text = Column(Text, nullable=True)
-    tags = Column(String(500), nullable=True)  # Comma-separated tags
+    tags = Column(ARRAY(Text), nullable=True)
     
     # Privacy and moderation
     verified_student = Column(Boolean, default=True, nullable=False)  # All reviews are verified
-    status = Column(String(20), default="pending", nullable=False, index=True)  # pending, approved, rejected, flagged
+    status = Column(_REVIEW_STATUS, default="pending", nullable=False, index=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -100,9 +124,15 @@ class Review(Base):
     not_helpful_count = Column(Integer, default=0, nullable=False)
     
     # Relationships - removed student relationship (now in mapping table)
-    professor = relationship("Professor", back_populates="reviews")
-    flags = relationship("ReviewFlag", back_populates="review", cascade="all, delete-orphan")
-    votes = relationship("ReviewVote", back_populates="review", cascade="all, delete-orphan")
+    # lazy="raise": opt in with selectinload()/joinedload() at the query site
+    # instead of lazy loading per review; deletes rely on ON DELETE CASCADE
+    professor = relationship("Professor", back_populates="reviews", lazy="raise")
+    flags = relationship(
+        "ReviewFlag", back_populates="review", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
+    votes = relationship(
+        "ReviewVote", back_populates="review", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
     
     def __repr__(self) -> str:
         """String representation of Review."""
@@ -111,9 +141,7 @@ class Review(Base):
     @property
     def tags_list(self) -> List[str]:
         """Get list of tags."""
-        if not self.tags:
-            return []
-        return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+        return self.tags or []
     
     @property
     def is_pending(self) -> bool:
@@ -163,7 +191,7 @@ class Review(Base):
         """
         self.status = "approved"
         self.moderated_by = moderator_id
-        self.moderated_at = datetime.utcnow()
+        self.moderated_at = func.now()  # Stamped by the database on flush
         self.moderation_reason = reason
     
     def reject(self, moderator_id: uuid.UUID, reason: str) -> None:
@@ -175,7 +203,7 @@ class Review(Base):
         """
         self.status = "rejected"
         self.moderated_by = moderator_id
-        self.moderated_at = datetime.utcnow()
+        self.moderated_at = func.now()  # Stamped by the database on flush
         self.moderation_reason = reason
     
     def flag(self, moderator_id: uuid.UUID, reason: str) -> None:
@@ -187,7 +215,7 @@ class Review(Base):
         """
         self.status = "flagged"
         self.moderated_by = moderator_id
-        self.moderated_at = datetime.utcnow()
+        self.moderated_at = func.now()  # Stamped by the database on flush
         self.moderation_reason = reason
     
     def validate_ratings(self) -> bool:
@@ -196,26 +224,28 @@ class Review(Base):
         Returns:
             bool: True if all ratings are valid
         """
-        ratings = [
-            self.overall_rating,
-            self.difficulty_rating,
-            self.clarity_rating,
-            self.helpfulness_rating,
-        ]
-        return all(1 <= rating <= 5 for rating in ratings)
+        return (
+            1 <= self.overall_rating <= 5
+            and 1 <= self.difficulty_rating <= 5
+            and 1 <= self.clarity_rating <= 5
+            and 1 <= self.helpfulness_rating <= 5
+        )
     
     def to_dict(self, include_student: bool = False) -> dict:
         """Convert review to dictionary representation.
         
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively.
+        
         Args:
             include_student: Deprecated - all reviews are anonymous
             
         Returns:
             dict: Review data (without user information)
         """
-        data = {
-            "id": str(self.id),
-            "professor_id": str(self.professor_id),
+        return {
+            "id": self.id,
+            "professor_id": self.professor_id,
             "ratings": self.rating_summary,
             "course_name": self.course_name,
             "semester": self.semester,
@@ -226,10 +256,8 @@ class Review(Base):
             "tags": self.tags_list,
             "verified_student": self.verified_student,
             "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "moderated_at": self.moderated_at.isoformat() if self.moderated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "moderated_at": self.moderated_at,
             "moderation_reason": self.moderation_reason,
         }
-            
-        return data
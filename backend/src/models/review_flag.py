@@ -3,21 +3,37 @@
 Represents flags submitted by users to report inappropriate or problematic reviews.
 Enables community moderation and content quality control.
 """
-from datetime import datetime
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from typing import Optional, List, Tuple, TYPE_CHECKING
+from sqlalchemy import Column, DateTime, Boolean, Text, ForeignKey, Index, select, text
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.sql import func
 import uuid
 
-from src.lib.database import Base
+from src.models.base import Base, column_values, uuid7
 
 if TYPE_CHECKING:
     from src.models.user import User
     from src.models.review import Review
 
 
+_FLAG_TYPES: Tuple[str, ...] = (
+    "spam",
+    "inappropriate",
+    "fake",
+    "offensive",
+    "harassment",
+    "misinformation",
+    "duplicate",
+    "other",
+)
+_VALID_FLAG_TYPES = frozenset(_FLAG_TYPES)
+
+# Native enum types (see scripts/convert_review_flag_columns_to_enum.sql)
+_FLAG_TYPE = ENUM(*_FLAG_TYPES, name="review_flag_type", create_type=False)
+_FLAG_STATUS = ENUM("pending", "reviewed", "dismissed", "action_taken", name="review_flag_status", create_type=False)
+
+
 class ReviewFlag(Base):
     """ReviewFlag model for reporting inappropriate content.
     
@@ -30,7 +46,7 @@ class ReviewFlag(Base):
         reporter_id: Reference to user who submitted flag
         flag_type: Type of violation (spam, inappropriate, etc.)
         description: Detailed description of the issue
-        status: Flag processing status (pending, reviewed, dismissed)
+        status: Flag processing status (pending, reviewed, dismissed, action_taken)
         created_at: Flag submission timestamp
         reviewed_at: When flag was reviewed by moderator
         reviewed_by: Administrator who reviewed the flag
@@ -44,18 +60,18 @@ class ReviewFlag(Base):
     __tablename__ = "review_flags"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Foreign keys
-    review_id = Column(UUID(as_uuid=True), ForeignKey("reviews.id"), nullable=False, index=True)
+    review_id = Column(UUID(as_uuid=True), ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False, index=True)
     reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Flag details
-    flag_type = Column(String(50), nullable=False, index=True)  # spam, inappropriate, fake, offensive, etc.
+    flag_type = Column(_FLAG_TYPE, nullable=False, index=True)
     description = Column(Text, nullable=True)
     
     # Status and moderation
-    status = Column(String(20), default="pending", nullable=False, index=True)  # pending, reviewed, dismissed
+    status = Column(_FLAG_STATUS, default="pending", nullable=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -66,8 +82,20 @@ class ReviewFlag(Base):
     resolution_notes = Column(Text, nullable=True)
     
     # Relationships
-    review = relationship("Review", back_populates="flags")
-    reporter = relationship("User", back_populates="review_flags")
+    # lazy="raise": flag lists load these with selectinload() (see
+    # list_with_review) rather than issuing one SELECT per flag
+    review = relationship("Review", back_populates="flags", lazy="raise")
+    reporter = relationship("User", back_populates="review_flags", lazy="raise")
+    
+    __table_args__ = (
+        # Moderator queue of pending flags, oldest first. Resolved flags are
+        # the bulk of the table and never enter the index.
+        Index(
+            "idx_review_flags_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
     
     def __repr__(self) -> str:
         """String representation of ReviewFlag."""
@@ -98,7 +126,7 @@ class ReviewFlag(Base):
         """
         self.status = action
         self.reviewed_by = moderator_id
-        self.reviewed_at = datetime.utcnow()
+        self.reviewed_at = func.now()  # Stamped by the database on flush
         self.resolution_notes = notes
     
     @classmethod
@@ -108,16 +136,7 @@ class ReviewFlag(Base):
         Returns:
             List[str]: Valid flag type options
         """
-        return [
-            "spam",
-            "inappropriate",
-            "fake",
-            "offensive",
-            "harassment",
-            "misinformation",
-            "duplicate",
-            "other"
-        ]
+        return list(_FLAG_TYPES)
     
     def validate_flag_type(self) -> bool:
         """Validate that flag type is allowed.
@@ -125,28 +144,66 @@ class ReviewFlag(Base):
         Returns:
             bool: True if flag type is valid
         """
-        return self.flag_type in self.get_flag_types()
+        return self.flag_type in _VALID_FLAG_TYPES
+    
+    @classmethod
+    def list_with_review(
+        cls,
+        session,
+        *criteria,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List["ReviewFlag"]:
+        """List flags with their review and reporter eagerly loaded, newest first.
+        
+        Reviews and reporters are fetched with one extra SELECT ... WHERE id IN (...)
+        each instead of one lazy load per flag.
+        
+        Args:
+            session: Database session
+            *criteria: Optional filter expressions, e.g. ReviewFlag.status == "pending"
+            limit: Maximum number of flags to return
+            offset: Number of flags to skip
+            
+        Returns:
+            List[ReviewFlag]: Flags with .review and .reporter already loaded
+        """
+        result = session.execute(
+            select(cls)
+            .options(selectinload(cls.review), selectinload(cls.reporter))
+            .where(*criteria)
+            .order_by(cls.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result.scalars())
     
     def to_dict(self, include_review: bool = False) -> dict:
         """Convert flag to dictionary representation.
         
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively. Column values are read from the instance __dict__
+        rather than through the attribute descriptors.
+        
         Args:
-            include_review: Whether to include review information
+            include_review: Whether to include review information (the review
+                must be eagerly loaded, e.g. via list_with_review)
             
         Returns:
             dict: Flag data
         """
+        d = column_values(self)
         data = {
-            "id": str(self.id),
-            "review_id": str(self.review_id),
-            "reporter_id": str(self.reporter_id),
-            "flag_type": self.flag_type,
-            "description": self.description,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at else None,
-            "reviewed_by": str(self.reviewed_by) if self.reviewed_by else None,
-            "resolution_notes": self.resolution_notes,
+            "id": d.get("id"),
+            "review_id": d.get("review_id"),
+            "reporter_id": d.get("reporter_id"),
+            "flag_type": d.get("flag_type"),
+            "description": d.get("description"),
+            "status": d.get("status"),
+            "created_at": d.get("created_at"),
+            "reviewed_at": d.get("reviewed_at"),
+            "reviewed_by": d.get("reviewed_by"),
+            "resolution_notes": d.get("resolution_notes"),
         }
         
         if include_review and self.review:
@@ -5,13 +5,12 @@ review quality assessment and ranking.
 """
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Boolean, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
-from src.lib.database import Base
+from src.models.base import Base, uuid7
 
 if TYPE_CHECKING:
     from src.models.user import User
@@ -28,7 +27,7 @@ class ReviewVote(Base):
         id: Unique UUID identifier
         review_id: Reference to review being voted on
         user_id: Reference to user who submitted vote
-        vote_type: Type of vote (helpful or not_helpful)
+        is_helpful: True for a helpful vote, False for not helpful
         created_at: Vote submission timestamp
         
     Relationships:
@@ -39,14 +38,14 @@ class ReviewVote(Base):
     __tablename__ = "review_votes"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Foreign keys
     review_id = Column(UUID(as_uuid=True), ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Vote data
-    vote_type = Column(String(20), nullable=False)  # 'helpful' or 'not_helpful'
+    is_helpful = Column(Boolean, nullable=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -61,14 +60,14 @@ class ReviewVote(Base):
     )
     
     def __repr__(self) -> str:
-        return f"<ReviewVote(id={self.id}, review_id={self.review_id}, vote_type={self.vote_type})>"
+        return f"<ReviewVote(id={self.id}, review_id={self.review_id}, is_helpful={self.is_helpful})>"
     
     @property
     def is_helpful_vote(self) -> bool:
         """Check if this is a helpful vote."""
-        return self.vote_type == 'helpful'
+        return self.is_helpful
     
     @property
     def is_not_helpful_vote(self) -> bool:
         """Check if this is a not helpful vote."""
-        return self.vote_type == 'not_helpful'
\ No newline at end of file
+        return not self.is_helpful
\ No newline at end of file
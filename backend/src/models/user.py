@@ -5,13 +5,13 @@ Includes authentication, profile management, and relationship tracking.
 """
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text
+from sqlalchemy import Column, Computed, String, DateTime, Boolean, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
-from src.lib.database import Base
+from src.models.base import Base, column_values, uuid7
 
 if TYPE_CHECKING:
     from src.models.review import Review
@@ -30,6 +30,7 @@ class User(Base):
         password_hash: Hashed password using bcrypt
         first_name: Student's first name
         last_name: Student's last name
+        full_name: First and last name (hybrid over the generated column)
         college_id: Reference to student's college
         is_verified: Whether email is verified
         is_active: Whether account is active (not banned)
@@ -46,7 +47,7 @@ class User(Base):
     __tablename__ = "users"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Authentication fields
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -55,6 +56,12 @@ class User(Base):
     # Profile fields
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
+    # Computed by Postgres on every write (see scripts/add_user_full_name.sql)
+    stored_full_name = Column(
+        "full_name",
+        String(201),
+        Computed("btrim(COALESCE(first_name, '') || ' ' || COALESCE(last_name, ''))", persisted=True),
+    )
     
     # College association
     college_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # Optional during signup
@@ -78,10 +85,21 @@ class User(Base):
         """String representation of User."""
         return f"<User(id={self.id}, email={self.email}, name={self.first_name} {self.last_name})>"
     
-    @property
+    @hybrid_property
     def full_name(self) -> str:
-        """Get user's full name."""
-        return f"{self.first_name} {self.last_name}"
+        """First and last name joined by a space.
+        
+        Uses the database-generated column once the user has been loaded or
+        flushed, and only joins the names in Python for unsaved users. In SQL
+        it maps to the stored column, so queries can filter and order by it.
+        """
+        if self.stored_full_name is not None:
+            return self.stored_full_name
+        return f"{self.first_name or ''} {self.last_name or ''}".strip()
+    
+    @full_name.expression
+    def full_name(cls):
+        return cls.stored_full_name
     
     def can_submit_review(self) -> bool:
         """Check if user can submit reviews.
@@ -102,19 +120,24 @@ class User(Base):
     def to_dict(self) -> dict:
         """Convert user to dictionary representation.
         
+        UUIDs and timestamps are returned as-is; ORJSONResponse serializes
+        them natively. Column values are read from the instance __dict__
+        rather than through the attribute descriptors.
+        
         Returns:
             dict: User data without sensitive fields
         """
+        d = column_values(self)
         return {
-            "id": str(self.id),
-            "email": self.email,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
+            "id": d.get("id"),
+            "email": d.get("email"),
+            "first_name": d.get("first_name"),
+            "last_name": d.get("last_name"),
             "full_name": self.full_name,
-            "college_id": str(self.college_id) if self.college_id else None,
-            "is_verified": self.is_verified,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
+            "college_id": d.get("college_id"),
+            "is_verified": d.get("is_verified"),
+            "is_active": d.get("is_active"),
+            "created_at": d.get("created_at"),
+            "updated_at": d.get("updated_at"),
+            "last_login_at": d.get("last_login_at"),
         }
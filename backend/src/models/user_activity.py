@@ -3,13 +3,13 @@
 Tracks user actions to implement rate limiting and prevent abuse.
 """
 from datetime import datetime, date
-from typing import Optional
-from sqlalchemy import Column, String, DateTime, Date, Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from typing import Dict, Optional
+from sqlalchemy import Column, String, DateTime, Date, Integer, ForeignKey, Index, bindparam, select
+from sqlalchemy.dialects.postgresql import INET, UUID, insert
 from sqlalchemy.sql import func
-import uuid
 
-from src.lib.database import Base
+from src.lib.rate_limits import DAILY_LIMITS  # Re-exported for existing imports
+from src.models.base import Base, uuid7
 
 
 class UserActivity(Base):
@@ -34,24 +34,32 @@ class UserActivity(Base):
     """
     
     __tablename__ = "user_activities"
+    __table_args__ = (
+        # One row per user, action and day: backs the rate-limit lookup and
+        # the ON CONFLICT target of increment_user_activity()
+        Index("idx_user_activities_unique", "user_id", "action_type", "action_date", unique=True),
+    )
+    # Fetch the database-stamped timestamps with RETURNING on the INSERT or
+    # UPDATE itself, rather than a SELECT on the next attribute access
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # User and action information
-    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    action_type = Column(String(50), nullable=False, index=True)  # professor_create, review_create, etc.
-    action_date = Column(Date, nullable=False, index=True)  # For daily rate limiting
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    action_type = Column(String(50), nullable=False)  # professor_create, review_create, etc.
+    action_date = Column(Date, nullable=False)  # For daily rate limiting
     action_count = Column(Integer, nullable=False, default=1)
-    last_action_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
+    last_action_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Optional target and context
-    target_id = Column(String(100), nullable=True)  # ID of created professor, review, etc.
-    ip_address = Column(String(45), nullable=True)  # IPv4/IPv6 address
+    target_id = Column(UUID(as_uuid=True), nullable=True)  # ID of created professor, review, etc.
+    ip_address = Column(INET, nullable=True)  # IPv4/IPv6 address
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), index=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
         return f"<UserActivity(user_id={self.user_id}, action_type={self.action_type}, date={self.action_date}, count={self.action_count})>"
@@ -72,19 +80,47 @@ class UserActivity(Base):
         if target_date is None:
             target_date = date.today()
             
-        result = session.query(cls).filter(
+        # Only the count column, not a whole UserActivity instance
+        count = session.scalar(_DAILY_COUNT_STMT, {
+            "user_id": user_id,
+            "action_type": action_type,
+            "action_date": target_date,
+        })
+        
+        return count or 0
+    
+    @classmethod
+    def get_daily_counts(cls, session, user_id: str, target_date: Optional[date] = None) -> Dict[str, int]:
+        """Get counts for every action type performed by user on specific date.
+        
+        Args:
+            session: Database session
+            user_id: User UUID
+            target_date: Date to check (defaults to today)
+            
+        Returns:
+            Dict mapping action type to number of actions performed on the date
+        """
+        if target_date is None:
+            target_date = date.today()
+        
+        rows = session.query(cls.action_type, cls.action_count).filter(
             cls.user_id == user_id,
-            cls.action_type == action_type,
             cls.action_date == target_date
-        ).first()
+        ).all()
         
-        return result.action_count if result else 0
+        return {action_type: action_count for action_type, action_count in rows}
     
     @classmethod
     def increment_daily_count(cls, session, user_id: str, action_type: str, 
                             target_id: Optional[str] = None, ip_address: Optional[str] = None) -> 'UserActivity':
         """Increment daily count for user action.
         
+        A single INSERT ... ON CONFLICT DO UPDATE on idx_user_activities_unique,
+        like the increment_user_activity() RPC: one round trip, and concurrent
+        requests cannot both insert a first row for the day. The caller owns
+        the transaction and commits it.
+        
         Args:
             session: Database session
             user_id: User UUID
@@ -95,44 +131,36 @@ class UserActivity(Base):
         Returns:
             UserActivity record (created or updated)
         """
-        today = date.today()
-        
-        # Try to find existing record for today
-        existing = session.query(cls).filter(
-            cls.user_id == user_id,
-            cls.action_type == action_type,
-            cls.action_date == today
-        ).first()
-        
-        if existing:
-            # Update existing record
-            existing.action_count += 1
-            existing.last_action_at = func.now()
-            if target_id:
-                existing.target_id = target_id
-            if ip_address:
-                existing.ip_address = ip_address
-            session.commit()
-            return existing
-        else:
-            # Create new record
-            new_activity = cls(
-                user_id=user_id,
-                action_type=action_type,
-                action_date=today,
-                action_count=1,
-                target_id=target_id,
-                ip_address=ip_address
-            )
-            session.add(new_activity)
-            session.commit()
-            return new_activity
+        stmt = insert(cls).values(
+            user_id=user_id,
+            action_type=action_type,
+            action_date=date.today(),
+            action_count=1,
+            target_id=target_id,
+            ip_address=ip_address,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "action_type", "action_date"],
+            set_={
+                "action_count": cls.action_count + 1,
+                "last_action_at": func.now(),
+                # Keep the previous target/IP when none is given
+                "target_id": func.coalesce(stmt.excluded.target_id, cls.target_id),
+                "ip_address": func.coalesce(stmt.excluded.ip_address, cls.ip_address),
+                "updated_at": func.now(),
+            },
+        )
+        return session.scalars(
+            stmt.returning(cls),
+            execution_options={"populate_existing": True},
+        ).one()
 
 
-# Rate limiting constants
-DAILY_LIMITS = {
-    'professor_create': 3,
-    'review_create': 10,  # Future use
-    'college_review_create': 5,  # Future use
-    'flag_create': 20,  # Future use
-}
\ No newline at end of file
+# Built once: the rate-limit check runs on every write, so reuse one statement
+# (and its compiled-cache entry) instead of constructing it per call
+_user_activities = UserActivity.__table__
+_DAILY_COUNT_STMT = select(_user_activities.c.action_count).where(
+    _user_activities.c.user_id == bindparam("user_id"),
+    _user_activities.c.action_type == bindparam("action_type"),
+    _user_activities.c.action_date == bindparam("action_date"),
+)
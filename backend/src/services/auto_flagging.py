@@ -5,14 +5,31 @@ This module provides automatic flagging capabilities that integrate with
 the content filter to automatically flag inappropriate content.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import re
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Any
 from supabase import Client
 from .content_filter import content_filter, ContentAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Reviews analyzed at once by iter_existing_content_analysis
+BULK_ANALYSIS_CONCURRENCY = 16
+# Reviews of each kind read per request by iter_existing_content_analysis
+BULK_ANALYSIS_PAGE_SIZE = 100
+
+# Flag type for each content analysis reason keyword. Low quality has no flag
+# type of its own in the review_flag_type / college_review_flag_type enums.
+_FLAG_TYPE_MAPPING = {
+    "profanity": "inappropriate",
+    "spam": "spam",
+    "quality": "other",
+    "sentiment": "harassment"
+}
+_FLAG_REASON_RE = re.compile("|".join(_FLAG_TYPE_MAPPING), re.IGNORECASE)
+
 class AutoFlaggingSystem:
     """Automated flagging system for content moderation."""
     
@@ -22,14 +39,15 @@ class AutoFlaggingSystem:
         self.system_user_id = "00000000-0000-0000-0000-000000000000"  # System user for auto-flags
         
     async def process_review_content(self, review_id: str, review_text: str, 
-                                   reviewer_id: str) -> ContentAnalysis:
+                                   reviewer_id: Optional[str] = None) -> ContentAnalysis:
         """
         Process review content and auto-flag if necessary.
         
         Args:
             review_id: ID of the review
             review_text: Text content of the review
-            reviewer_id: ID of the user who wrote the review
+            reviewer_id: ID of the user who wrote the review (unused; reviews
+                are anonymous)
             
         Returns:
             ContentAnalysis object with filtering results
@@ -38,22 +56,17 @@ class AutoFlaggingSystem:
             # Analyze content
             analysis = content_filter.analyze_content(review_text)
             
-            # If content should be auto-flagged, create flags and keep as pending
-            if analysis.auto_flag:
-                await self._create_auto_flags(review_id, analysis.flag_reasons, reviewer_id)
-                
-                # Update review moderation status to pending (requires admin review)
-                await self._update_review_moderation_status(review_id, "pending")
-                
+            # Flagged content stays pending (requires admin review), clean
+            # content is auto-approved. Flags, status and the analysis log are
+            # written together by one RPC.
+            saved = await self._save_moderation('process_review_moderation', review_id, analysis)
+            
+            # Only report what was saved; _save_moderation logs failures
+            if saved and analysis.auto_flag:
                 logger.info(f"Auto-flagged review {review_id} for reasons: {analysis.flag_reasons}")
-            else:
-                # Content is clean, auto-approve it
-                await self._update_review_moderation_status(review_id, "approved")
+            elif saved:
                 logger.info(f"Auto-approved clean review {review_id}")
             
-            # Log content analysis for monitoring
-            await self._log_content_analysis(review_id, analysis)
-            
             return analysis
             
         except Exception as e:
@@ -72,14 +85,15 @@ class AutoFlaggingSystem:
             )
     
     async def process_college_review_content(self, review_id: str, review_text: str, 
-                                           reviewer_id: str) -> ContentAnalysis:
+                                           reviewer_id: Optional[str] = None) -> ContentAnalysis:
         """
         Process college review content and auto-flag if necessary.
         
         Args:
             review_id: ID of the college review
             review_text: Text content of the review
-            reviewer_id: ID of the user who wrote the review
+            reviewer_id: ID of the user who wrote the review (unused; reviews
+                are anonymous)
             
         Returns:
             ContentAnalysis object with filtering results
@@ -88,22 +102,17 @@ class AutoFlaggingSystem:
             # Analyze content
             analysis = content_filter.analyze_content(review_text)
             
-            # If content should be auto-flagged, create flags and keep as pending
-            if analysis.auto_flag:
-                await self._create_auto_college_flags(review_id, analysis.flag_reasons, reviewer_id)
-                
-                # Update college review moderation status to pending (requires admin review)
-                await self._update_college_review_moderation_status(review_id, "pending")
-                
+            # Flagged content stays pending (requires admin review), clean
+            # content is auto-approved. Flags, status and the analysis log are
+            # written together by one RPC.
+            saved = await self._save_moderation('process_college_review_moderation', review_id, analysis)
+            
+            # Only report what was saved; _save_moderation logs failures
+            if saved and analysis.auto_flag:
                 logger.info(f"Auto-flagged college review {review_id} for reasons: {analysis.flag_reasons}")
-            else:
-                # Content is clean, auto-approve it
-                await self._update_college_review_moderation_status(review_id, "approved")
+            elif saved:
                 logger.info(f"Auto-approved clean college review {review_id}")
             
-            # Log content analysis for monitoring
-            await self._log_college_content_analysis(review_id, analysis)
-            
             return analysis
             
         except Exception as e:
@@ -121,176 +130,84 @@ class AutoFlaggingSystem:
                 cleaned_text=review_text
             )
     
-    async def _create_auto_flags(self, review_id: str, reasons: List[str], reviewer_id: str):
-        """Create automatic flags for a professor review."""
-        try:
-            # Map reasons to flag types
-            flag_type_mapping = {
-                "profanity": "inappropriate",
-                "spam": "spam",
-                "quality": "low_quality",
-                "sentiment": "harassment"
-            }
-            
-            for reason in reasons:
-                # Determine flag type based on reason
-                flag_type = "inappropriate"  # default
-                for key, value in flag_type_mapping.items():
-                    if key.lower() in reason.lower():
-                        flag_type = value
-                        break
-                
-                # Create flag record
-                flag_data = {
-                    "review_id": review_id,
-                    "reporter_id": self.system_user_id,
-                    "flag_type": flag_type,
-                    "description": f"Auto-flagged: {reason}",
-                    "is_auto_generated": True,
-                    "created_at": datetime.utcnow().isoformat()
-                }
-                
-                result = self.supabase.table('review_flags').insert(flag_data).execute()
-                if not result.data:
-                    logger.error(f"Failed to create auto-flag for review {review_id}")
-                    
-        except Exception as e:
-            logger.error(f"Error creating auto-flags for review {review_id}: {str(e)}")
-    
-    async def _create_auto_college_flags(self, review_id: str, reasons: List[str], reviewer_id: str):
-        """Create automatic flags for a college review."""
-        try:
-            # Map reasons to flag types
-            flag_type_mapping = {
-                "profanity": "inappropriate",
-                "spam": "spam",
-                "quality": "low_quality",
-                "sentiment": "harassment"
-            }
+    def _build_flags(self, reasons: List[str]) -> List[Dict[str, Any]]:
+        """Build one auto-flag per reason.
+        
+        Args:
+            reasons: Flag reasons from the content analysis
             
-            for reason in reasons:
-                # Determine flag type based on reason
-                flag_type = "inappropriate"  # default
-                for key, value in flag_type_mapping.items():
-                    if key.lower() in reason.lower():
-                        flag_type = value
-                        break
-                
-                # Create flag record
-                flag_data = {
-                    "college_review_id": review_id,
-                    "reporter_id": self.system_user_id,
-                    "flag_type": flag_type,
-                    "description": f"Auto-flagged: {reason}",
-                    "is_auto_generated": True,
-                    "created_at": datetime.utcnow().isoformat()
-                }
-                
-                result = self.supabase.table('college_review_flags').insert(flag_data).execute()
-                if not result.data:
-                    logger.error(f"Failed to create auto-flag for college review {review_id}")
-                    
-        except Exception as e:
-            logger.error(f"Error creating auto-flags for college review {review_id}: {str(e)}")
-    
-    async def _update_review_moderation_status(self, review_id: str, status: str):
-        """Update moderation status of a professor review."""
-        try:
-            result = self.supabase.table('reviews').update({
-                "moderation_status": status,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", review_id).execute()
+        Returns:
+            List of flags (reporter, type and description); the review
+            reference and timestamps are filled in by the database
+        """
+        flags = []
+        for reason in reasons:
+            # Determine flag type based on reason (default: inappropriate)
+            match = _FLAG_REASON_RE.search(reason)
+            flag_type = _FLAG_TYPE_MAPPING[match.group().lower()] if match else "inappropriate"
             
-            if not result.data:
-                logger.error(f"Failed to update moderation status for review {review_id}")
-                
-        except Exception as e:
-            logger.error(f"Error updating review moderation status {review_id}: {str(e)}")
+            flags.append({
+                "reporter_id": self.system_user_id,
+                "flag_type": flag_type,
+                "description": f"Auto-flagged: {reason}"
+            })
+        return flags
     
-    async def _update_college_review_moderation_status(self, review_id: str, status: str):
-        """Update moderation status of a college review."""
-        try:
-            result = self.supabase.table('college_reviews').update({
-                "moderation_status": status,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", review_id).execute()
+    async def _save_moderation(self, function: str, review_id: str, analysis: ContentAnalysis) -> bool:
+        """Write a review's auto-flags, moderation status and analysis log.
+        
+        The RPC (see scripts/create_process_review_moderation_functions.sql)
+        performs all three writes in one round trip. Flags and status commit
+        together, so a review is never left flagged without its status or the
+        other way round; the analysis log is best-effort. The blocking
+        Supabase call runs in a worker thread.
+        
+        Args:
+            function: process_review_moderation or process_college_review_moderation
+            review_id: ID of the analyzed review
+            analysis: Content analysis result
             
-            if not result.data:
-                logger.error(f"Failed to update moderation status for college review {review_id}")
-                
-        except Exception as e:
-            logger.error(f"Error updating college review moderation status {review_id}: {str(e)}")
-    
-    async def _log_content_analysis(self, review_id: str, analysis: ContentAnalysis):
-        """Log content analysis results for monitoring."""
-        try:
-            log_data = {
-                "review_id": review_id,
+        Returns:
+            True if the flags and status were saved, False if the RPC failed
+        """
+        flags = self._build_flags(analysis.flag_reasons) if analysis.auto_flag else []
+        params = {
+            "p_review_id": review_id,
+            "p_status": "pending" if analysis.auto_flag else "approved",
+            "p_flags": flags,
+            "p_log": {
                 "profanity_score": analysis.profanity_score,
                 "spam_score": analysis.spam_score,
                 "quality_score": analysis.quality_score,
                 "sentiment_score": analysis.sentiment_score,
                 "auto_flagged": analysis.auto_flag,
                 "flag_reasons": analysis.flag_reasons,
-                "analyzed_at": datetime.utcnow().isoformat()
-            }
-            
-            # Store in content_analysis_logs table (we'll create this)
-            result = self.supabase.table('content_analysis_logs').insert(log_data).execute()
-            
-        except Exception as e:
-            # Don't fail the main process if logging fails
-            logger.warning(f"Failed to log content analysis for review {review_id}: {str(e)}")
-    
-    async def _log_college_content_analysis(self, review_id: str, analysis: ContentAnalysis):
-        """Log college content analysis results for monitoring."""
+            },
+        }
         try:
-            log_data = {
-                "college_review_id": review_id,
-                "profanity_score": analysis.profanity_score,
-                "spam_score": analysis.spam_score,
-                "quality_score": analysis.quality_score,
-                "sentiment_score": analysis.sentiment_score,
-                "auto_flagged": analysis.auto_flag,
-                "flag_reasons": analysis.flag_reasons,
-                "analyzed_at": datetime.utcnow().isoformat()
-            }
-            
-            # Store in college_content_analysis_logs table (we'll create this)
-            result = self.supabase.table('college_content_analysis_logs').insert(log_data).execute()
-            
+            await asyncio.to_thread(self.supabase.rpc(function, params).execute)
         except Exception as e:
-            # Don't fail the main process if logging fails
-            logger.warning(f"Failed to log college content analysis for review {review_id}: {str(e)}")
+            logger.error(f"Error saving moderation result for review {review_id}: {str(e)}")
+            return False
+        return True
     
     async def get_auto_flag_stats(self) -> Dict[str, Any]:
         """Get statistics about auto-flagging system."""
         try:
-            # Get auto-flag counts
-            auto_flags_result = self.supabase.table('review_flags').select(
-                'id, flag_type, created_at'
-            ).eq('is_auto_generated', True).execute()
-            
-            college_auto_flags_result = self.supabase.table('college_review_flags').select(
-                'id, flag_type, created_at'
-            ).eq('is_auto_generated', True).execute()
+            # Counted per flag type in Postgres (see
+            # scripts/create_auto_flag_stats_function.sql)
+            result = await asyncio.to_thread(self.supabase.rpc('get_auto_flag_stats', {}).execute)
             
-            auto_flags = auto_flags_result.data or []
-            college_auto_flags = college_auto_flags_result.data or []
-            
-            # Calculate statistics
-            total_auto_flags = len(auto_flags) + len(college_auto_flags)
-            
-            # Flag type distribution
+            totals = {"review": 0, "college_review": 0}
             flag_types = {}
-            for flag in auto_flags + college_auto_flags:
-                flag_type = flag.get('flag_type', 'unknown')
-                flag_types[flag_type] = flag_types.get(flag_type, 0) + 1
+            for row in result.data or []:
+                totals[row['source']] = totals.get(row['source'], 0) + row['flag_count']
+                flag_types[row['flag_type']] = flag_types.get(row['flag_type'], 0) + row['flag_count']
             
             return {
-                "total_auto_flags": total_auto_flags,
-                "professor_review_flags": len(auto_flags),
-                "college_review_flags": len(college_auto_flags),
+                "total_auto_flags": sum(totals.values()),
+                "professor_review_flags": totals["review"],
+                "college_review_flags": totals["college_review"],
                 "flag_type_distribution": flag_types,
                 "content_filter_stats": content_filter.get_filter_stats()
             }
@@ -305,71 +222,130 @@ class AutoFlaggingSystem:
                 "content_filter_stats": content_filter.get_filter_stats()
             }
     
-    async def bulk_analyze_existing_content(self, limit: int = 100) -> Dict[str, Any]:
+    async def iter_existing_content_analysis(self, limit: int = 100,
+                                             since: Optional[datetime] = None,
+                                             until: Optional[datetime] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze existing content, yielding each review's result as it finishes.
+        
+        Up to BULK_ANALYSIS_CONCURRENCY reviews are analyzed at a time, and
+        results come out in completion order, so callers can report progress
+        without waiting for the slowest review.
+        
+        Each table is read in keyset pages of BULK_ANALYSIS_PAGE_SIZE, ordered
+        by id and continuing after the last id read, within the window
+        since < updated_at <= until. Analyzing a review bumps its updated_at
+        past until, so rows only ever leave the window during the scan and
+        are never skipped or read twice; they are picked up by the next scan
+        (since=until).
+        
+        Args:
+            limit: Maximum number of reviews of each kind to process
+            since: Only analyze reviews updated after this time
+            until: Only analyze reviews updated up to this time (default: now)
+            
+        Yields:
+            Dict with "kind" (review or college review), "review_id", and either
+            "analysis" (ContentAnalysis) or "error" (exception message)
+        """
+        if until is None:
+            until = datetime.now(timezone.utc)
+        
+        def page(table: str, after_id: Optional[str], size: int):
+            # Reviews are anonymous, so no author column is read
+            query = self.supabase.table(table).select(
+                'id, review_text'
+            ).eq('status', 'approved').lte('updated_at', until.isoformat())
+            if since is not None:
+                query = query.gt('updated_at', since.isoformat())
+            if after_id is not None:
+                query = query.gt('id', after_id)
+            return query.order('id').limit(size).execute
+        
+        sources = [
+            ("review", 'reviews', self.process_review_content),
+            ("college review", 'college_reviews', self.process_college_review_content),
+        ]
+        cursors: Dict[str, Optional[str]] = {table: None for _, table, _ in sources}
+        remaining = {table: limit for _, table, _ in sources}
+        
+        semaphore = asyncio.Semaphore(BULK_ANALYSIS_CONCURRENCY)
+        
+        async def analyze(kind, process, review):
+            result = {"kind": kind, "review_id": review['id']}
+            try:
+                async with semaphore:
+                    result["analysis"] = await process(review['id'], review['review_text'])
+            except Exception as e:
+                result["error"] = str(e)
+            return result
+        
+        while True:
+            active = [source for source in sources if remaining[source[1]] > 0]
+            if not active:
+                return
+            
+            # Fetch the next page of professor and college reviews concurrently
+            sizes = [min(BULK_ANALYSIS_PAGE_SIZE, remaining[table]) for _, table, _ in active]
+            results = await asyncio.gather(*(
+                asyncio.to_thread(page(table, cursors[table], size))
+                for (_, table, _), size in zip(active, sizes)
+            ))
+            
+            jobs = []
+            for (kind, table, process), size, result in zip(active, sizes, results):
+                rows = result.data or []
+                # A short page means the table is exhausted
+                remaining[table] = remaining[table] - len(rows) if len(rows) == size else 0
+                if rows:
+                    cursors[table] = rows[-1]['id']
+                jobs.extend((kind, process, row) for row in rows)
+            
+            tasks = [asyncio.ensure_future(analyze(*job)) for job in jobs]
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    yield await next_result
+            finally:
+                # Consumer stopped early: don't leave analyses running
+                for task in tasks:
+                    task.cancel()
+    
+    async def bulk_analyze_existing_content(self, limit: int = 100,
+                                            since: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Analyze existing content in bulk for retroactive flagging.
         
         Args:
-            limit: Maximum number of reviews to process in one batch
+            limit: Maximum number of reviews of each kind to process
+            since: Only analyze reviews updated after this time (pass the
+                previous scan's "until" to continue from it)
             
         Returns:
             Statistics about the bulk analysis
         """
         try:
+            until = datetime.now(timezone.utc)
             stats = {
                 "processed": 0,
                 "flagged": 0,
                 "errors": 0,
-                "flag_reasons": {}
+                "flag_reasons": {},
+                "until": until
             }
             
-            # Process professor reviews
-            reviews_result = self.supabase.table('reviews').select(
-                'id, review_text, student_id'
-            ).eq('moderation_status', 'approved').limit(limit).execute()
-            
-            for review in reviews_result.data or []:
-                try:
-                    analysis = await self.process_review_content(
-                        review['id'], 
-                        review['review_text'], 
-                        review['student_id']
-                    )
-                    
-                    stats["processed"] += 1
-                    
-                    if analysis.auto_flag:
-                        stats["flagged"] += 1
-                        for reason in analysis.flag_reasons:
-                            stats["flag_reasons"][reason] = stats["flag_reasons"].get(reason, 0) + 1
-                            
-                except Exception as e:
+            async for result in self.iter_existing_content_analysis(limit, since, until):
+                if "error" in result:
                     stats["errors"] += 1
-                    logger.error(f"Error processing review {review['id']}: {str(e)}")
-            
-            # Process college reviews
-            college_reviews_result = self.supabase.table('college_reviews').select(
-                'id, review_text, student_id'
-            ).eq('moderation_status', 'approved').limit(limit).execute()
-            
-            for review in college_reviews_result.data or []:
-                try:
-                    analysis = await self.process_college_review_content(
-                        review['id'], 
-                        review['review_text'], 
-                        review['student_id']
-                    )
-                    
-                    stats["processed"] += 1
-                    
-                    if analysis.auto_flag:
-                        stats["flagged"] += 1
-                        for reason in analysis.flag_reasons:
-                            stats["flag_reasons"][reason] = stats["flag_reasons"].get(reason, 0) + 1
-                            
-                except Exception as e:
-                    stats["errors"] += 1
-                    logger.error(f"Error processing college review {review['id']}: {str(e)}")
+                    logger.error(f"Error processing {result['kind']} {result['review_id']}: {result['error']}")
+                    continue
+                
+                analysis = result["analysis"]
+                stats["processed"] += 1
+                
+                if analysis.auto_flag:
+                    stats["flagged"] += 1
+                    for reason in analysis.flag_reasons:
+                        stats["flag_reasons"][reason] = stats["flag_reasons"].get(reason, 0) + 1
             
             logger.info(f"Bulk analysis completed: {stats}")
             return stats
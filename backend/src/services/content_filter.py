@@ -8,10 +8,11 @@ This module provides comprehensive content filtering capabilities including:
 - Auto-flagging system
 """
 
+import hashlib
 import re
 import logging
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from better_profanity import profanity
 from textblob import TextBlob
 import nltk
@@ -33,6 +34,9 @@ except LookupError:
 
 logger = logging.getLogger(__name__)
 
+# Analyses kept by ContentFilter.analyze_content, keyed by a hash of the text
+ANALYSIS_CACHE_MAX_SIZE = 4096
+
 @dataclass
 class ContentAnalysis:
     """Result of content analysis."""
@@ -61,6 +65,9 @@ class ContentFilter:
         self.QUALITY_THRESHOLD = 0.3
         self.SENTIMENT_THRESHOLD = -0.8
         
+        # Duplicate and templated reviews (spam especially) are analyzed once
+        self._analysis_cache: Dict[bytes, ContentAnalysis] = {}
+        
     def _setup_profanity_filter(self):
         """Setup profanity detection system."""
         # Load better-profanity with custom word list
@@ -141,6 +148,19 @@ class ContentFilter:
         Returns:
             ContentAnalysis object with all analysis results
         """
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest() if text else b""
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return replace(cached, flag_reasons=list(cached.flag_reasons))
+        
+        analysis = self._analyze_content(text)
+        if len(self._analysis_cache) >= ANALYSIS_CACHE_MAX_SIZE:
+            self._analysis_cache.clear()
+        self._analysis_cache[key] = analysis
+        return replace(analysis, flag_reasons=list(analysis.flag_reasons))
+    
+    def _analyze_content(self, text: str) -> ContentAnalysis:
+        """Run every analysis on the text (uncached body of analyze_content)."""
         if not text or not text.strip():
             return ContentAnalysis(
                 is_profane=False,
@@ -0,0 +1,128 @@
+"""Unit tests for saving auto-moderation results through the RPC.
+
+The Supabase client is a mock, so these tests run without a live
+Supabase project.
+"""
+import logging
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services import auto_flagging
+from src.services.auto_flagging import AutoFlaggingSystem
+from src.services.content_filter import ContentAnalysis
+
+
+REVIEW_ID = "00000000-0000-0000-0000-0000000000b1"
+
+
+def make_analysis(auto_flag, flag_reasons=()):
+    return ContentAnalysis(
+        is_profane=auto_flag,
+        profanity_score=0.9 if auto_flag else 0.0,
+        is_spam=False,
+        spam_score=0.0,
+        quality_score=1.0,
+        sentiment_score=0.0,
+        auto_flag=auto_flag,
+        flag_reasons=list(flag_reasons),
+        cleaned_text="text"
+    )
+
+
+async def test_flagged_review_is_saved_pending_with_flags():
+    supabase = MagicMock()
+    system = AutoFlaggingSystem(supabase)
+    
+    saved = await system._save_moderation(
+        'process_review_moderation', REVIEW_ID, make_analysis(True, ["Contains profanity"])
+    )
+    
+    assert saved is True
+    function, params = supabase.rpc.call_args.args
+    assert function == 'process_review_moderation'
+    assert params["p_review_id"] == REVIEW_ID
+    assert params["p_status"] == "pending"
+    assert [flag["flag_type"] for flag in params["p_flags"]] == ["inappropriate"]
+    assert params["p_log"]["auto_flagged"] is True
+
+
+async def test_clean_review_is_saved_approved_without_flags():
+    supabase = MagicMock()
+    system = AutoFlaggingSystem(supabase)
+    
+    saved = await system._save_moderation(
+        'process_college_review_moderation', REVIEW_ID, make_analysis(False)
+    )
+    
+    assert saved is True
+    _, params = supabase.rpc.call_args.args
+    assert params["p_status"] == "approved"
+    assert params["p_flags"] == []
+
+
+async def test_failed_rpc_is_not_reported_as_saved(caplog):
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.side_effect = RuntimeError("connection reset")
+    system = AutoFlaggingSystem(supabase)
+    
+    with caplog.at_level(logging.INFO, logger="src.services.auto_flagging"):
+        await system.process_review_content(REVIEW_ID, "A perfectly clean review.", "user-1")
+    
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("Error saving moderation result" in message for message in messages)
+    assert not any(message.startswith("Auto-") for message in messages)
+
+
+def make_scan_supabase(pages):
+    """Supabase mock whose reviews and college_reviews scans return pages in order."""
+    supabase = MagicMock()
+    tables = {}
+    for table, table_pages in pages.items():
+        mock = MagicMock()
+        query = mock.select.return_value.eq.return_value.lte.return_value
+        # Every filter/order/limit call returns the same query mock
+        query.gt.return_value = query
+        query.order.return_value = query
+        query.limit.return_value = query
+        query.execute.side_effect = [MagicMock(data=rows) for rows in table_pages]
+        tables[table] = mock
+    supabase.table.side_effect = tables.__getitem__
+    return supabase, tables
+
+
+async def test_existing_content_scan_reads_current_columns(monkeypatch):
+    row = {"id": REVIEW_ID, "review_text": "A perfectly clean review."}
+    supabase, tables = make_scan_supabase({"reviews": [[row]], "college_reviews": [[row]]})
+    system = AutoFlaggingSystem(supabase)
+    process = AsyncMock(return_value=make_analysis(False))
+    monkeypatch.setattr(system, "process_review_content", process)
+    monkeypatch.setattr(system, "process_college_review_content", process)
+    
+    results = [result async for result in system.iter_existing_content_analysis(limit=10)]
+    
+    for table in tables.values():
+        table.select.assert_called_once_with('id, review_text')
+        table.select.return_value.eq.assert_called_once_with('status', 'approved')
+    assert len(results) == 2
+    process.assert_awaited_with(REVIEW_ID, "A perfectly clean review.")
+
+
+async def test_existing_content_scan_pages_by_id_within_a_fixed_window(monkeypatch):
+    monkeypatch.setattr(auto_flagging, "BULK_ANALYSIS_PAGE_SIZE", 2)
+    ids = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(1, 4)]
+    rows = [{"id": review_id, "review_text": "text"} for review_id in ids]
+    supabase, tables = make_scan_supabase({"reviews": [rows[:2], rows[2:]], "college_reviews": [[]]})
+    system = AutoFlaggingSystem(supabase)
+    monkeypatch.setattr(system, "process_review_content", AsyncMock(return_value=make_analysis(False)))
+    until = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    
+    results = [result async for result in system.iter_existing_content_analysis(limit=10, until=until)]
+    
+    assert sorted(result["review_id"] for result in results) == ids
+    reviews = tables["reviews"]
+    reviews.select.return_value.eq.return_value.lte.assert_called_with('updated_at', until.isoformat())
+    query = reviews.select.return_value.eq.return_value.lte.return_value
+    # Second page continues after the last id of the first, ordered by id
+    query.gt.assert_called_once_with('id', ids[1])
+    query.order.assert_called_with('id')
+    assert query.execute.call_count == 2
@@ -0,0 +1,56 @@
+"""Unit tests for the client IP middleware."""
+import pytest
+
+from src.lib.client_ip import ClientIPMiddleware, parse_trusted_proxies
+
+
+PROXIES = parse_trusted_proxies("10.0.0.0/8, 127.0.0.1")
+
+
+def resolve(peer, headers=(), trusted=PROXIES):
+    middleware = ClientIPMiddleware(app=None, trusted_proxies=trusted)
+    return middleware.resolve({
+        "type": "http",
+        "client": (peer, 12345) if peer else None,
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+    })
+
+
+def test_forwarded_headers_ignored_from_untrusted_peer():
+    assert resolve("203.0.113.7", [("x-forwarded-for", "1.2.3.4")]) == "203.0.113.7"
+    assert resolve("203.0.113.7", [("x-real-ip", "1.2.3.4")]) == "203.0.113.7"
+
+
+def test_forwarded_headers_ignored_without_configured_proxies():
+    assert resolve("10.0.0.5", [("x-forwarded-for", "1.2.3.4")], trusted=()) == "10.0.0.5"
+
+
+def test_rightmost_untrusted_hop_wins_behind_trusted_proxy():
+    # The client prepended a spoofed entry; the proxy appended the real one
+    headers = [("x-forwarded-for", "6.6.6.6, 198.51.100.2, 10.0.0.9")]
+    assert resolve("10.0.0.5", headers) == "198.51.100.2"
+
+
+def test_x_real_ip_used_behind_trusted_proxy():
+    assert resolve("127.0.0.1", [("x-real-ip", "198.51.100.2")]) == "198.51.100.2"
+
+
+def test_invalid_values_become_none():
+    assert resolve("10.0.0.5", [("x-forwarded-for", "not-an-ip")]) is None
+    assert resolve(None) is None
+
+
+@pytest.mark.parametrize("scope_type", ["http", "websocket"])
+async def test_sets_scope_state_for_http_only(scope_type):
+    seen = {}
+    
+    async def app(scope, receive, send):
+        seen.update(scope)
+    
+    middleware = ClientIPMiddleware(app, trusted_proxies=PROXIES)
+    await middleware({"type": scope_type, "client": ("203.0.113.7", 1), "headers": []}, None, None)
+    
+    if scope_type == "http":
+        assert seen["state"]["client_ip"] == "203.0.113.7"
+    else:
+        assert "state" not in seen
@@ -0,0 +1,47 @@
+"""Unit tests for the debounced college_rating_stats refresh.
+
+The Supabase client is a mock, so these tests run without a live
+Supabase project.
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.lib import college_review_moderation
+
+
+@pytest.fixture(autouse=True)
+def no_delay(monkeypatch):
+    monkeypatch.setattr(college_review_moderation, "RATING_STATS_REFRESH_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(college_review_moderation, "_rating_stats_stale", False)
+    monkeypatch.setattr(college_review_moderation, "_rating_stats_refresh", None)
+
+
+async def test_burst_of_writes_shares_one_refresh():
+    supabase = MagicMock()
+    
+    for _ in range(5):
+        college_review_moderation.schedule_college_rating_stats_refresh(supabase)
+    await college_review_moderation._rating_stats_refresh
+    
+    supabase.rpc.assert_called_once_with('refresh_college_rating_stats', {})
+
+
+async def test_write_during_refresh_triggers_another():
+    supabase = MagicMock()
+    
+    def execute():
+        # A write lands while the first refresh is running
+        if supabase.rpc.call_count == 1:
+            loop.call_soon_threadsafe(
+                college_review_moderation.schedule_college_rating_stats_refresh, supabase
+            )
+    
+    loop = asyncio.get_running_loop()
+    supabase.rpc.return_value.execute.side_effect = execute
+    
+    college_review_moderation.schedule_college_rating_stats_refresh(supabase)
+    await college_review_moderation._rating_stats_refresh
+    
+    assert supabase.rpc.call_count == 2
@@ -0,0 +1,60 @@
+"""Unit tests for the professor rating fallback.
+
+The Supabase client is a mock, so these tests run without a live
+Supabase project.
+"""
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.lib import professor_ratings
+
+
+PROFESSOR_ID = "00000000-0000-0000-0000-0000000000a1"
+
+
+@pytest.fixture(autouse=True)
+def unchecked(monkeypatch):
+    monkeypatch.setattr(professor_ratings, "_trigger_installed", None)
+
+
+def make_supabase(trigger_installed=None, ratings=()):
+    supabase = MagicMock()
+    if isinstance(trigger_installed, Exception):
+        supabase.rpc.return_value.execute.side_effect = trigger_installed
+    else:
+        supabase.rpc.return_value.execute.return_value = Mock(data=trigger_installed)
+    supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = Mock(
+        data=[{"overall_rating": rating} for rating in ratings]
+    )
+    return supabase
+
+
+async def test_installed_trigger_skips_python_recompute():
+    supabase = make_supabase(trigger_installed=True)
+    
+    assert await professor_ratings.detect_professor_ratings_trigger(supabase) is True
+    await professor_ratings.sync_professor_ratings(supabase, PROFESSOR_ID)
+    
+    supabase.table.assert_not_called()
+
+
+async def test_missing_check_function_falls_back_to_recompute():
+    supabase = make_supabase(trigger_installed=RuntimeError("function not found"), ratings=(4, 5))
+    
+    assert await professor_ratings.detect_professor_ratings_trigger(supabase) is False
+    await professor_ratings.sync_professor_ratings(supabase, PROFESSOR_ID)
+    
+    supabase.table.return_value.update.assert_called_once_with(
+        {"average_rating": 4.5, "total_reviews": 2}
+    )
+
+
+async def test_recompute_resets_professor_without_approved_reviews():
+    supabase = make_supabase()
+    
+    await professor_ratings.sync_professor_ratings(supabase, PROFESSOR_ID)
+    
+    supabase.table.return_value.update.assert_called_once_with(
+        {"average_rating": 0.0, "total_reviews": 0}
+    )
@@ -0,0 +1,83 @@
+"""Unit tests for the quota handling in POST /professors.
+
+The Supabase client and the create_professor_with_quota RPC are replaced
+with mocks, so these tests run without a live Supabase project.
+"""
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from src.api import professors
+
+
+USER = {"id": "00000000-0000-0000-0000-000000000001"}
+COLLEGE_ID = "00000000-0000-0000-0000-0000000000c1"
+PROFESSOR_ID = "00000000-0000-0000-0000-0000000000a1"
+
+
+def make_supabase():
+    """Build a Supabase client mock for the college and duplicate checks."""
+    supabase = MagicMock()
+    colleges = MagicMock()
+    colleges.select.return_value.eq.return_value.single.return_value.execute.return_value = Mock(
+        data={"id": COLLEGE_ID, "name": "Test College"}
+    )
+    professors_table = MagicMock()
+    professors_table.select.return_value.eq.return_value.eq.return_value.execute.return_value = Mock(
+        data=[]
+    )
+    supabase.table.side_effect = lambda name: colleges if name == "colleges" else professors_table
+    return supabase
+
+
+@pytest.fixture
+def fastapi_request():
+    request = Mock()
+    request.state.client_ip = "10.0.0.1"
+    return request
+
+
+@pytest.fixture
+def professor():
+    return professors.ProfessorCreate(
+        name="Dr. Test", department="Computer Science", college_id=COLLEGE_ID
+    )
+
+
+async def test_insert_and_quota_use_one_rpc(monkeypatch, fastapi_request, professor):
+    rpc = AsyncMock(return_value=[{"id": PROFESSOR_ID}])
+    monkeypatch.setattr(professors, "call_rate_limited_rpc", rpc)
+    supabase = make_supabase()
+    
+    response = await professors.create_professor(professor, fastapi_request, USER, supabase)
+    
+    assert response["id"] == PROFESSOR_ID
+    rpc.assert_awaited_once()
+    _, function, params = rpc.await_args.args
+    assert function == "create_professor_with_quota"
+    assert params["p_user_id"] == USER["id"]
+    assert params["p_ip_address"] == "10.0.0.1"
+    assert params["p_professor"]["college_id"] == COLLEGE_ID
+    # Only the college and duplicate checks go through the table API
+    assert [call.args[0] for call in supabase.table.call_args_list] == ["colleges", "professors"]
+    supabase.table("professors").insert.assert_not_called()
+
+
+async def test_daily_limit_is_returned_as_429(monkeypatch, fastapi_request, professor):
+    rpc = AsyncMock(side_effect=HTTPException(status_code=429, detail="Daily limit exceeded."))
+    monkeypatch.setattr(professors, "call_rate_limited_rpc", rpc)
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await professors.create_professor(professor, fastapi_request, USER, make_supabase())
+    
+    assert exc_info.value.status_code == 429
+
+
+async def test_empty_rpc_result_is_a_500(monkeypatch, fastapi_request, professor):
+    monkeypatch.setattr(professors, "call_rate_limited_rpc", AsyncMock(return_value=[]))
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await professors.create_professor(professor, fastapi_request, USER, make_supabase())
+    
+    assert exc_info.value.status_code == 500
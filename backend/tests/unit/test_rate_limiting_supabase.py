@@ -0,0 +1,134 @@
+"""Unit tests for the Supabase rate-limit helpers.
+
+PostgREST is replaced with an httpx.MockTransport, so these tests run
+without a live Supabase project.
+"""
+import json
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from postgrest.exceptions import APIError
+
+from src.lib import rate_limiting_supabase
+
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.fixture
+def supabase():
+    """Supabase client stand-in exposing only the PostgREST auth headers."""
+    client = Mock()
+    client.postgrest.headers = {"apikey": "anon", "Authorization": "Bearer token"}
+    return client
+
+
+@pytest.fixture
+def rpc(monkeypatch):
+    """Route the shared REST client to a handler set by the test."""
+    calls = []
+    
+    def install(status_code, body):
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(status_code, json=body)
+        
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            base_url="https://test.supabase.co/rest/v1",
+        )
+        monkeypatch.setattr(rate_limiting_supabase, "get_rest_client", lambda: client)
+        return calls
+    
+    return install
+
+
+async def test_increment_posts_to_rpc_and_returns_count(supabase, rpc):
+    calls = rpc(200, 2)
+    
+    result = await rate_limiting_supabase.increment_action_count(
+        supabase, USER_ID, "professor_create", target_id="prof-1", ip_address="10.0.0.1"
+    )
+    
+    assert result["action_count"] == 2
+    assert result["target_id"] == "prof-1"
+    assert len(calls) == 1
+    assert calls[0].url.path == "/rest/v1/rpc/increment_user_activity"
+    assert calls[0].headers["Authorization"] == "Bearer token"
+    body = json.loads(calls[0].content)
+    assert body["p_user_id"] == USER_ID
+    assert body["p_action_type"] == "professor_create"
+    assert body["p_target_id"] == "prof-1"
+
+
+async def test_increment_maps_daily_limit_error_to_429(supabase, rpc):
+    rpc(400, {
+        "code": rate_limiting_supabase.RATE_LIMIT_ERROR_CODE,
+        "message": "Daily limit exceeded. You can only perform 3 professor create actions per day.",
+        "details": None,
+        "hint": "Please try again tomorrow.",
+    })
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await rate_limiting_supabase.increment_action_count(supabase, USER_ID, "professor_create")
+    
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.detail.startswith("Daily limit exceeded.")
+
+
+async def test_increment_reraises_other_errors(supabase, rpc):
+    rpc(403, {"code": "42501", "message": "permission denied", "details": None, "hint": None})
+    
+    with pytest.raises(APIError) as exc_info:
+        await rate_limiting_supabase.increment_action_count(supabase, USER_ID, "professor_create")
+    
+    assert exc_info.value.code == "42501"
+
+
+async def test_increment_invalidates_cached_count(supabase, rpc):
+    rpc(200, 1)
+    _, today_iso = rate_limiting_supabase._today()
+    cache_key = (USER_ID, "professor_create", today_iso)
+    rate_limiting_supabase._count_cache[cache_key] = (0.0, 0)
+    
+    await rate_limiting_supabase.increment_action_count(supabase, USER_ID, "professor_create")
+    
+    assert cache_key not in rate_limiting_supabase._count_cache
+
+
+@pytest.fixture
+def rest_only(monkeypatch):
+    """Read counts through PostgREST, starting from an empty count cache."""
+    monkeypatch.setattr(rate_limiting_supabase, "get_async_session_factory", lambda: None)
+    monkeypatch.setattr(rate_limiting_supabase, "_count_cache", {})
+
+
+async def test_daily_count_is_cached_within_ttl(supabase, rpc, rest_only):
+    calls = rpc(200, [{"action_count": 2}])
+    
+    first = await rate_limiting_supabase.get_daily_count(supabase, USER_ID, "review_create")
+    second = await rate_limiting_supabase.get_daily_count(supabase, USER_ID, "review_create")
+    
+    assert first == second == 2
+    assert len(calls) == 1
+
+
+async def test_daily_count_is_refetched_after_ttl(supabase, rpc, rest_only, monkeypatch):
+    calls = rpc(200, [{"action_count": 2}])
+    clock = [100.0]
+    monkeypatch.setattr(rate_limiting_supabase, "time", Mock(monotonic=lambda: clock[0]))
+    
+    await rate_limiting_supabase.get_daily_count(supabase, USER_ID, "review_create")
+    clock[0] += rate_limiting_supabase.COUNT_CACHE_TTL_SECONDS
+    await rate_limiting_supabase.get_daily_count(supabase, USER_ID, "review_create")
+    
+    assert len(calls) == 2
+
+
+async def test_daily_count_errors_count_as_zero_and_are_not_cached(supabase, rpc, rest_only):
+    rpc(500, {"message": "upstream error"})
+    
+    assert await rate_limiting_supabase.get_daily_count(supabase, USER_ID, "review_create") == 0
+    assert rate_limiting_supabase._count_cache == {}
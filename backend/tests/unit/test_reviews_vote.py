@@ -0,0 +1,79 @@
+"""Unit tests for the vote_type <-> is_helpful mapping in POST /reviews/{id}/vote.
+
+Votes are stored as a boolean but the API keeps the "helpful" /
+"not_helpful" strings. The Supabase admin client is a mock, so these tests
+run without a live Supabase project.
+"""
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.api import reviews
+from src.lib import database
+
+
+USER = {"id": "00000000-0000-0000-0000-000000000001"}
+REVIEW_ID = "00000000-0000-0000-0000-0000000000b1"
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    """Admin client mock with no existing vote and zero counts by default."""
+    client = MagicMock()
+    votes = MagicMock()
+    reviews_table = MagicMock()
+    votes.select.return_value.eq.return_value.eq.return_value.execute.return_value = Mock(data=[])
+    reviews_table.select.return_value.eq.return_value.single.return_value.execute.return_value = Mock(
+        data={"helpful_count": 0, "not_helpful_count": 0}
+    )
+    client.table.side_effect = lambda name: votes if name == "review_votes" else reviews_table
+    client.votes = votes
+    monkeypatch.setattr(database, "get_supabase_admin", lambda: client)
+    return client
+
+
+def set_existing_vote(admin, is_helpful, helpful_count, not_helpful_count):
+    admin.votes.select.return_value.eq.return_value.eq.return_value.execute.return_value = Mock(
+        data=[{"is_helpful": is_helpful}]
+    )
+    admin.table("reviews").select.return_value.eq.return_value.single.return_value.execute.return_value = Mock(
+        data={"helpful_count": helpful_count, "not_helpful_count": not_helpful_count}
+    )
+
+
+async def test_new_vote_stores_is_helpful(admin):
+    response = await reviews.vote_on_review(
+        REVIEW_ID, reviews.VoteRequest(vote_type="not_helpful"), USER, Mock()
+    )
+    
+    inserted = admin.votes.insert.call_args.args[0]
+    assert inserted["is_helpful"] is False
+    assert response["action"] == "created"
+    assert response["vote_type"] == "not_helpful"
+    assert response["not_helpful_count"] == 1
+
+
+async def test_changed_vote_maps_existing_boolean(admin):
+    set_existing_vote(admin, is_helpful=False, helpful_count=0, not_helpful_count=1)
+    
+    response = await reviews.vote_on_review(
+        REVIEW_ID, reviews.VoteRequest(vote_type="helpful"), USER, Mock()
+    )
+    
+    admin.votes.update.assert_called_once_with({"is_helpful": True})
+    assert response["action"] == "updated"
+    assert response["vote_type"] == "helpful"
+    assert (response["helpful_count"], response["not_helpful_count"]) == (1, 0)
+
+
+async def test_same_vote_toggles_off(admin):
+    set_existing_vote(admin, is_helpful=True, helpful_count=1, not_helpful_count=0)
+    
+    response = await reviews.vote_on_review(
+        REVIEW_ID, reviews.VoteRequest(vote_type="helpful"), USER, Mock()
+    )
+    
+    admin.votes.delete.assert_called_once()
+    assert response["action"] == "removed"
+    assert response["vote_type"] is None
+    assert response["helpful_count"] == 0
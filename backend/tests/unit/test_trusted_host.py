@@ -0,0 +1,60 @@
+"""Unit tests for the trusted host middleware."""
+import pytest
+
+from src.lib.trusted_host import FastTrustedHostMiddleware, parse_host
+
+
+@pytest.mark.parametrize("header, host", [
+    ("api.ratemyprof-india.com", "api.ratemyprof-india.com"),
+    ("API.RateMyProf-India.com:443", "api.ratemyprof-india.com"),
+    ("[::1]:8000", "[::1]"),
+    ("[::1]", "[::1]"),
+    (None, None),
+    ("", None),
+    ("example.com:", None),
+    ("example.com:http", None),
+    ("::1", None),
+    ("[::1", None),
+    ("[::1]x", None),
+])
+def test_parse_host(header, host):
+    assert parse_host(header) == host
+
+
+async def call(host):
+    """Send one request through the middleware and return its status code."""
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = FastTrustedHostMiddleware(
+        app, allowed_hosts=["api.ratemyprof-india.com", "*.railway.app"]
+    )
+    headers = [(b"host", host.encode())] if host is not None else []
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "scheme": "https",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": headers,
+        "server": ("testserver", 443),
+    }
+    await middleware(scope, None, send)
+    return messages[0]["status"]
+
+
+async def test_allowed_hosts_pass():
+    assert await call("api.ratemyprof-india.com:443") == 200
+    assert await call("backend.railway.app") == 200
+
+
+async def test_other_or_missing_hosts_are_rejected():
+    assert await call("evil.example.com") == 400
+    assert await call("railway.app.evil.com") == 400
+    assert await call(None) == 400
@@ -0,0 +1,22 @@
+-- Store each user's full name as a generated column
+-- full_name is computed by Postgres on every insert/update (including writes
+-- made through Supabase) and backfilled when the column is added, so
+-- serializing users no longer concatenates names per row, and lists can sort
+-- by it. Missing first or last names are skipped rather than nulling the
+-- whole name. Safe to run more than once.
+
+ALTER TABLE public.users
+    ADD COLUMN IF NOT EXISTS full_name VARCHAR(201)
+    GENERATED ALWAYS AS (
+        btrim(COALESCE(first_name, '') || ' ' || COALESCE(last_name, ''))
+    ) STORED;
+
+-- Verify
+SELECT
+    id,
+    first_name,
+    last_name,
+    full_name
+FROM public.users
+ORDER BY created_at DESC
+LIMIT 10;
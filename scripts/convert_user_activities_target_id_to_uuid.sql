@@ -0,0 +1,78 @@
+-- Store user_activities.target_id as UUID
+-- Every target (professor, review, college review) has a UUID primary key,
+-- but target_id was VARCHAR(100): a 37-byte string per row instead of a
+-- 16-byte UUID, compared as text. Any stored value that is not a UUID
+-- becomes NULL.
+--
+-- Also recreates increment_user_activity() so its TEXT parameter is cast to
+-- uuid. Run after convert_user_activities_ip_address_to_inet.sql.
+-- Safe to run more than once.
+
+BEGIN;
+
+-- ============================================================================
+-- 1. Convert the column
+-- ============================================================================
+
+CREATE FUNCTION pg_temp.try_uuid(value TEXT)
+RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN NULLIF(btrim(value), '')::uuid;
+EXCEPTION WHEN invalid_text_representation THEN
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'user_activities'
+          AND column_name = 'target_id'
+          AND udt_name <> 'uuid'
+    ) THEN
+        ALTER TABLE user_activities
+            ALTER COLUMN target_id TYPE UUID USING pg_temp.try_uuid(target_id);
+    END IF;
+END $$;
+
+-- ============================================================================
+-- 2. Cast the RPC's target parameter
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION increment_user_activity(
+    p_user_id UUID,
+    p_action_type TEXT,
+    p_action_date DATE DEFAULT CURRENT_DATE,
+    p_target_id TEXT DEFAULT NULL,
+    p_ip_address TEXT DEFAULT NULL
+)
+RETURNS INTEGER
+LANGUAGE sql
+SECURITY INVOKER -- RLS policies on user_activities still apply
+AS $$
+    INSERT INTO user_activities (
+        user_id, action_type, action_date, action_count,
+        last_action_at, target_id, ip_address, created_at, updated_at
+    )
+    VALUES (
+        p_user_id, p_action_type, p_action_date, 1,
+        NOW(), p_target_id::uuid, p_ip_address::inet, NOW(), NOW()
+    )
+    ON CONFLICT (user_id, action_type, action_date) DO UPDATE SET
+        action_count = user_activities.action_count + 1,
+        last_action_at = EXCLUDED.last_action_at,
+        target_id = COALESCE(EXCLUDED.target_id, user_activities.target_id),
+        ip_address = COALESCE(EXCLUDED.ip_address, user_activities.ip_address),
+        updated_at = EXCLUDED.updated_at
+    RETURNING action_count;
+$$;
+
+COMMIT;
+
+-- Verify
+SELECT column_name, udt_name
+FROM information_schema.columns
+WHERE table_name = 'user_activities' AND column_name = 'target_id';
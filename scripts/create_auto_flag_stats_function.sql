@@ -0,0 +1,30 @@
+-- Auto-flag counts per flag type, aggregated in Postgres
+-- get_auto_flag_stats() in the backend used to select every auto-generated
+-- flag row from both flag tables and count them in Python, transferring
+-- O(rows) to produce a handful of counts. This function returns one row per
+-- (table, flag_type) instead, called via supabase.rpc().
+-- Run after create_auto_flagging_tables.sql.
+
+CREATE OR REPLACE FUNCTION get_auto_flag_stats()
+RETURNS TABLE (source TEXT, flag_type TEXT, flag_count BIGINT)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER -- RLS policies still apply
+AS $$
+    SELECT 'review', COALESCE(f.flag_type::text, 'unknown'), COUNT(*)
+    FROM review_flags f
+    WHERE f.is_auto_generated
+    GROUP BY 2
+    UNION ALL
+    SELECT 'college_review', COALESCE(f.flag_type::text, 'unknown'), COUNT(*)
+    FROM college_review_flags f
+    WHERE f.is_auto_generated
+    GROUP BY 2;
+$$;
+
+GRANT EXECUTE ON FUNCTION get_auto_flag_stats() TO authenticated, service_role;
+
+COMMENT ON FUNCTION get_auto_flag_stats IS 'Counts auto-generated review and college review flags per flag type';
+
+-- Verify
+SELECT * FROM get_auto_flag_stats();
@@ -0,0 +1,58 @@
+-- Enforce daily rate limits inside Postgres
+-- A BEFORE INSERT/UPDATE trigger on user_activities rejects any write that
+-- would push action_count past the configured limit, so the atomic
+-- increment_user_activity() RPC doubles as the rate-limit check.
+-- Run after create_user_activities_table.sql and create_increment_user_activity_function.sql.
+
+CREATE TABLE IF NOT EXISTS daily_limits (
+    action_type VARCHAR(50) PRIMARY KEY,
+    daily_limit INTEGER NOT NULL CHECK (daily_limit >= 0)
+);
+
+-- Seed from DAILY_LIMITS in backend/src/lib/rate_limits.py
+INSERT INTO daily_limits (action_type, daily_limit) VALUES
+    ('professor_create', 3),
+    ('review_create', 10),
+    ('college_review_create', 5),
+    ('flag_create', 20)
+ON CONFLICT (action_type) DO UPDATE SET daily_limit = EXCLUDED.daily_limit;
+
+ALTER TABLE daily_limits ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Anyone can view daily limits" ON daily_limits;
+CREATE POLICY "Anyone can view daily limits" ON daily_limits
+    FOR SELECT USING (true);
+
+CREATE OR REPLACE FUNCTION enforce_daily_limit()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_limit INTEGER;
+BEGIN
+    SELECT daily_limit INTO v_limit
+    FROM daily_limits
+    WHERE action_type = NEW.action_type;
+
+    -- Action types without a configured limit are unrestricted
+    IF v_limit IS NOT NULL AND NEW.action_count > v_limit THEN
+        RAISE EXCEPTION 'Daily limit exceeded. You can only perform % % actions per day.',
+            v_limit, replace(NEW.action_type, '_', ' ')
+            USING ERRCODE = 'P0001',
+                  HINT = 'Please try again tomorrow.';
+    END IF;
+
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_user_activities_daily_limit ON user_activities;
+CREATE TRIGGER trg_user_activities_daily_limit
+    BEFORE INSERT OR UPDATE OF action_count ON user_activities
+    FOR EACH ROW
+    EXECUTE FUNCTION enforce_daily_limit();
+
+COMMENT ON TABLE daily_limits IS 'Per-action daily rate limits enforced by trg_user_activities_daily_limit';
+
+-- Verify
+SELECT action_type, daily_limit FROM daily_limits ORDER BY action_type;
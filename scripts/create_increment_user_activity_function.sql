@@ -0,0 +1,36 @@
+-- Atomic rate-limit counter for user_activities
+-- Replaces the SELECT-then-UPDATE/INSERT sequence in increment_action_count
+-- with a single INSERT ... ON CONFLICT DO UPDATE, called via supabase.rpc().
+-- Requires the idx_user_activities_unique index from create_user_activities_table.sql.
+
+CREATE OR REPLACE FUNCTION increment_user_activity(
+    p_user_id UUID,
+    p_action_type TEXT,
+    p_action_date DATE DEFAULT CURRENT_DATE,
+    p_target_id TEXT DEFAULT NULL,
+    p_ip_address TEXT DEFAULT NULL
+)
+RETURNS INTEGER
+LANGUAGE sql
+SECURITY INVOKER -- RLS policies on user_activities still apply
+AS $$
+    INSERT INTO user_activities (
+        user_id, action_type, action_date, action_count,
+        last_action_at, target_id, ip_address, created_at, updated_at
+    )
+    VALUES (
+        p_user_id, p_action_type, p_action_date, 1,
+        NOW(), p_target_id::uuid, p_ip_address::inet, NOW(), NOW()
+    )
+    ON CONFLICT (user_id, action_type, action_date) DO UPDATE SET
+        action_count = user_activities.action_count + 1,
+        last_action_at = EXCLUDED.last_action_at,
+        target_id = COALESCE(EXCLUDED.target_id, user_activities.target_id),
+        ip_address = COALESCE(EXCLUDED.ip_address, user_activities.ip_address),
+        updated_at = EXCLUDED.updated_at
+    RETURNING action_count;
+$$;
+
+GRANT EXECUTE ON FUNCTION increment_user_activity(UUID, TEXT, DATE, TEXT, TEXT) TO authenticated, service_role;
+
+COMMENT ON FUNCTION increment_user_activity IS 'Atomically increments the daily action count for a user and returns the new count';
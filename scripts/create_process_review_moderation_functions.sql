@@ -0,0 +1,106 @@
+-- Save a review's content analysis result in one call
+-- AutoFlaggingSystem used to make three sequential Supabase requests per
+-- review: insert the auto-flags, update the review's moderation status and
+-- insert the content analysis log. Each was its own HTTP round trip and its
+-- own transaction, so a failure part-way left a review flagged but approved.
+-- These functions perform all three writes in one call via supabase.rpc().
+-- The flags and the status change commit together; the analysis log stays
+-- best-effort as before, so a failed log insert is raised as a WARNING and
+-- does not roll them back.
+-- The status is written to the status enum column (review_status /
+-- college_review_status), which replaced the old moderation_status column.
+-- Run after create_auto_flagging_tables.sql and, in backend/scripts,
+-- convert_review_status_to_enum.sql and convert_college_review_status_to_enum.sql.
+
+-- ============================================================================
+-- 1. Professor reviews
+-- ============================================================================
+
+-- p_flags: [{"reporter_id", "flag_type", "description"}, ...]
+-- p_log: content_analysis_logs columns other than the review reference.
+-- Rows are built with jsonb_populate_record(set) against the table row type,
+-- so values are coerced to whatever type each column has (e.g. the
+-- review_flag_type enum).
+CREATE OR REPLACE FUNCTION process_review_moderation(
+    p_review_id UUID,
+    p_status TEXT,
+    p_flags JSONB DEFAULT '[]',
+    p_log JSONB DEFAULT '{}'
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY INVOKER -- RLS policies still apply
+AS $$
+BEGIN
+    INSERT INTO review_flags (review_id, reporter_id, flag_type, description, is_auto_generated)
+    SELECT p_review_id, f.reporter_id, f.flag_type, f.description, TRUE
+    FROM jsonb_populate_recordset(NULL::review_flags, p_flags) AS f;
+
+    UPDATE reviews
+    SET status = p_status::review_status,
+        updated_at = NOW()
+    WHERE id = p_review_id;
+
+    -- Own subtransaction: a log failure must not undo the flags and status
+    BEGIN
+        INSERT INTO content_analysis_logs (
+            review_id, profanity_score, spam_score, quality_score,
+            sentiment_score, auto_flagged, flag_reasons
+        )
+        SELECT
+            p_review_id, l.profanity_score, l.spam_score, l.quality_score,
+            l.sentiment_score, l.auto_flagged, l.flag_reasons
+        FROM jsonb_populate_record(NULL::content_analysis_logs, p_log) AS l;
+    EXCEPTION WHEN OTHERS THEN
+        RAISE WARNING 'Could not log content analysis for review %: %', p_review_id, SQLERRM;
+    END;
+END;
+$$;
+
+-- ============================================================================
+-- 2. College reviews
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION process_college_review_moderation(
+    p_review_id UUID,
+    p_status TEXT,
+    p_flags JSONB DEFAULT '[]',
+    p_log JSONB DEFAULT '{}'
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY INVOKER -- RLS policies still apply
+AS $$
+BEGIN
+    -- college_review_flags keeps the flag description in its reason column
+    INSERT INTO college_review_flags (college_review_id, reporter_id, flag_type, reason, is_auto_generated)
+    SELECT p_review_id, f.reporter_id, f.flag_type, e->>'description', TRUE
+    FROM jsonb_array_elements(p_flags) AS e,
+         jsonb_populate_record(NULL::college_review_flags, e) AS f;
+
+    UPDATE college_reviews
+    SET status = p_status::college_review_status,
+        updated_at = NOW()
+    WHERE id = p_review_id;
+
+    -- Own subtransaction: a log failure must not undo the flags and status
+    BEGIN
+        INSERT INTO college_content_analysis_logs (
+            college_review_id, profanity_score, spam_score, quality_score,
+            sentiment_score, auto_flagged, flag_reasons
+        )
+        SELECT
+            p_review_id, l.profanity_score, l.spam_score, l.quality_score,
+            l.sentiment_score, l.auto_flagged, l.flag_reasons
+        FROM jsonb_populate_record(NULL::college_content_analysis_logs, p_log) AS l;
+    EXCEPTION WHEN OTHERS THEN
+        RAISE WARNING 'Could not log content analysis for review %: %', p_review_id, SQLERRM;
+    END;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION process_review_moderation(UUID, TEXT, JSONB, JSONB) TO authenticated, service_role;
+GRANT EXECUTE ON FUNCTION process_college_review_moderation(UUID, TEXT, JSONB, JSONB) TO authenticated, service_role;
+
+COMMENT ON FUNCTION process_review_moderation IS 'Saves auto-flags, moderation status and content analysis log for a review in one call';
+COMMENT ON FUNCTION process_college_review_moderation IS 'Saves auto-flags, moderation status and content analysis log for a college review in one call';
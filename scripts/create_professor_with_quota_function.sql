@@ -0,0 +1,52 @@
+-- Create a professor and count it against the daily limit in one transaction
+-- create_professor used to insert the professor and then call
+-- increment_user_activity() as a second request, deleting the professor again
+-- when the daily limit trigger rejected the increment. The over-quota row was
+-- visible in between, and a failed delete left it behind. This function does
+-- both writes in one transaction, so an over-quota create never commits.
+-- Run after create_increment_user_activity_function.sql and
+-- create_daily_limits_trigger.sql.
+
+-- p_professor: professors columns supplied by the API (name, email, department,
+-- designation, college_id, subjects, biography, years_of_experience, education,
+-- research_interests). Built with jsonb_populate_record against the table row
+-- type, so values are coerced to each column's type (e.g. subjects TEXT[]).
+CREATE OR REPLACE FUNCTION create_professor_with_quota(
+    p_user_id UUID,
+    p_professor JSONB,
+    p_action_date DATE DEFAULT CURRENT_DATE,
+    p_ip_address TEXT DEFAULT NULL
+)
+RETURNS SETOF professors
+LANGUAGE plpgsql
+SECURITY INVOKER -- RLS policies on professors and user_activities still apply
+AS $$
+DECLARE
+    v_professor professors;
+BEGIN
+    -- Unverified by default - requires admin approval before appearing in search
+    INSERT INTO professors (
+        name, email, department, designation, college_id, subjects, biography,
+        years_of_experience, education, research_interests,
+        average_rating, total_reviews, is_verified
+    )
+    SELECT
+        p.name, p.email, p.department, p.designation, p.college_id, p.subjects, p.biography,
+        p.years_of_experience, p.education, p.research_interests,
+        0.0, 0, FALSE
+    FROM jsonb_populate_record(NULL::professors, p_professor) AS p
+    RETURNING * INTO v_professor;
+
+    -- Raises P0001 from the daily limit trigger once the limit is exceeded,
+    -- rolling back the insert above
+    PERFORM increment_user_activity(
+        p_user_id, 'professor_create', p_action_date, v_professor.id::text, p_ip_address
+    );
+
+    RETURN NEXT v_professor;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION create_professor_with_quota(UUID, JSONB, DATE, TEXT) TO authenticated, service_role;
+
+COMMENT ON FUNCTION create_professor_with_quota IS 'Inserts a professor and increments the creator''s professor_create count in one transaction';
@@ -8,8 +8,8 @@ CREATE TABLE IF NOT EXISTS user_activities (
     action_date DATE NOT NULL,
     action_count INTEGER NOT NULL DEFAULT 1,
     last_action_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-    target_id VARCHAR(100), -- ID of created professor, review, etc.
-    ip_address VARCHAR(45), -- IPv4/IPv6 address
+    target_id UUID, -- ID of created professor, review, etc.
+    ip_address INET, -- IPv4/IPv6 address
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
@@ -0,0 +1,22 @@
+-- Drop user_activities indexes covered by idx_user_activities_unique
+-- Every rate-limit read and write looks up one (user_id, action_type,
+-- action_date) row, which the unique index answers with a single descent.
+-- idx_user_activities_user_action_date duplicates it exactly, and the
+-- single-column indexes only add write cost to every counter insert:
+-- user_id lookups (account deletion, per-user counts) use the unique index's
+-- leading column, and nothing filters on action_type or action_date alone.
+-- Run after create_user_activities_table.sql. All statements are idempotent.
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_user_activities_unique
+    ON user_activities(user_id, action_type, action_date);
+
+DROP INDEX IF EXISTS idx_user_activities_user_action_date;
+DROP INDEX IF EXISTS idx_user_activities_user_id;
+DROP INDEX IF EXISTS idx_user_activities_action_type;
+DROP INDEX IF EXISTS idx_user_activities_action_date;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'user_activities'
+ORDER BY indexname;